@@ -177,18 +177,23 @@ def configure_logging(settings) -> StructuredLoggerFactory:
     return StructuredLoggerFactory(json_output=settings.log_json_output)
 
 
+def _format_email_content(email: dict) -> str:
+    """Render a parsed email dict into the text layout the extractor expects."""
+    return (
+        f"Subject: {email.get('subject', '')}\n\n"
+        f"From: {email.get('sender', '')}\n\n"
+        f"Date: {email.get('date', '')}\n\n"
+        f"Body: {email.get('body', '')}"
+    )
+
+
 def _process_single_email(
     email: dict,
     idx: int,
     extractor: EmailPurchaseExtractor,
 ) -> tuple[dict, int, dict]:
     """Helper for parallel processing of a single email."""
-    email_content = (
-        f"Subject: {email.get('subject', '')}\n\n"
-        f"From: {email.get('sender', '')}\n\n"
-        f"Date: {email.get('date', '')}\n\n"
-        f"Body: {email.get('body', '')}"
-    )
+    email_content = _format_email_content(email)
     result = extractor.process_email(email_content)
     return email, idx, result
 
@@ -201,6 +206,7 @@ def _init_worker(settings: HarvesterSettings) -> None:
     """Initialize a worker process with a shared extractor instance."""
     global _worker_extractor
     from digital_asset_harvester import EmailPurchaseExtractor, get_llm_client
+    from digital_asset_harvester.llm import get_slm_client
     from digital_asset_harvester.telemetry import StructuredLoggerFactory
 
     logger_factory = StructuredLoggerFactory(json_output=settings.log_json_output)
@@ -209,6 +215,7 @@ def _init_worker(settings: HarvesterSettings) -> None:
     _worker_extractor = EmailPurchaseExtractor(
         settings=settings,
         llm_client=llm_client,
+        slm_client=get_slm_client(settings=settings, enable_cache_auto_save=False),
         logger_factory=logger_factory,
     )
 
@@ -252,12 +259,7 @@ def _process_email_worker(
         email_dict = task_data
 
     # Use the same logic as _process_single_email
-    email_content = (
-        f"Subject: {email_dict.get('subject', '')}\n\n"
-        f"From: {email_dict.get('sender', '')}\n\n"
-        f"Date: {email_dict.get('date', '')}\n\n"
-        f"Body: {email_dict.get('body', '')}"
-    )
+    email_content = _format_email_content(email_dict)
     result = extractor.process_email(email_content)
     return email_dict, idx, result
 
@@ -355,8 +357,21 @@ def process_emails(
             if any("filtered out by preprocessing" in note for note in result.get("processing_notes", [])):
                 metrics.increment("emails_skipped_preprocessing")
 
+    enable_batching = getattr(settings, "enable_llm_batching", False) is True
+
     if not is_parallel:
         _safe_log("Processing emails sequentially (streaming mode)...")
+        batch_size = max(1, int(getattr(settings, "batch_size", 10))) if enable_batching else 1
+        pending: list[tuple[int, dict]] = []
+
+        def flush_pending() -> None:
+            contents = [_format_email_content(email) for _, email in pending]
+            for (idx, email), result in zip(pending, extractor.process_emails(contents)):
+                handle_result(email, idx, result)
+                if progress_callback:
+                    progress_callback(idx, total_to_load or idx)
+            pending.clear()
+
         iterator = tqdm(
             emails,
             total=total_to_load,
@@ -366,21 +381,35 @@ def process_emails(
             ncols=100,
         )
 
-        for idx, email in enumerate(iterator, 1):
-            if show_progress:
-                subject_preview = email.get("subject", "")[:40] if isinstance(email, dict) else "Raw"
-                iterator.set_postfix_str(f"Current: {subject_preview}...")
+        try:
+            for idx, email in enumerate(iterator, 1):
+                if show_progress:
+                    subject_preview = email.get("subject", "")[:40] if isinstance(email, dict) else "Raw"
+                    iterator.set_postfix_str(f"Current: {subject_preview}...")
 
-            if duplicate_detector.is_email_duplicate(email, auto_save=False):
-                metrics.increment("email_duplicates_skipped")
-                continue
+                if duplicate_detector.is_email_duplicate(email, auto_save=False):
+                    metrics.increment("email_duplicates_skipped")
+                    continue
+
+                metrics.increment("emails_processed")
+                if enable_batching:
+                    # Buffer emails so their LLM prompts can be submitted together
+                    pending.append((idx, email))
+                    if len(pending) >= batch_size:
+                        flush_pending()
+                    continue
 
-            metrics.increment("emails_processed")
-            _, _, result = _process_single_email(email, idx, extractor)
-            handle_result(email, idx, result)
+                _, _, result = _process_single_email(email, idx, extractor)
+                handle_result(email, idx, result)
 
-            if progress_callback:
-                progress_callback(idx, total_to_load or idx)
+                if progress_callback:
+                    progress_callback(idx, total_to_load or idx)
+
+            if pending:
+                flush_pending()
+        finally:
+            # process_emails keeps its preprocessing pool alive across batches
+            extractor.close()
 
     else:
         # Parallel mode - still listify but filter in one pass
@@ -403,21 +432,24 @@ def process_emails(
             ncols=100,
         )
 
-        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+        from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
         max_workers = int(getattr(settings, "max_workers", 5))
 
         if enable_multiprocessing:
             _safe_log(f"Starting multiprocessing with {max_workers} workers")
-            executor_class = ProcessPoolExecutor
+            # Each process builds its own extractor; threads share the caller's
+            executor: Executor = ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_worker, initargs=(settings,)
+            )
             # In multiprocessing, we pass the worker function and settings
             submit_fn = lambda exc, email, idx: exc.submit(_process_email_worker, email, idx, settings)
         else:
             _safe_log(f"Starting parallel processing with {max_workers} workers")
-            executor_class = ThreadPoolExecutor
+            executor = ThreadPoolExecutor(max_workers=max_workers)
             submit_fn = lambda exc, email, idx: exc.submit(_process_single_email, email, idx, extractor)
 
-        with executor_class(max_workers=max_workers, initializer=_init_worker, initargs=(settings,)) as executor:
+        with executor:
             futures = {submit_fn(executor, email, idx): (email, idx) for idx, email in enumerate(email_list, 1)}
 
             processed_count = 0
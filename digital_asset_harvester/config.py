@@ -32,6 +32,8 @@ class HarvesterSettings:
     enable_ollama_fallback: bool = False
     ollama_fallback_threshold_seconds: int = 10
     fallback_cloud_provider: str = "openai"
+    slm_model_name: str = ""
+    slm_confident_threshold: float = 0.85
 
     openai_api_key: str = ""
     openai_model_name: str = "gpt-4-turbo-preview"
@@ -41,10 +43,14 @@ class HarvesterSettings:
 
     enable_llm_cache: bool = True
     llm_cache_file: str = ".llm_cache.json"
+    metadata_cache_size: int = 1024
 
     enable_preprocessing: bool = True
     enable_pii_scrubbing: bool = False
     enable_regex_extractors: bool = True
+    use_hyperscan: bool = False
+    enable_combined_llm_call: bool = False
+    enable_speculative_extraction: bool = False
     enable_validation: bool = True
     min_confidence_threshold: float = 0.6
 
@@ -53,6 +59,10 @@ class HarvesterSettings:
     log_json_output: bool = False
 
     batch_size: int = 10
+    enable_llm_batching: bool = False
+    classification_batch_size: int = 0
+    extraction_batch_size: int = 0
+    preprocessing_workers: int = 0
     enable_parallel_processing: bool = False
     enable_multiprocessing: bool = False
     max_workers: int = 5
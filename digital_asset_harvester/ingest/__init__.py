@@ -1,8 +1,26 @@
 """Email ingestion utilities."""
 
-from .gmail_client import GmailClient
+from typing import TYPE_CHECKING, Any
+
 from .imap_client import ImapClient
 from .mbox_reader import MboxDataExtractor
-from .outlook_client import OutlookClient
+
+if TYPE_CHECKING:
+    from .gmail_client import GmailClient
+    from .outlook_client import OutlookClient
 
 __all__ = ["MboxDataExtractor", "ImapClient", "GmailClient", "OutlookClient"]
+
+# The API clients pull in googleapiclient/httpx, which dominate import time, so
+# they are only loaded on first access.
+_LAZY_CLIENTS = {"GmailClient": ".gmail_client", "OutlookClient": ".outlook_client"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_CLIENTS:
+        from importlib import import_module
+
+        client = getattr(import_module(_LAZY_CLIENTS[name], __name__), name)
+        globals()[name] = client
+        return client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,8 @@
 import email
+import email.message
 import re
 from email.header import decode_header, make_header
+from functools import lru_cache
 from typing import Any, Dict
 
 
@@ -8,12 +10,31 @@ def decode_header_value(value: str) -> str:
     """Safely decodes email header values."""
     if not value:
         return ""
+    if isinstance(value, str):
+        return _decode_header_str(value)
+    # Header objects are not hashable, so they bypass the cache
+    return _decode_header(value)
+
+
+@lru_cache(maxsize=4096)
+def _decode_header_str(value: str) -> str:
+    """Memoized decode for plain string headers, which repeat across a mailbox (e.g. From:)."""
+    return _decode_header(value)
+
+
+def _decode_header(value: Any) -> str:
     try:
         return str(make_header(decode_header(value)))
     except (ValueError, TypeError, HeaderParseError):
         return str(value)
 
 
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)[^>]*>.*?</\1>", re.DOTALL | re.IGNORECASE)
+_BLOCK_TAG_RE = re.compile(r"<(p|br|div|tr|h1|h2|h3|h4|h5|h6)[^>]*>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
+
 class HeaderParseError(Exception):
     """Exception raised for errors during header parsing."""
 
@@ -23,11 +44,11 @@ class HeaderParseError(Exception):
 def strip_html_tags(html: str) -> str:
     """Basic HTML tag stripping using regex."""
     # Remove script and style elements
-    html = re.sub(r"<(script|style)[^>]*>.*?</\1>", "", html, flags=re.DOTALL | re.IGNORECASE)
+    html = _SCRIPT_STYLE_RE.sub("", html)
     # Replace common block elements with newlines to preserve some structure
-    html = re.sub(r"<(p|br|div|tr|h1|h2|h3|h4|h5|h6)[^>]*>", "\n", html, flags=re.IGNORECASE)
+    html = _BLOCK_TAG_RE.sub("\n", html)
     # Remove all remaining tags
-    text = re.sub(r"<[^>]+>", "", html)
+    text = _TAG_RE.sub("", html)
     # Unescape common entities
     text = (
         text.replace("&nbsp;", " ")
@@ -37,7 +58,7 @@ def strip_html_tags(html: str) -> str:
         .replace("&quot;", '"')
     )
     # Cleanup whitespace
-    text = re.sub(r"\n\s*\n", "\n\n", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
@@ -91,3 +91,19 @@ def get_llm_client(
         return CachingLLMClient(client, cache)
 
     return client
+
+
+def get_slm_client(
+    settings: HarvesterSettings | None = None, enable_cache_auto_save: bool = True
+) -> LLMProvider | None:
+    """Get the local small-model client used to pre-screen classifications.
+
+    Returns ``None`` unless ``slm_model_name`` is configured. The small model
+    always runs on local Ollama; callers pass ``model=settings.slm_model_name``
+    so its responses are cached separately from the main model's.
+    """
+    settings = settings or get_settings()
+    model_name = getattr(settings, "slm_model_name", "")
+    if not isinstance(model_name, str) or not model_name:
+        return None
+    return get_llm_client(provider="ollama", settings=settings, enable_cache_auto_save=enable_cache_auto_save)
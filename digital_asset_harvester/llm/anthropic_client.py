@@ -20,7 +20,7 @@ except ImportError:
 from digital_asset_harvester.config import HarvesterSettings, get_settings
 
 from .ollama_client import LLMError, LLMResponseFormatError
-from .provider import LLMProvider, LLMResult
+from .provider import LLMProvider, LLMResult, loads_json
 
 logger = logging.getLogger(__name__)
 
@@ -85,7 +85,7 @@ class AnthropicLLMClient(LLMProvider):
                     start_index = raw_text.index("{")
                     end_index = raw_text.rindex("}") + 1
                     json_text = raw_text[start_index:end_index]
-                    payload = json.loads(json_text)
+                    payload = loads_json(json_text)
                 except (ValueError, json.JSONDecodeError) as exc:
                     raise LLMResponseFormatError(f"Could not extract JSON from response: {raw_text}") from exc
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import List, Optional, Sequence, Union, cast
 
 from .cache import LLMCache
 from .provider import LLMProvider, LLMResult
@@ -18,6 +18,30 @@ class CachingLLMClient(LLMProvider):
         self.inner = inner
         self.cache = cache
 
+    def _from_cache(self, prompt: str, model: Optional[str], temperature: Optional[float]) -> Optional[LLMResult]:
+        cached_data = self.cache.get(prompt, model=model, temperature=temperature)
+        if not cached_data:
+            return None
+        return LLMResult(
+            data=cached_data["data"],
+            raw_text=cached_data.get("raw_text", ""),
+            metadata={"cached": True},
+        )
+
+    def _store(self, prompt: str, result: LLMResult, model: Optional[str], temperature: Optional[float]) -> LLMResult:
+        self.cache.set(
+            prompt,
+            {"data": result.data, "raw_text": result.raw_text},
+            model=model,
+            temperature=temperature,
+        )
+
+        # Add metadata indicating it was a fresh call
+        if result.metadata is None:
+            result.metadata = {}
+        result.metadata["cached"] = False
+        return result
+
     def generate_json(
         self,
         prompt: str,
@@ -27,29 +51,43 @@ class CachingLLMClient(LLMProvider):
         temperature: Optional[float] = None,
     ) -> LLMResult:
         # Check cache first
-        cached_data = self.cache.get(prompt, model=model, temperature=temperature)
-        if cached_data:
+        cached = self._from_cache(prompt, model, temperature)
+        if cached is not None:
             logger.info("Retrieved LLM result from cache")
-            return LLMResult(
-                data=cached_data["data"],
-                raw_text=cached_data.get("raw_text", ""),
-                metadata={"cached": True},
-            )
+            return cached
 
         # Call inner provider
         result = self.inner.generate_json(prompt, model=model, retries=retries, temperature=temperature)
+        return self._store(prompt, result, model, temperature)
 
-        # Cache the result
-        self.cache.set(
-            prompt,
-            {"data": result.data, "raw_text": result.raw_text},
-            model=model,
-            temperature=temperature,
-        )
+    def generate_json_batch(
+        self,
+        prompts: Sequence[str],
+        *,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        retries: Optional[int] = None,
+        max_concurrency: int = 4,
+    ) -> List[Union[LLMResult, Exception]]:
+        results: List[Union[LLMResult, Exception, None]] = [
+            self._from_cache(prompt, model, temperature) for prompt in prompts
+        ]
+        misses = [idx for idx, result in enumerate(results) if result is None]
+        if len(misses) < len(prompts):
+            logger.info("Retrieved %d of %d LLM results from cache", len(prompts) - len(misses), len(prompts))
 
-        # Add metadata indicating it was a fresh call
-        if result.metadata is None:
-            result.metadata = {}
-        result.metadata["cached"] = False
+        if misses:
+            fresh = self.inner.generate_json_batch(
+                [prompts[idx] for idx in misses],
+                model=model,
+                temperature=temperature,
+                retries=retries,
+                max_concurrency=max_concurrency,
+            )
+            for idx, result in zip(misses, fresh):
+                if isinstance(result, LLMResult):
+                    result = self._store(prompts[idx], result, model, temperature)
+                results[idx] = result
 
-        return result
+        # Every slot is filled by now: either a cache hit or the inner provider's outcome
+        return cast(List[Union[LLMResult, Exception]], results)
@@ -8,14 +8,28 @@ import random
 import time
 from typing import Any, Dict, Optional
 
+import httpx
 from ollama import Client
 
 from digital_asset_harvester.config import HarvesterSettings, get_settings
 
-from .provider import LLMProvider, LLMResult
+from .provider import LLMProvider, LLMResult, loads_json
 
 logger = logging.getLogger(__name__)
 
+# httpx's default connection pool bounds
+_DEFAULT_MAX_CONNECTIONS = 100
+_DEFAULT_MAX_KEEPALIVE = 20
+
+
+def _connection_limits(settings: HarvesterSettings) -> httpx.Limits:
+    """Size the keep-alive pool so ``max_workers`` concurrent calls all reuse open connections."""
+    workers = settings.max_workers if isinstance(settings.max_workers, int) else 0
+    return httpx.Limits(
+        max_connections=max(_DEFAULT_MAX_CONNECTIONS, workers),
+        max_keepalive_connections=max(_DEFAULT_MAX_KEEPALIVE, workers),
+    )
+
 
 class LLMError(RuntimeError):
     """Base exception for LLM-related failures."""
@@ -37,9 +51,11 @@ class OllamaLLMClient(LLMProvider):
     ) -> None:
         self.settings = settings or get_settings()
         timeout = float(self.settings.llm_timeout_seconds)
+        # One pooled HTTP client serves every call, so requests reuse kept-alive connections
         self._client = client or Client(
             host=self.settings.ollama_base_url,
             timeout=timeout,
+            limits=_connection_limits(self.settings),
         )
         self.default_retries = default_retries or self.settings.llm_max_retries
 
@@ -79,7 +95,7 @@ class OllamaLLMClient(LLMProvider):
                     # Some versions of the Ollama client return dicts
                     raw_text = response["response"] if isinstance(response, dict) else str(response)
 
-                payload = json.loads(raw_text)
+                payload = loads_json(raw_text)
                 if not isinstance(payload, dict):
                     raise LLMResponseFormatError(f"Expected JSON object from LLM, received {type(payload).__name__}")
                 return LLMResult(data=payload, raw_text=raw_text)
@@ -20,7 +20,7 @@ except ImportError:
 from digital_asset_harvester.config import HarvesterSettings, get_settings
 
 from .ollama_client import LLMError, LLMResponseFormatError
-from .provider import LLMProvider, LLMResult
+from .provider import LLMProvider, LLMResult, loads_json
 
 logger = logging.getLogger(__name__)
 
@@ -80,7 +80,7 @@ class OpenAILLMClient(LLMProvider):
                 if not raw_text:
                     raise LLMResponseFormatError("Empty response from LLM")
 
-                payload = json.loads(raw_text)
+                payload = loads_json(raw_text)
                 if not isinstance(payload, dict):
                     raise LLMResponseFormatError(f"Expected JSON object from LLM, received {type(payload).__name__}")
                 return LLMResult(data=payload, raw_text=raw_text)
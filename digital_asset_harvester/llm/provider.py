@@ -2,9 +2,40 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import re
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+
+
+# orjson turns integers wider than 64 bits into floats instead of failing
+_WIDE_INTEGER = re.compile(r"\d{20}")
+
+
+def loads_json(text: Any) -> Any:
+    """Parse an LLM's JSON text, with ``orjson`` when it is installed.
+
+    Text ``orjson`` rejects (such as ``NaN`` literals) or would parse
+    differently (integers beyond 64 bits) goes to the stdlib, so results and
+    exceptions are exactly those of :func:`json.loads`.
+    """
+    if ORJSON_AVAILABLE and isinstance(text, str) and not _WIDE_INTEGER.search(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
 
 
 @dataclass
@@ -30,3 +61,49 @@ class LLMProvider(ABC):
     ) -> LLMResult:
         """Execute a prompt expecting JSON output."""
         raise NotImplementedError
+
+    async def agenerate_json(
+        self,
+        prompt: str,
+        *,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        retries: Optional[int] = None,
+    ) -> LLMResult:
+        """Awaitable :meth:`generate_json`, run in a worker thread so the event loop stays free.
+
+        Going through the synchronous call keeps caching and cloud fallback,
+        which are implemented as wrappers around it, in effect.
+        """
+        return await asyncio.to_thread(
+            self.generate_json, prompt, model=model, temperature=temperature, retries=retries
+        )
+
+    def generate_json_batch(
+        self,
+        prompts: Sequence[str],
+        *,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        retries: Optional[int] = None,
+        max_concurrency: int = 4,
+    ) -> List[Union[LLMResult, Exception]]:
+        """Execute several prompts, keeping up to ``max_concurrency`` requests in flight.
+
+        Model servers such as Ollama (with ``OLLAMA_NUM_PARALLEL``) batch concurrent
+        requests, so submitting prompts together is much faster than a serial loop.
+        Results are returned in prompt order; a prompt that failed yields the raised
+        exception in its slot instead of aborting the whole batch.
+        """
+
+        def _run(prompt: str) -> Union[LLMResult, Exception]:
+            try:
+                return self.generate_json(prompt, model=model, temperature=temperature, retries=retries)
+            except Exception as exc:
+                return exc
+
+        if len(prompts) <= 1 or max_concurrency <= 1:
+            return [_run(prompt) for prompt in prompts]
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(prompts))) as executor:
+            return list(executor.map(_run, prompts))
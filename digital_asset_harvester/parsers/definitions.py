@@ -15,12 +15,18 @@ COINBASE_TEMPLATE = ExtractionTemplate(
     global_patterns=[
         # You successfully purchased 0.001 BTC for $100.00 USD.
         TransactionPattern(
-            regex=r"(?:purchased|bought|buy)\s+(?P<amount>[\d,.]+)\s+(?P<item_name>[A-Z0-9]{2,10})\s+for\s+(?P<currency_symbol>[$€£¥])?(?P<total_spent>[\d,.]+)\s*(?P<currency>[A-Z]{3,5})?",
+            regex=(
+                r"(?:purchased|bought|buy)\s+(?P<amount>[\d,.]+)\s+(?P<item_name>[A-Z0-9]{2,10})\s+for\s+"
+                r"(?P<currency_symbol>[$€£¥])?(?P<total_spent>[\d,.]+)\s*(?P<currency>[A-Z]{3,5})?"
+            ),
             transaction_type="buy"
         ),
         # purchased $100 of BTC
         TransactionPattern(
-            regex=r"purchased\s+(?P<currency_symbol>[$€£¥])?(?P<total_spent>[\d,.]+)\s+of\s+(?P<item_name>[A-Z0-9]{2,10})",
+            regex=(
+                r"purchased\s+(?P<currency_symbol>[$€£¥])?(?P<total_spent>[\d,.]+)\s+of\s+"
+                r"(?P<item_name>[A-Z0-9]{2,10})"
+            ),
             transaction_type="buy"
         ),
         # You just earned 0.00001234 ETH in staking rewards!
@@ -30,7 +36,10 @@ COINBASE_TEMPLATE = ExtractionTemplate(
         ),
         # Fee info (global)
         TransactionPattern(
-            regex=r"(?:fee of|Coinbase Fee)\s*(?P<currency_symbol>[$€£¥])?(?P<fee_amount>[\d,.]+)\s*(?P<fee_currency>[A-Z]{3,5})?",
+            regex=(
+                r"(?:fee of|Coinbase Fee)\s*(?P<currency_symbol>[$€£¥])?"
+                r"(?P<fee_amount>[\d,.]+)\s*(?P<fee_currency>[A-Z]{3,5})?"
+            ),
         )
     ]
 )
@@ -50,7 +59,10 @@ BINANCE_TEMPLATE = ExtractionTemplate(
     global_patterns=[
         # Your order to buy 0.1 ETH for 200.00 USD has been filled.
         TransactionPattern(
-            regex=r"buy\s+(?P<amount>[\d,.]+)\s+(?P<item_name>[A-Z0-9]{2,10})\s+for\s+(?P<total_spent>[\d,.]+)\s+(?P<currency>[A-Z0-9]{3,5})",
+            regex=(
+                r"buy\s+(?P<amount>[\d,.]+)\s+(?P<item_name>[A-Z0-9]{2,10})\s+for\s+"
+                r"(?P<total_spent>[\d,.]+)\s+(?P<currency>[A-Z0-9]{3,5})"
+            ),
             transaction_type="buy"
         ),
         # Your account has been credited with 0.5 SOL for SOL Staking.
@@ -98,22 +110,20 @@ KRAKEN_TEMPLATE = ExtractionTemplate(
     global_patterns=[
         # You bought 0.75 XBT (BTC) for $35,000.00 USD.
         TransactionPattern(
-            regex=r"(?:bought|buy)\s+(?P<amount>[\d,.]+)\s+(?P<item_name>[A-Z0-9]{2,10})(?:\s+\([A-Z0-9]+\))?\s+for\s+(?P<currency_symbol>[$€£¥])?(?P<total_spent>[\d,.]+)\s*(?P<currency>[A-Z]{3,5})?",
+            regex=(
+                r"(?:bought|buy)\s+(?P<amount>[\d,.]+)\s+(?P<item_name>[A-Z0-9]{2,10})(?:\s+\([A-Z0-9]+\))?\s+for\s+"
+                r"(?P<currency_symbol>[$€£¥])?(?P<total_spent>[\d,.]+)\s*(?P<currency>[A-Z]{3,5})?"
+            ),
             transaction_type="buy"
         ),
-        # credited your account with 10.5 ADA
-        TransactionPattern(
-            regex=r"credited your account with\s+(?P<amount>[\d,.]+)\s+(?P<item_name>[A-Z0-9]{2,10})",
-            transaction_type="staking_reward"
-        ),
-        # staking reward of 0.05 DOT
-        TransactionPattern(
-            regex=r"staking reward of\s+(?P<amount>[\d,.]+)\s+(?P<item_name>[A-Z0-9]{2,10})",
-            transaction_type="staking_reward"
-        ),
-        # * 0.00123 ETH
+        # credited your account with 10.5 ADA / staking reward of 0.05 DOT / * 0.00123 ETH
+        # One alternation scans the body once; a bulleted amount must end its token,
+        # so the unnamed bullet group switches on the trailing (?:\s|$) check.
         TransactionPattern(
-            regex=r"[*•-]\s+(?P<amount>[\d,.]+)\s+(?P<item_name>[A-Z0-9]{2,10})(?:\s|$)",
+            regex=(
+                r"(?:credited your account with|staking reward of|([*•-]))\s+"
+                r"(?P<amount>[\d,.]+)\s+(?P<item_name>[A-Z0-9]{2,10})(?(1)(?:\s|$))"
+            ),
             transaction_type="staking_reward"
         ),
         # Fee: $105.00 USD
@@ -2,24 +2,55 @@
 
 import re
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 from .models import ExtractionTemplate, TransactionPattern, SectionConfig
 
 logger = logging.getLogger(__name__)
 
+# Improved regex to handle both "Order #123" (no colon) and "Transaction ID: 123"
+_TRANSACTION_ID_RE = re.compile(
+    r"(?:Transaction ID|Reference|ID|Reference Number|Order Reference):\s*([A-Z0-9#\-]+)", re.IGNORECASE
+)
+_ORDER_NUMBER_RE = re.compile(r"Order\s*#\s*([A-Z0-9#\-]+)", re.IGNORECASE)
+
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _is_literal(pattern: str) -> bool:
+    """Check whether a pattern is a plain string that a substring test can replace."""
+    return not _REGEX_METACHARACTERS.intersection(pattern)
+
 class TemplateEngine:
     """Engine for extracting data using templates."""
 
     def __init__(self, template: ExtractionTemplate):
         self.template = template
         self.sender_regexes = [re.compile(p, re.IGNORECASE) for p in template.sender_patterns]
-        self.subject_regexes = [re.compile(p, re.IGNORECASE) for p in template.subject_patterns]
+        # Plain subject phrases are matched with substring tests on the lower-cased subject
+        self.subject_keywords = tuple(p.lower() for p in template.subject_patterns if _is_literal(p))
+        self.subject_regexes = [
+            re.compile(p, re.IGNORECASE) for p in template.subject_patterns if not _is_literal(p)
+        ]
+
+        # Compile every transaction pattern once instead of on each email
+        patterns = list(template.global_patterns)
+        self.section_regex = None
+        if template.sections:
+            patterns.extend(template.sections.transaction_patterns)
+            self.section_regex = re.compile(template.sections.split_by)
+        self.pattern_regexes = {p.regex: re.compile(p.regex, re.IGNORECASE | re.MULTILINE) for p in patterns}
 
     def can_handle(self, subject: str, sender: str) -> bool:
         """Check if this template can handle the email."""
-        sender_match = any(r.search(sender) for r in self.sender_regexes)
-        subject_match = any(r.search(subject) for r in self.subject_regexes)
-        return sender_match and (not self.template.subject_patterns or subject_match)
+        # The sender decides for most emails, so the subject is only examined afterwards
+        if not any(r.search(sender) for r in self.sender_regexes):
+            return False
+        if not self.template.subject_patterns:
+            return True
+        subject_lower = subject.lower()
+        return any(k in subject_lower for k in self.subject_keywords) or any(
+            r.search(subject) for r in self.subject_regexes
+        )
 
     def extract(self, subject: str, body: str) -> List[Dict[str, Any]]:
         """Extract all transactions from the email."""
@@ -48,9 +79,9 @@ class TemplateEngine:
             supplemental_data = {}
             for pattern in self.template.global_patterns:
                 if not pattern.transaction_type:
-                    matches = self._apply_pattern(pattern, body)
-                    if matches:
-                        supplemental_data.update(matches[0])
+                    match_data = self._first_match(pattern, body)
+                    if match_data:
+                        supplemental_data.update(match_data)
 
             if supplemental_data:
                 for data in results:
@@ -64,28 +95,49 @@ class TemplateEngine:
     def _apply_pattern(self, pattern: TransactionPattern, text: str) -> List[Dict[str, Any]]:
         """Apply a single TransactionPattern to text and return extracted data."""
         matches = []
-        regex = re.compile(pattern.regex, re.IGNORECASE | re.MULTILINE)
+        for match in self._regex_for(pattern).finditer(text):
+            data = self._match_data(pattern, match)
+            if data:
+                matches.append(data)
 
-        for match in regex.finditer(text):
-            data = pattern.defaults.copy()
-            if pattern.transaction_type:
-                data["transaction_type"] = pattern.transaction_type
+        return matches
 
-            # Map named groups
-            group_dict = match.groupdict()
-            for group_name, value in group_dict.items():
-                if value is not None:
-                    field_name = pattern.field_map.get(group_name, group_name)
-                    data[field_name] = value.strip()
+    def _first_match(self, pattern: TransactionPattern, text: str) -> Optional[Dict[str, Any]]:
+        """Return the data of the first match of a pattern, like ``_apply_pattern(...)[0]``.
 
+        The scan stops at that match instead of collecting every later one.
+        """
+        for match in self._regex_for(pattern).finditer(text):
+            data = self._match_data(pattern, match)
             if data:
-                matches.append(data)
+                return data
+        return None
 
-        return matches
+    def _regex_for(self, pattern: TransactionPattern) -> re.Pattern:
+        regex = self.pattern_regexes.get(pattern.regex)
+        if regex is None:
+            regex = re.compile(pattern.regex, re.IGNORECASE | re.MULTILINE)
+        return regex
+
+    def _match_data(self, pattern: TransactionPattern, match: re.Match) -> Dict[str, Any]:
+        data = pattern.defaults.copy()
+        if pattern.transaction_type:
+            data["transaction_type"] = pattern.transaction_type
+
+        # Map named groups
+        group_dict = match.groupdict()
+        for group_name, value in group_dict.items():
+            if value is not None:
+                field_name = pattern.field_map.get(group_name, group_name)
+                data[field_name] = value.strip()
+        return data
 
     def _parse_sections(self, config: SectionConfig, body: str) -> List[Dict[str, Any]]:
         """Split body into sections and extract one transaction from each."""
-        sections = re.split(config.split_by, body)
+        if self.section_regex is not None and config is self.template.sections:
+            sections = self.section_regex.split(body)
+        else:
+            sections = re.split(config.split_by, body)
         results = []
 
         for section in sections:
@@ -94,10 +146,10 @@ class TemplateEngine:
 
             section_data = {}
             for pattern in config.transaction_patterns:
-                matches = self._apply_pattern(pattern, section)
-                if matches:
+                match_data = self._first_match(pattern, section)
+                if match_data:
                     # Merge first match info into section_data
-                    section_data.update(matches[0])
+                    section_data.update(match_data)
 
             if section_data.get("amount") or section_data.get("total_spent"):
                 results.append(section_data)
@@ -109,10 +161,9 @@ class TemplateEngine:
         final_results = []
 
         # Extract common fields if missing
-        # Improved regex to handle both "Order #123" (no colon) and "Transaction ID: 123"
-        txn_id = self._find_in_text(r"(?:Transaction ID|Reference|ID|Reference Number|Order Reference):\s*([A-Z0-9#\-]+)", body)
+        txn_id = self._find_in_text(_TRANSACTION_ID_RE, body)
         if not txn_id:
-            txn_id = self._find_in_text(r"Order\s*#\s*([A-Z0-9#\-]+)", body)
+            txn_id = self._find_in_text(_ORDER_NUMBER_RE, body)
 
         for data in results:
             # 1. Clean numeric values
@@ -167,9 +218,12 @@ class TemplateEngine:
 
         return final_results
 
-    def _find_in_text(self, pattern: str, text: str) -> Optional[str]:
+    def _find_in_text(self, pattern: Union[str, re.Pattern], text: str) -> Optional[str]:
         """Helper to find a single match."""
-        match = re.search(pattern, text, re.IGNORECASE)
+        if isinstance(pattern, re.Pattern):
+            match = pattern.search(text)
+        else:
+            match = re.search(pattern, text, re.IGNORECASE)
         if match:
             return match.group(1).strip()
         return None
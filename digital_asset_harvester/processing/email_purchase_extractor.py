@@ -1,27 +1,48 @@
 """Logic for identifying and extracting crypto purchase information from emails."""
 
+import asyncio
 import email
 import hashlib
 import logging
 import os
 import re
+import threading
 import time
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, TypeVar, Union, cast
 
 from dateutil import parser
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
+
+try:
+    import xxhash
+
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+    xxhash = None
+
+try:
+    import ciso8601
+
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+    ciso8601 = None
 
 from digital_asset_harvester.confidence import calculate_confidence
 from digital_asset_harvester.config import HarvesterSettings, get_settings
 from digital_asset_harvester.ingest.email_parser import decode_header_value, extract_body
-from digital_asset_harvester.llm import get_llm_client
+from digital_asset_harvester.llm import get_llm_client, get_slm_client
 from digital_asset_harvester.llm.ollama_client import LLMError
-from digital_asset_harvester.llm.provider import LLMProvider
+from digital_asset_harvester.llm.provider import LLMProvider, LLMResult
 from digital_asset_harvester.processing.constants import (
+    CRYPTO_EXCHANGE_DOMAINS,
     CRYPTO_EXCHANGES,
     CRYPTO_EXCHANGES_PATTERN,
     CRYPTOCURRENCY_TERMS,
@@ -32,6 +53,7 @@ from digital_asset_harvester.processing.constants import (
     PURCHASE_KEYWORDS_PATTERN,
 )
 from digital_asset_harvester.processing.extractors import registry
+from digital_asset_harvester.processing.keyword_matcher import KeywordMatcher
 from digital_asset_harvester.prompts import DEFAULT_PROMPTS, PromptManager
 from digital_asset_harvester.telemetry import (
     MetricsTracker,
@@ -46,9 +68,174 @@ from digital_asset_harvester.validation import PurchaseRecord, PurchaseValidator
 
 logger = logging.getLogger(__name__)
 
+_CachedT = TypeVar("_CachedT")
 
-@dataclass
+# Validates every purchase extracted from an email in a single pydantic call.
+_PURCHASES_ADAPTER = TypeAdapter(List[PurchaseRecord])
+
+# Transaction types that carry no fiat side and therefore need fewer fields.
+_NON_PURCHASE_TRANSACTION_TRIGGERS = ("deposit", "withdrawal", "staking_reward")
+# Kept in sorted order so missing fields come out ready for logging
+_REQUIRED_NON_PURCHASE_FIELDS: Tuple[str, ...] = ("amount", "item_name", "vendor")
+_REQUIRED_PURCHASE_FIELDS: Tuple[str, ...] = ("amount", "currency", "item_name", "total_spent", "vendor")
+
+
+# Output format for normalized purchase dates, and a matcher for dates already in that form
+_PURCHASE_DATE_FORMAT = "%Y-%m-%d %H:%M:%S %Z"
+_CANONICAL_DATE_PATTERN = re.compile(
+    r"\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01]) (?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d UTC"
+)
+
+# CLI-formatted "Body: " marker at the start of any line
+_BODY_MARKER_PATTERN = re.compile(r"^body: (.*)$", re.IGNORECASE | re.MULTILINE)
+# Header markers of the plain-text email format, compared against a lower-cased line prefix
+_HEADER_MARKERS = ("subject: ", "from: ", "body: ")
+
+
+def _first_nonblank_line(text: str) -> str:
+    """Return the first line with non-whitespace content, without splitting the whole text."""
+    start = 0
+    while True:
+        end = text.find("\n", start)
+        line = text[start:] if end == -1 else text[start:end]
+        if line.strip():
+            return line
+        if end == -1:
+            return ""
+        start = end + 1
+
+
+def _sender_domain(sender: str) -> str:
+    """Return the lower-cased domain of a sender address, or an empty string."""
+    _, at, domain = sender.rpartition("@")
+    if not at:
+        return ""
+    return domain.strip().rstrip(">").strip().lower()
+
+
+def _is_exchange_domain(domain: str) -> bool:
+    """Check a sender domain, and its parent domains, against known exchange domains."""
+    while domain:
+        if domain in CRYPTO_EXCHANGE_DOMAINS:
+            return True
+        _, dot, domain = domain.partition(".")
+        if not dot:
+            break
+    return False
+
+
+def _parse_email_metadata(email_content: str) -> Tuple[str, str, str]:
+    """Parse ``(subject, sender, body)`` out of email content.
+
+    Callers cache the result; see :meth:`EmailPurchaseExtractor._extract_email_metadata`.
+    """
+    subject = sender = body = ""
+
+    # Check if it looks like a raw RFC 5322 message
+    # A simple heuristic: starts with a common header or has a colon in the first non-empty line
+    first_line = _first_nonblank_line(email_content)
+    header_name, colon, _ = first_line.partition(":")
+    if colon and header_name.replace("-", "").isalnum():
+        # Use standard email library for robust parsing
+        msg = email.message_from_string(email_content)
+        subject = decode_header_value(msg.get("subject", ""))
+        sender = decode_header_value(msg.get("from", ""))
+        body = extract_body(msg)
+
+        # Special case: If our CLI-formatted "Body: " marker is present and body is still empty
+        if not body or len(body) < 10:
+            marker = _BODY_MARKER_PATTERN.search(email_content)
+            if marker:
+                body = marker.group(1).strip()
+
+    # Fallback if standard parsing failed to get basic metadata
+    if not subject and not sender:
+        # Scan header lines one at a time; once the body starts, slice off the rest in one go
+        start = 0
+        while start >= 0:
+            end = email_content.find("\n", start)
+            line = email_content[start:] if end == -1 else email_content[start:end]
+            start = -1 if end == -1 else end + 1
+
+            line_strip = line.strip()
+            # Only the marker prefix is lower-cased, never a whole (possibly long) line
+            prefix = line_strip[:9].lower()
+
+            first_body_line = None
+            if prefix.startswith(_HEADER_MARKERS):
+                # The markers differ in their first letter
+                if prefix[0] == "s":
+                    subject = line_strip[9:].strip()
+                elif prefix[0] == "f":
+                    sender = line_strip[6:].strip()
+                else:
+                    first_body_line = line_strip[6:].strip()
+            elif not line_strip:
+                if subject or sender:
+                    if start >= 0:
+                        body = email_content[start:].strip()
+                    break
+            elif ":" not in line_strip:
+                if subject or sender:
+                    first_body_line = line
+
+            if first_body_line is not None:
+                body = first_body_line if start < 0 else first_body_line + "\n" + email_content[start:]
+                body = body.strip()
+                break
+
+    return subject, sender, body
+
+
+@lru_cache(maxsize=256)
+def _is_non_purchase_type(transaction_type: str) -> bool:
+    """Check whether a raw transaction type names a deposit, withdrawal or staking reward.
+
+    Extractors emit a handful of distinct type strings, so the answer is
+    memoized per raw value and a repeated type costs one dict lookup.
+    """
+    lowered = transaction_type.lower()
+    return any(trigger in lowered for trigger in _NON_PURCHASE_TRANSACTION_TRIGGERS)
+
+
+@lru_cache(maxsize=1024)
+def _parse_purchase_date(date_str: str) -> datetime:
+    """Parse a purchase date, trying the C-level ISO-8601 parsers before dateutil.
+
+    LLM and regex output is nearly always ISO-8601, so dateutil's much slower
+    heuristic parser only runs for the remaining free-form dates. With the
+    optional ``ciso8601`` installed, ISO forms that ``fromisoformat`` rejects
+    (before Python 3.11, e.g. basic ``20240105T1030``) are parsed in C too.
+    Results are immutable and cached, so repeated dates are parsed once.
+    """
+    iso = date_str[:-1] + "+00:00" if date_str.endswith(("Z", "z")) else date_str
+    try:
+        return datetime.fromisoformat(iso)
+    except ValueError:
+        pass
+    if CISO8601_AVAILABLE:
+        try:
+            return cast(datetime, ciso8601.parse_datetime(date_str))
+        except ValueError:
+            pass
+    return parser.parse(date_str)
+
+
+# (passed pre-filters, regex extraction results, PII-scrubbed content) for one email
+_Preprocessed = Tuple[bool, Optional[List[Dict[str, Any]]], Optional[str]]
+
+
+@dataclass(frozen=True)
 class PurchaseInfo:
+    """Legacy typed view of a purchase, kept for the ``ingest`` compatibility shim.
+
+    The pipeline itself passes plain dicts and validates them as
+    :class:`PurchaseRecord`; ``__slots__`` keeps instances free of a ``__dict__``
+    (``dataclass(slots=True)`` needs Python 3.10). Instances are immutable.
+    """
+
+    __slots__ = ("total_spent", "currency", "amount", "item_name", "vendor", "purchase_date")
+
     total_spent: float
     currency: str
     amount: float
@@ -56,6 +243,14 @@ class PurchaseInfo:
     vendor: str
     purchase_date: str
 
+    # Frozen slotted instances cannot be restored through setattr, as pickle would by default
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 @dataclass
 class EmailPurchaseExtractor:
@@ -67,45 +262,58 @@ class EmailPurchaseExtractor:
     event_logger: StructuredLoggerAdapter = field(init=False)
     metrics: MetricsTracker = field(default_factory=MetricsTracker)
     prompts: PromptManager = field(default_factory=lambda: DEFAULT_PROMPTS)
-    # Instance-level regex patterns for keyword matching
-    _exchanges_pattern: re.Pattern = field(init=False)
-    _terms_pattern: re.Pattern = field(init=False)
-    _purchase_keywords_pattern: re.Pattern = field(init=False)
-    _non_purchase_pattern: re.Pattern = field(init=False)
-    _metadata_cache: OrderedDict[str, Dict[str, str]] = field(default_factory=OrderedDict, init=False)
-    _scrubbed_cache: OrderedDict[str, str] = field(default_factory=OrderedDict, init=False)
-    _MAX_CACHE_SIZE: int = 1000
+    # Optional small model that settles confident classifications before the main LLM
+    slm_client: Optional[LLMProvider] = None
+    # False skips building the small-model client, for extractors that never classify
+    enable_slm: bool = True
+    # Instance-level keyword matchers for the pre-filters
+    _exchanges_pattern: KeywordMatcher = field(init=False)
+    _terms_pattern: KeywordMatcher = field(init=False)
+    _purchase_keywords_pattern: KeywordMatcher = field(init=False)
+    _non_purchase_pattern: KeywordMatcher = field(init=False)
+    _metadata_cache: OrderedDict[bytes, Dict[str, Any]] = field(default_factory=OrderedDict, init=False)
+    _scrubbed_cache: OrderedDict[bytes, str] = field(default_factory=OrderedDict, init=False)
+    # LRU bound for the per-email caches above, from settings.metadata_cache_size
+    _cache_size: int = field(init=False)
+    # The CLI's thread pool shares one extractor, so cache reads and writes are serialized
+    _cache_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    # Identity-checked digest of the most recently hashed email, replaced atomically
+    _last_content_hash: Optional[Tuple[str, bytes]] = field(default=None, init=False, repr=False, compare=False)
+    # Preprocessing pool, started on first use and kept across process_emails calls until close()
+    _preprocess_pool: Optional[ProcessPoolExecutor] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.validator = PurchaseValidator(allow_unknown_crypto=self.settings.allow_unknown_cryptos)
-
-        # Load custom keywords and compile instance-level regex patterns
+        cache_size = getattr(self.settings, "metadata_cache_size", None)
+        if not isinstance(cache_size, int):
+            cache_size = HarvesterSettings.metadata_cache_size
+        self._cache_size = max(cache_size, 0)
+        if self.slm_client is None and self.enable_slm:
+            self.slm_client = get_slm_client(self.settings)
+
+        # Load custom keywords and build instance-level keyword matchers
         custom_keywords = self._load_custom_keywords()
 
-        # Merge custom keywords into exchanges and purchase keywords
-        exchanges = set(CRYPTO_EXCHANGES)
-        terms = set(CRYPTOCURRENCY_TERMS)
-        purchase_keywords = set(PURCHASE_KEYWORDS)
-        non_purchase_patterns = set(NON_PURCHASE_PATTERNS)
+        # The shared keyword sets are frozensets, so they are only copied when
+        # custom keywords have to be merged in
+        exchanges = CRYPTO_EXCHANGES
+        terms = CRYPTOCURRENCY_TERMS
+        purchase_keywords = PURCHASE_KEYWORDS
+        non_purchase_patterns = NON_PURCHASE_PATTERNS
 
         if custom_keywords:
             logger.info("Adding %d custom keywords to pre-filtering list", len(custom_keywords))
             # We add custom keywords to exchanges, terms, and purchase keywords to ensure they
             # are picked up by our filtering logic regardless of where they appear.
-            exchanges.update(custom_keywords)
-            terms.update(custom_keywords)
-            purchase_keywords.update(custom_keywords)
+            exchanges = exchanges.union(custom_keywords)
+            terms = terms.union(custom_keywords)
+            purchase_keywords = purchase_keywords.union(custom_keywords)
 
-        self._exchanges_pattern = re.compile(
-            r"\b(" + "|".join(re.escape(ex) for ex in exchanges) + r")\b", re.IGNORECASE
-        )
-        self._terms_pattern = re.compile(r"\b(" + "|".join(re.escape(term) for term in terms) + r")\b", re.IGNORECASE)
-        self._purchase_keywords_pattern = re.compile(
-            r"\b(" + "|".join(re.escape(kw) for kw in purchase_keywords) + r")\b", re.IGNORECASE
-        )
-        self._non_purchase_pattern = re.compile(
-            r"\b(" + "|".join(re.escape(p) for p in non_purchase_patterns) + r")\b", re.IGNORECASE
-        )
+        use_hyperscan = getattr(self.settings, "use_hyperscan", False) is True
+        self._exchanges_pattern = KeywordMatcher(exchanges, use_hyperscan)
+        self._terms_pattern = KeywordMatcher(terms, use_hyperscan)
+        self._purchase_keywords_pattern = KeywordMatcher(purchase_keywords, use_hyperscan)
+        self._non_purchase_pattern = KeywordMatcher(non_purchase_patterns, use_hyperscan)
 
         # Initialize PII scrubber with crypto terms to avoid over-scrubbing
         skip_terms = terms | exchanges
@@ -141,104 +349,109 @@ class EmailPurchaseExtractor:
 
         return keywords
 
-    def _contains_keywords(self, text: str, pattern: Any) -> bool:
-        """Check if text matches the specified regex pattern."""
-        return bool(pattern.search(text))
-
-    def _get_content_hash(self, content: str) -> str:
-        """Generate a SHA-256 hash of the content for use as a cache key."""
-        return hashlib.sha256(content.encode("utf-8", errors="ignore")).hexdigest()
+    def _contains_keywords(self, *texts: str, pattern: Any) -> bool:
+        """Check if any of the lower-cased texts contains a keyword of the specified matcher.
+
+        Fields are scanned one by one, so a hit in a short subject or sender
+        never scans the body and no concatenated copy of the email is built.
+        """
+        return any(pattern.search_lower(text) for text in texts if text)
+
+    def _metadata_contains(self, metadata: Dict[str, Any], fields: Sequence[str], pattern_name: str) -> bool:
+        """Check metadata fields against a keyword matcher, remembering each field's result.
+
+        The pre-filters overlap (the non-purchase scan runs in both
+        ``_should_skip_llm_analysis`` and ``_is_likely_purchase_related``), so
+        the hits are stored on the cached metadata and each field is scanned at
+        most once per matcher.
+        """
+        pattern = getattr(self, pattern_name)
+        for name in fields:
+            key = f"{pattern_name}:{name}"
+            hit = metadata.get(key)
+            if hit is None:
+                hit = metadata[key] = self._contains_keywords(metadata[f"{name}_lower"], pattern=pattern)
+            if hit:
+                return True
+        return False
 
-    def _extract_email_metadata(self, email_content: str) -> Dict[str, str]:
+    def _render_prompt(self, name: str, email_content: str, **context: str) -> str:
+        """Build a prompt around the email content from the template's pre-split parts."""
+        return self.prompts.render(name, email_content=email_content, **context)
+
+    def _get_content_hash(self, content: str) -> bytes:
+        """Generate a 16-byte digest of the content for use as a cache key.
+
+        XXH3-128 is used when ``xxhash`` is installed, BLAKE2b otherwise. The
+        pre-filters, regex extraction and scrubbing all look up the same email
+        string in turn, so the digest of the last string seen is reused instead
+        of re-encoding and re-hashing a multi-KB body each time.
+        """
+        last = self._last_content_hash
+        if last is not None and last[0] is content:
+            return last[1]
+        encoded = content.encode("utf-8", errors="ignore")
+        digest: bytes
+        if XXHASH_AVAILABLE:
+            digest = xxhash.xxh3_128_digest(encoded)
+        else:
+            digest = hashlib.blake2b(encoded, digest_size=16).digest()
+        self._last_content_hash = (content, digest)
+        return digest
+
+    def _cache_get(self, cache: OrderedDict[bytes, _CachedT], key: bytes) -> Optional[_CachedT]:
+        """Return a cached value and mark it most recently used, or None on a miss."""
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, cache: OrderedDict[bytes, _CachedT], key: bytes, value: _CachedT) -> None:
+        """Store a value, evicting the least recently used entries beyond the cache size."""
+        with self._cache_lock:
+            cache[key] = value
+            while len(cache) > self._cache_size:
+                cache.popitem(last=False)
+
+    def _extract_email_metadata(self, email_content: str) -> Dict[str, Any]:
         """Extract subject, sender, and body from email content with caching."""
         cache_key = self._get_content_hash(email_content)
-        if cache_key in self._metadata_cache:
-            # Move to end for LRU
-            self._metadata_cache.move_to_end(cache_key)
-            return self._metadata_cache[cache_key]
-
-        metadata = {"subject": "", "sender": "", "body": ""}
-
-        # Check if it looks like a raw RFC 5322 message
-        # A simple heuristic: starts with a common header or has a colon in the first non-empty line
-        first_line = ""
-        for line in email_content.split("\n"):
-            if line.strip():
-                first_line = line
-                break
+        cached = self._cache_get(self._metadata_cache, cache_key)
+        if cached is not None:
+            return cached
 
-        if ":" in first_line and first_line.split(":")[0].replace("-", "").isalnum():
-            # Use standard email library for robust parsing
-            msg = email.message_from_string(email_content)
-            metadata["subject"] = decode_header_value(msg.get("subject", ""))
-            metadata["sender"] = decode_header_value(msg.get("from", ""))
-            metadata["body"] = extract_body(msg)
-
-            # Special case: If our CLI-formatted "Body: " marker is present and body is still empty
-            if not metadata["body"] or len(metadata["body"]) < 10:
-                for line in email_content.split("\n"):
-                    if line.lower().startswith("body: "):
-                        metadata["body"] = line[6:].strip()
-                        break
-
-        # Fallback if standard parsing failed to get basic metadata
-        if not metadata["subject"] and not metadata["sender"]:
-            lines = email_content.split("\n")
-            body_started = False
-            body_lines = []
-
-            for i, line in enumerate(lines):
-                if body_started:
-                    body_lines.append(line)
-                    continue
+        subject, sender, body = _parse_email_metadata(email_content)
+        metadata: Dict[str, Any] = {"subject": subject, "sender": sender, "body": body}
+        metadata["sender_domain"] = _sender_domain(metadata["sender"])
+        # Lower-cased once here so the keyword pre-filters never re-lower a field
+        for name in ("subject", "sender", "body"):
+            metadata[f"{name}_lower"] = metadata[name].lower()
 
-                line_strip = line.strip()
-                line_lower = line_strip.lower()
-
-                if line_lower.startswith("subject: "):
-                    metadata["subject"] = line_strip[9:].strip()
-                elif line_lower.startswith("from: "):
-                    metadata["sender"] = line_strip[6:].strip()
-                elif line_lower.startswith("body: "):
-                    body_started = True
-                    body_lines.append(line_strip[6:].strip())
-                elif not line_strip:
-                    if metadata["subject"] or metadata["sender"]:
-                        body_started = True
-                elif ":" not in line_strip:
-                    if metadata["subject"] or metadata["sender"]:
-                        body_started = True
-                        body_lines.append(line)
-
-            if body_lines:
-                metadata["body"] = "\n".join(body_lines).strip()
-
-        self._metadata_cache[cache_key] = metadata
-        if len(self._metadata_cache) > self._MAX_CACHE_SIZE:
-            self._metadata_cache.popitem(last=False)
+        self._cache_put(self._metadata_cache, cache_key, metadata)
 
         return metadata
 
     def _is_likely_crypto_related(self, email_content: str) -> bool:
         """Quick keyword-based check to see if email might be crypto-related."""
         metadata = self._extract_email_metadata(email_content)
-        full_text = f"{metadata['subject']} {metadata['sender']} {metadata['body']}"
 
-        # Check for crypto exchanges in sender or content
-        has_crypto_exchange = self._contains_keywords(metadata["sender"], self._exchanges_pattern)
-        has_crypto_terms = self._contains_keywords(full_text, self._terms_pattern)
+        # Mail from a known exchange domain needs no text scan at all
+        if _is_exchange_domain(metadata["sender_domain"]):
+            return True
 
-        return has_crypto_exchange or has_crypto_terms
+        # Check for crypto exchanges in sender or content
+        if self._metadata_contains(metadata, ("sender",), "_exchanges_pattern"):
+            return True
+        return self._metadata_contains(metadata, ("subject", "sender", "body"), "_terms_pattern")
 
     def _is_likely_purchase_related(self, email_content: str) -> bool:
         """Check if email contains purchase-related keywords."""
         metadata = self._extract_email_metadata(email_content)
-        full_text = f"{metadata['subject']} {metadata['body']}"
 
-        has_purchase_keywords = self._contains_keywords(full_text, self._purchase_keywords_pattern)
-        has_non_purchase_patterns = self._contains_keywords(full_text, self._non_purchase_pattern)
-
-        return has_purchase_keywords and not has_non_purchase_patterns
+        if not self._metadata_contains(metadata, ("subject", "body"), "_purchase_keywords_pattern"):
+            return False
+        return not self._metadata_contains(metadata, ("subject", "body"), "_non_purchase_pattern")
 
     def _scrub_pii_if_enabled(self, email_content: str) -> str:
         """Apply PII scrubbing to email content if enabled in settings or privacy mode."""
@@ -246,26 +459,23 @@ class EmailPurchaseExtractor:
             return email_content
 
         cache_key = self._get_content_hash(email_content)
-        if cache_key in self._scrubbed_cache:
-            self._scrubbed_cache.move_to_end(cache_key)
-            return self._scrubbed_cache[cache_key]
+        cached = self._cache_get(self._scrubbed_cache, cache_key)
+        if cached is not None:
+            return cached
 
         logger.debug("PII scrubbing enabled, processing email content")
         scrubbed = self.pii_scrubber.scrub(email_content)
 
-        self._scrubbed_cache[cache_key] = scrubbed
-        if len(self._scrubbed_cache) > self._MAX_CACHE_SIZE:
-            self._scrubbed_cache.popitem(last=False)
+        self._cache_put(self._scrubbed_cache, cache_key, scrubbed)
 
         return scrubbed
 
     def _should_skip_llm_analysis(self, email_content: str) -> bool:
         """Determine if email can be quickly filtered out without LLM analysis."""
         metadata = self._extract_email_metadata(email_content)
-        full_text = f"{metadata['subject']} {metadata['sender']} {metadata['body']}"
 
         # Skip if contains clear non-purchase patterns
-        if self._contains_keywords(full_text, self._non_purchase_pattern):
+        if self._metadata_contains(metadata, ("subject", "sender", "body"), "_non_purchase_pattern"):
             return True
 
         # Skip if doesn't contain any crypto-related terms
@@ -274,45 +484,36 @@ class EmailPurchaseExtractor:
 
         return False
 
-    def is_crypto_purchase_email(self, email_content: str, max_retries: Optional[int] = None) -> bool:
-        self.metrics.increment("classification_total")
-        retries = max_retries if max_retries is not None else self.settings.llm_max_retries
-
-        if self.settings.enable_preprocessing:
-            if self._should_skip_llm_analysis(email_content):
-                logger.debug("Skipping LLM analysis - email filtered out by preprocessing")
-                self.metrics.increment("classification_skipped_preprocessing")
-                return False
+    def _passes_classification_preprocessing(self, email_content: str) -> bool:
+        """Apply the keyword pre-filters that run before any classification LLM call."""
+        if not self.settings.enable_preprocessing:
+            return True
 
-            if not self._is_likely_purchase_related(email_content):
-                logger.debug("Email doesn't meet basic purchase criteria")
-                return False
+        if self._should_skip_llm_analysis(email_content):
+            logger.debug("Skipping LLM analysis - email filtered out by preprocessing")
+            self.metrics.increment("classification_skipped_preprocessing")
+            return False
 
-        # Apply PII scrubbing before sending to LLM
-        scrubbed_content = self._scrub_pii_if_enabled(email_content)
-        prompt = self.prompts.render("classification", email_content=scrubbed_content)
+        if not self._is_likely_purchase_related(email_content):
+            logger.debug("Email doesn't meet basic purchase criteria")
+            return False
 
-        try:
-            logger.info("Submitting email for classification (up to %d attempts)", retries)
-            start_time = time.time()
-            result = self.llm_client.generate_json(prompt, retries=retries)
-            duration = time.time() - start_time
-            self.metrics.record_latency("llm_classification", duration)
-            self.metrics.increment("llm_calls_total")
-            if result.metadata and result.metadata.get("cached"):
-                self.metrics.increment("llm_cache_hits")
-            else:
-                self.metrics.increment("llm_cache_misses")
+        return True
 
-            if result.metadata and result.metadata.get("fallback_used"):
-                self.metrics.increment("llm_fallback_usage")
+    def _record_llm_result(self, result: LLMResult, latency_name: str, duration: float) -> None:
+        """Update LLM call metrics for a completed request."""
+        self.metrics.record_latency(latency_name, duration)
+        self.metrics.increment("llm_calls_total")
+        if result.metadata and result.metadata.get("cached"):
+            self.metrics.increment("llm_cache_hits")
+        else:
+            self.metrics.increment("llm_cache_misses")
 
-        except LLMError as exc:
-            logger.error("Failed to categorize email after %d attempts: %s", retries, exc)
-            self.metrics.increment("llm_calls_failed")
-            return False
+        if result.metadata and result.metadata.get("fallback_used"):
+            self.metrics.increment("llm_fallback_usage")
 
-        payload = result.data
+    def _interpret_classification(self, payload: Dict[str, Any]) -> bool:
+        """Turn a classification payload into a decision, applying the confidence gate."""
         is_purchase = payload.get("is_crypto_purchase", False)
         confidence = payload.get("confidence", 0.5)
         reasoning = payload.get("reasoning", "No reasoning provided")
@@ -344,88 +545,395 @@ class EmailPurchaseExtractor:
 
         return is_purchase
 
+    def is_crypto_purchase_email(
+        self,
+        email_content: str,
+        max_retries: Optional[int] = None,
+        *,
+        scrubbed_content: Optional[str] = None,
+    ) -> bool:
+        self.metrics.increment("classification_total")
+        retries = max_retries if max_retries is not None else self.settings.llm_max_retries
+
+        if not self._passes_classification_preprocessing(email_content):
+            return False
+
+        # Apply PII scrubbing before sending to LLM
+        if scrubbed_content is None:
+            scrubbed_content = self._scrub_pii_if_enabled(email_content)
+        return self._classify_scrubbed(scrubbed_content, retries)
+
+    def classify_batch(
+        self, emails: Sequence[str], batch_size: int = 16, max_retries: Optional[int] = None
+    ) -> List[bool]:
+        """Classify many emails, sending up to ``batch_size`` of them in each LLM prompt.
+
+        Emails rejected by the keyword pre-filters never reach the LLM. Any
+        email the model leaves out of a batched answer is re-classified on its
+        own. Decisions are returned in input order.
+        """
+        retries = max_retries if max_retries is not None else self.settings.llm_max_retries
+        decisions = [False] * len(emails)
+        pending: List[int] = []
+        scrubbed: List[str] = []
+        for idx, email_content in enumerate(emails):
+            self.metrics.increment("classification_total")
+            if self._passes_classification_preprocessing(email_content):
+                pending.append(idx)
+                scrubbed.append(self._scrub_pii_if_enabled(email_content))
+
+        for idx, decision in zip(pending, self._classify_scrubbed_batch(scrubbed, batch_size, retries)):
+            decisions[idx] = decision
+        return decisions
+
+    def _classify_scrubbed_batch(
+        self, scrubbed_contents: Sequence[str], batch_size: int, retries: int, *, skip_slm: bool = False
+    ) -> List[bool]:
+        """Classify already-scrubbed emails ``batch_size`` at a time.
+
+        ``skip_slm`` sends single-email fallbacks straight to the main LLM, for
+        emails the small model has already escalated.
+        """
+        batch_size = max(1, batch_size)
+        decisions: List[bool] = []
+        for start in range(0, len(scrubbed_contents), batch_size):
+            chunk = scrubbed_contents[start : start + batch_size]
+            if len(chunk) == 1:
+                decisions.append(self._classify_scrubbed(chunk[0], retries, skip_slm=skip_slm))
+            else:
+                decisions.extend(self._classify_chunk(chunk, retries, skip_slm=skip_slm))
+        return decisions
+
+    def _classify_chunk(self, chunk: Sequence[str], retries: int, *, skip_slm: bool = False) -> List[bool]:
+        """Classify several emails with the ``classification_batch`` prompt."""
+        emails_block = "\n\n".join(f"--- EMAIL {i} ---\n{content}" for i, content in enumerate(chunk))
+        prompt = self.prompts.render("classification_batch", emails=emails_block)
+
+        answers: Dict[int, Dict[str, Any]] = {}
+        try:
+            logger.info(
+                "Submitting %d emails for classification in one prompt (up to %d attempts)", len(chunk), retries
+            )
+            start_time = time.time()
+            result = self.llm_client.generate_json(prompt, retries=retries)
+            self._record_llm_result(result, "llm_classification_batch", time.time() - start_time)
+            entries = result.data.get("results", []) if isinstance(result.data, dict) else []
+            for entry in entries if isinstance(entries, list) else []:
+                idx = entry.get("idx") if isinstance(entry, dict) else None
+                if isinstance(idx, int) and 0 <= idx < len(chunk) and isinstance(entry.get("is_crypto_purchase"), bool):
+                    answers.setdefault(idx, entry)
+        except LLMError as exc:
+            logger.error("Failed to categorize email batch after %d attempts: %s", retries, exc)
+            self.metrics.increment("llm_calls_failed")
+
+        decisions = []
+        for idx, scrubbed_content in enumerate(chunk):
+            if idx in answers:
+                decisions.append(self._interpret_classification(answers[idx]))
+            else:
+                # Missing or malformed answer: fall back to a single-email call
+                self.metrics.increment("classification_batch_retries")
+                decisions.append(self._classify_scrubbed(scrubbed_content, retries, skip_slm=skip_slm))
+        return decisions
+
+    def _slm_decision(self, outcome: Union[LLMResult, Exception], duration: float) -> Optional[bool]:
+        """Accept a small-model classification if it is confident enough, else ``None`` to escalate."""
+        if isinstance(outcome, Exception):
+            logger.warning("Small-model classification failed, escalating to the main LLM: %s", outcome)
+            self.metrics.increment("slm_calls_failed")
+            return None
+
+        self._record_llm_result(outcome, "slm_classification", duration)
+        confidence = outcome.data.get("confidence") if isinstance(outcome.data, dict) else None
+        if not isinstance(confidence, (int, float)) or confidence < self.settings.slm_confident_threshold:
+            self.metrics.increment("slm_escalations")
+            return None
+
+        self.metrics.increment("slm_decisions")
+        return self._interpret_classification(outcome.data)
+
+    def _classify_scrubbed(self, scrubbed_content: str, retries: int, *, skip_slm: bool = False) -> bool:
+        """Run the classification LLM call on already-scrubbed content.
+
+        The small model, when configured, is tried first unless ``skip_slm`` is set.
+        """
+        prompt = self._render_prompt("classification", scrubbed_content)
+
+        if self.slm_client is not None and not skip_slm:
+            start_time = time.time()
+            try:
+                outcome: Union[LLMResult, Exception] = self.slm_client.generate_json(
+                    prompt, model=self.settings.slm_model_name, retries=retries
+                )
+            except LLMError as exc:
+                outcome = exc
+            decision = self._slm_decision(outcome, time.time() - start_time)
+            if decision is not None:
+                return decision
+
+        try:
+            logger.info("Submitting email for classification (up to %d attempts)", retries)
+            start_time = time.time()
+            result = self.llm_client.generate_json(prompt, retries=retries)
+            self._record_llm_result(result, "llm_classification", time.time() - start_time)
+        except LLMError as exc:
+            logger.error("Failed to categorize email after %d attempts: %s", retries, exc)
+            self.metrics.increment("llm_calls_failed")
+            return False
+
+        return self._interpret_classification(result.data)
+
+    def _extract_with_regex(self, email_content: str) -> Optional[List[Dict[str, Any]]]:
+        """Try the specialized regex extractors, returning processed transactions on success."""
+        if not self.settings.enable_regex_extractors:
+            return None
+
+        self.metrics.increment("extraction_regex_attempts")
+        metadata = self._extract_email_metadata(email_content)
+        return self._regex_outcome(registry.extract(metadata["subject"], metadata["sender"], metadata["body"]))
+
+    def _extract_with_regex_batch(self, email_contents: Sequence[str]) -> List[Optional[List[Dict[str, Any]]]]:
+        """Like :meth:`_extract_with_regex` for many emails, through one :meth:`ExtractorRegistry.extract_batch`."""
+        if not self.settings.enable_regex_extractors or not email_contents:
+            return [None] * len(email_contents)
+
+        self.metrics.increment("extraction_regex_attempts", len(email_contents))
+        rows = []
+        for email_content in email_contents:
+            metadata = self._extract_email_metadata(email_content)
+            rows.append((metadata["subject"], metadata["sender"], metadata["body"]))
+        return [self._regex_outcome(regex_results) for regex_results in registry.extract_batch(rows)]
+
+    def _regex_outcome(self, regex_results: Optional[List[Dict[str, Any]]]) -> Optional[List[Dict[str, Any]]]:
+        """Process regex extractor results, or return ``None`` when no template matched."""
+        if not regex_results:
+            return None
+
+        logger.info("Successfully extracted purchase info using regex extractor")
+        self.metrics.increment("extraction_regex_success")
+        return self._process_extracted_transactions(regex_results, method="regex")
+
+    def _interpret_extraction(self, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Validate the shape of an extraction payload and process its transactions."""
+        if not payload or "transactions" not in payload:
+            logger.info("No purchase information found in the email")
+            return []
+
+        transactions = payload.get("transactions", [])
+        if not isinstance(transactions, list):
+            logger.warning("Expected transactions list, but got %s", type(transactions))
+            return []
+
+        return self._process_extracted_transactions(transactions)
+
     def extract_purchase_info(
         self,
         email_content: str,
         max_retries: Optional[int] = None,
         default_timezone: str = "UTC",
+        *,
+        scrubbed_content: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         # 1. Try specialized regex extractors first if enabled
-        if self.settings.enable_regex_extractors:
-            self.metrics.increment("extraction_regex_attempts")
-            metadata = self._extract_email_metadata(email_content)
-            regex_results = registry.extract(metadata["subject"], metadata["sender"], metadata["body"])
-            if regex_results:
-                logger.info("Successfully extracted purchase info using regex extractor")
-                self.metrics.increment("extraction_regex_success")
-                return self._process_extracted_transactions(regex_results, method="regex")
+        regex_results = self._extract_with_regex(email_content)
+        if regex_results is not None:
+            return regex_results
 
         # 2. Fallback to LLM extraction
+        return self._extract_with_llm(email_content, max_retries, default_timezone, scrubbed_content)
+
+    def _extract_with_llm(
+        self,
+        email_content: str,
+        max_retries: Optional[int] = None,
+        default_timezone: str = "UTC",
+        scrubbed_content: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Extract purchase details with the LLM, bypassing the regex extractors."""
         self.metrics.increment("extraction_llm_attempts")
         retries = max_retries if max_retries is not None else self.settings.llm_max_retries
 
         # Apply PII scrubbing before sending to LLM
-        scrubbed_content = self._scrub_pii_if_enabled(email_content)
-        prompt = self.prompts.render(
-            "extraction",
-            email_content=scrubbed_content,
-            default_timezone=default_timezone,
-        )
+        if scrubbed_content is None:
+            scrubbed_content = self._scrub_pii_if_enabled(email_content)
+        prompt = self._render_prompt("extraction", scrubbed_content, default_timezone=default_timezone)
 
         try:
             logger.info("Submitting email for purchase extraction (up to %d attempts)", retries)
             start_time = time.time()
             result = self.llm_client.generate_json(prompt, retries=retries)
-            duration = time.time() - start_time
-            self.metrics.record_latency("llm_extraction", duration)
-            self.metrics.increment("llm_calls_total")
-            if result.metadata and result.metadata.get("cached"):
-                self.metrics.increment("llm_cache_hits")
-            else:
-                self.metrics.increment("llm_cache_misses")
-
-            if result.metadata and result.metadata.get("fallback_used"):
-                self.metrics.increment("llm_fallback_usage")
-
+            self._record_llm_result(result, "llm_extraction", time.time() - start_time)
             self.metrics.increment("extraction_llm_success")
         except LLMError as exc:
             logger.error("Failed to extract purchase info after %d attempts: %s", retries, exc)
             self.metrics.increment("llm_calls_failed")
             return []
 
-        payload = result.data
+        return self._interpret_extraction(result.data)
 
-        if not payload or "transactions" not in payload:
-            logger.info("No purchase information found in the email")
-            return []
+    def extract_batch(
+        self,
+        emails: Sequence[str],
+        batch_size: int = 8,
+        max_retries: Optional[int] = None,
+        default_timezone: str = "UTC",
+    ) -> List[List[Dict[str, Any]]]:
+        """Extract purchases from many emails, sending up to ``batch_size`` of them in each LLM prompt.
 
-        transactions = payload.get("transactions", [])
-        if not isinstance(transactions, list):
-            logger.warning("Expected transactions list, but got %s", type(transactions))
+        Emails matched by a regex extractor never reach the LLM. Any email the
+        model leaves out of a batched answer is re-extracted on its own.
+        Transactions are returned in input order.
+        """
+        retries = max_retries if max_retries is not None else self.settings.llm_max_retries
+        results: List[List[Dict[str, Any]]] = [[] for _ in emails]
+        pending: List[int] = []
+        scrubbed: List[str] = []
+        for idx, email_content in enumerate(emails):
+            regex_results = self._extract_with_regex(email_content)
+            if regex_results is not None:
+                results[idx] = regex_results
+            else:
+                pending.append(idx)
+                scrubbed.append(self._scrub_pii_if_enabled(email_content))
+
+        for idx, purchases in zip(
+            pending, self._extract_scrubbed_batch(scrubbed, batch_size, retries, default_timezone)
+        ):
+            results[idx] = purchases
+        return results
+
+    def _extract_scrubbed_batch(
+        self, scrubbed_contents: Sequence[str], batch_size: int, retries: int, default_timezone: str
+    ) -> List[List[Dict[str, Any]]]:
+        """Extract purchases from already-scrubbed emails ``batch_size`` at a time."""
+        batch_size = max(1, batch_size)
+        purchases: List[List[Dict[str, Any]]] = []
+        for start in range(0, len(scrubbed_contents), batch_size):
+            chunk = scrubbed_contents[start : start + batch_size]
+            if len(chunk) == 1:
+                purchases.append(self._extract_with_llm(chunk[0], retries, default_timezone, chunk[0]))
+            else:
+                purchases.extend(self._extract_chunk(chunk, retries, default_timezone))
+        return purchases
+
+    def _extract_chunk(self, chunk: Sequence[str], retries: int, default_timezone: str) -> List[List[Dict[str, Any]]]:
+        """Extract purchases from several emails with the ``extraction_batch`` prompt."""
+        emails_block = "\n\n".join(f"--- EMAIL {i} ---\n{content}" for i, content in enumerate(chunk))
+        prompt = self.prompts.render("extraction_batch", emails=emails_block, default_timezone=default_timezone)
+
+        answers: Dict[int, Dict[str, Any]] = {}
+        try:
+            logger.info(
+                "Submitting %d emails for purchase extraction in one prompt (up to %d attempts)", len(chunk), retries
+            )
+            start_time = time.time()
+            result = self.llm_client.generate_json(prompt, retries=retries)
+            self._record_llm_result(result, "llm_extraction_batch", time.time() - start_time)
+            entries = result.data.get("results", []) if isinstance(result.data, dict) else []
+            for entry in entries if isinstance(entries, list) else []:
+                idx = entry.get("idx") if isinstance(entry, dict) else None
+                if isinstance(idx, int) and 0 <= idx < len(chunk) and isinstance(entry.get("transactions"), list):
+                    answers.setdefault(idx, entry)
+        except LLMError as exc:
+            logger.error("Failed to extract purchase info for email batch after %d attempts: %s", retries, exc)
+            self.metrics.increment("llm_calls_failed")
+
+        purchases = []
+        for idx, scrubbed_content in enumerate(chunk):
+            if idx in answers:
+                self.metrics.increment("extraction_llm_attempts")
+                self.metrics.increment("extraction_llm_success")
+                purchases.append(self._interpret_extraction(answers[idx]))
+            else:
+                # Missing or malformed answer: fall back to a single-email call
+                self.metrics.increment("extraction_batch_retries")
+                purchases.append(self._extract_with_llm(scrubbed_content, retries, default_timezone, scrubbed_content))
+        return purchases
+
+    def _extraction_outcome(
+        self, outcome: Union[LLMResult, Exception], retries: int, duration: float
+    ) -> List[Dict[str, Any]]:
+        """Turn one batched extraction result (or its failure) into processed transactions."""
+        if isinstance(outcome, Exception):
+            logger.error("Failed to extract purchase info after %d attempts: %s", retries, outcome)
+            self.metrics.increment("llm_calls_failed")
             return []
 
-        return self._process_extracted_transactions(transactions)
+        self._record_llm_result(outcome, "llm_extraction", duration)
+        self.metrics.increment("extraction_llm_success")
+        return self._interpret_extraction(outcome.data)
+
+    def _discard_speculative_extraction(self, outcome: Union[LLMResult, Exception], duration: float) -> None:
+        """Account for a speculative extraction whose email was classified negative."""
+        self.metrics.increment("extraction_speculative_discarded")
+        if not isinstance(outcome, Exception):
+            self._record_llm_result(outcome, "llm_extraction", duration)
+
+    def _classify_and_extract_speculatively(
+        self, scrubbed_content: str, retries: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Send the classification and extraction prompts together, keeping the extraction only on a positive.
+
+        Both requests are in flight at once, so a positive email costs one
+        round-trip instead of two. Returns ``None`` when the email is not a
+        crypto purchase.
+        """
+        prompts = [
+            self._render_prompt("classification", scrubbed_content),
+            self._render_prompt("extraction", scrubbed_content, default_timezone="UTC"),
+        ]
+        logger.info("Submitting email for classification with speculative extraction (up to %d attempts)", retries)
+        start_time = time.time()
+        classification, extraction = self.llm_client.generate_json_batch(prompts, retries=retries, max_concurrency=2)
+        return self._speculative_outcome(classification, extraction, retries, time.time() - start_time)
+
+    def _speculative_outcome(
+        self,
+        classification: Union[LLMResult, Exception],
+        extraction: Union[LLMResult, Exception],
+        retries: int,
+        duration: float,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Keep a speculative extraction if its classification came back positive, else return ``None``."""
+        if isinstance(classification, Exception):
+            logger.error("Failed to categorize email after %d attempts: %s", retries, classification)
+            self.metrics.increment("llm_calls_failed")
+            self._discard_speculative_extraction(extraction, duration)
+            return None
+
+        self._record_llm_result(classification, "llm_classification", duration)
+        if not self._interpret_classification(classification.data):
+            self._discard_speculative_extraction(extraction, duration)
+            return None
+
+        self.metrics.increment("extraction_llm_attempts")
+        return self._extraction_outcome(extraction, retries, duration)
 
     def _process_extracted_dates(self, transactions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Common date processing for extracted transactions using robust parsing."""
+        now: Optional[str] = None
         for purchase_data in transactions:
             if purchase_data.get("purchase_date"):
+                date_str = str(purchase_data["purchase_date"])
+                # Already normalized, e.g. by an earlier pass or an LLM that follows the schema
+                if _CANONICAL_DATE_PATTERN.fullmatch(date_str):
+                    continue
                 try:
-                    # Parse the date using dateutil for robust format support
-                    date_str = str(purchase_data["purchase_date"])
-                    date = parser.parse(date_str)
+                    date = _parse_purchase_date(date_str)
 
                     if date.tzinfo is None:
                         date = date.replace(tzinfo=timezone.utc)
                     else:
                         date = date.astimezone(timezone.utc)
-                    purchase_data["purchase_date"] = date.strftime("%Y-%m-%d %H:%M:%S %Z")
+                    purchase_data["purchase_date"] = date.strftime(_PURCHASE_DATE_FORMAT)
+                    continue
                 except (ValueError, TypeError, parser.ParserError) as e:
                     logger.warning("Invalid date format (%s). Using current time.", e)
-                    purchase_data["purchase_date"] = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
             else:
                 logger.warning("No purchase date found, using current time")
-                purchase_data["purchase_date"] = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
+            if now is None:
+                now = datetime.now(timezone.utc).strftime(_PURCHASE_DATE_FORMAT)
+            purchase_data["purchase_date"] = now
         return transactions
 
     def _process_extracted_transactions(
@@ -439,26 +947,12 @@ class EmailPurchaseExtractor:
                 purchase_data["extraction_method"] = method
 
             # Validate required fields based on transaction type
-            is_deposit_withdrawal_or_reward = (
-                "deposit" in purchase_data.get("transaction_type", "").lower()
-                or "withdrawal" in purchase_data.get("transaction_type", "").lower()
-                or "staking_reward" in purchase_data.get("transaction_type", "").lower()
-            )
-
-            if is_deposit_withdrawal_or_reward:
-                required_fields = {"amount", "item_name", "vendor"}
+            if _is_non_purchase_type(purchase_data.get("transaction_type") or ""):
+                required_fields = _REQUIRED_NON_PURCHASE_FIELDS
             else:
-                required_fields = {
-                    "total_spent",
-                    "currency",
-                    "amount",
-                    "item_name",
-                    "vendor",
-                }
-
-            missing_fields = {
-                field for field in required_fields if field not in purchase_data or purchase_data[field] is None
-            }
+                required_fields = _REQUIRED_PURCHASE_FIELDS
+
+            missing_fields = [field for field in required_fields if purchase_data.get(field) is None]
 
             # Log extraction quality
             confidence = purchase_data.get("confidence", 0.5)
@@ -468,7 +962,7 @@ class EmailPurchaseExtractor:
                 self.event_logger,
                 "extraction_completed",
                 confidence=confidence,
-                missing_fields=";".join(sorted(missing_fields)) if missing_fields else "",
+                missing_fields=";".join(missing_fields),
             )
 
             if (
@@ -484,7 +978,7 @@ class EmailPurchaseExtractor:
                 continue
 
             if missing_fields:
-                logger.warning("Missing required field(s): %s", ", ".join(sorted(missing_fields)))
+                logger.warning("Missing required field(s): %s", ", ".join(missing_fields))
                 if self.settings.strict_validation:
                     continue
 
@@ -493,8 +987,32 @@ class EmailPurchaseExtractor:
         # Use our existing date processing
         return self._process_extracted_dates(extracted_purchases)
 
-    def _validate_purchase_data(self, purchase_data: Dict[str, Any]) -> tuple[bool, List[str]]:
-        """Validate extracted purchase data for basic sanity checks."""
+    def _validate_purchase_batch(self, purchases: List[Dict[str, Any]]) -> List[Union[PurchaseRecord, Exception]]:
+        """Validate all purchases at once, isolating per-row failures when the batch is rejected."""
+
+        try:
+            return list(_PURCHASES_ADAPTER.validate_python(purchases))
+        except ValidationError as exc:
+            logger.debug("Batch validation rejected %d purchases, validating them one by one: %s", len(purchases), exc)
+
+        outcomes: List[Union[PurchaseRecord, Exception]] = []
+        for purchase in purchases:
+            try:
+                outcomes.append(PurchaseRecord.model_validate(purchase))
+            except Exception as exc:
+                outcomes.append(exc)
+        return outcomes
+
+    def _validate_purchase_data(
+        self,
+        purchase_data: Dict[str, Any],
+        outcome: Optional[Union[PurchaseRecord, Exception]] = None,
+    ) -> tuple[bool, List[str]]:
+        """Validate extracted purchase data for basic sanity checks.
+
+        ``outcome`` is the result of a prior batched pydantic validation; when
+        omitted the record is validated here.
+        """
 
         if not purchase_data:
             return False, ["No data to validate"]
@@ -507,7 +1025,12 @@ class EmailPurchaseExtractor:
 
         try:
             # Pydantic validation handles numeric conversion and basic constraints
-            record = PurchaseRecord.model_validate(purchase_data)
+            if outcome is None:
+                record = PurchaseRecord.model_validate(purchase_data)
+            elif isinstance(outcome, Exception):
+                raise outcome
+            else:
+                record = outcome
         except (ValueError, ValidationError) as e:
             if isinstance(e, ValidationError):
                 for error in e.errors():
@@ -535,23 +1058,422 @@ class EmailPurchaseExtractor:
 
         return True, validation_errors
 
+    def classify_and_extract(
+        self,
+        email_content: str,
+        max_retries: Optional[int] = None,
+        default_timezone: str = "UTC",
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Classify and extract with a single LLM call.
+
+        Returns ``None`` when the email is not a crypto purchase, otherwise the
+        processed transactions. Emails the regex extractors can handle skip the
+        LLM call altogether.
+        """
+        self.metrics.increment("classification_total")
+        retries = max_retries if max_retries is not None else self.settings.llm_max_retries
+
+        if not self._passes_classification_preprocessing(email_content):
+            return None
+
+        regex_results = self._extract_with_regex(email_content)
+        if regex_results is not None:
+            self.metrics.increment("classification_skipped_regex")
+            return regex_results
+
+        scrubbed_content = self._scrub_pii_if_enabled(email_content)
+        prompt = self._render_prompt("classify_and_extract", scrubbed_content, default_timezone=default_timezone)
+
+        try:
+            logger.info("Submitting email for combined classification and extraction (up to %d attempts)", retries)
+            start_time = time.time()
+            result = self.llm_client.generate_json(prompt, retries=retries)
+            self._record_llm_result(result, "llm_classify_and_extract", time.time() - start_time)
+        except LLMError as exc:
+            logger.error("Failed to classify and extract email after %d attempts: %s", retries, exc)
+            self.metrics.increment("llm_calls_failed")
+            return None
+
+        if not self._interpret_classification(result.data):
+            return None
+
+        return self._combined_transactions(result.data)
+
+    def _combined_transactions(self, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Pick the transactions for a positively classified combined-call payload."""
+        self.metrics.increment("extraction_llm_success")
+        return self._interpret_extraction(payload)
+
+    def _not_classified_result(self) -> Dict[str, Any]:
+        reason = "Email did not match required keywords for crypto purchases"
+        return {
+            "has_purchase": False,
+            "purchases": [],
+            "processing_notes": [f"Email not classified as crypto purchase: {reason}"],
+            "metrics": self.metrics,
+        }
+
     def process_email(self, email_content: str) -> Dict[str, Any]:
         """Process an email to determine if it contains cryptocurrency purchase information."""
-        processing_notes: List[str] = []
+        if self.settings.enable_combined_llm_call:
+            combined = self.classify_and_extract(email_content)
+            if combined is None:
+                logger.debug("Email classified as non-crypto-purchase")
+                return self._not_classified_result()
+            return self._finalize_purchases(combined)
 
         # First check if it's likely a crypto purchase email
-        if not self.is_crypto_purchase_email(email_content):
+        self.metrics.increment("classification_total")
+        if not self._passes_classification_preprocessing(email_content):
             logger.debug("Email classified as non-crypto-purchase")
-            reason = "Email did not match required keywords for crypto purchases"
-            return {
-                "has_purchase": False,
-                "purchases": [],
-                "processing_notes": [f"Email not classified as crypto purchase: {reason}"],
-                "metrics": self.metrics,
-            }
+            return self._not_classified_result()
+
+        # A matching exchange template is a purchase; no classification call needed
+        regex_results = self._extract_with_regex(email_content)
+        if regex_results is not None:
+            self.metrics.increment("classification_skipped_regex")
+            return self._finalize_purchases(regex_results)
+
+        # Scrub once; classification and extraction share the result
+        scrubbed_content = self._scrub_pii_if_enabled(email_content)
+        if self.settings.enable_speculative_extraction:
+            speculative = self._classify_and_extract_speculatively(scrubbed_content, self.settings.llm_max_retries)
+            if speculative is None:
+                logger.debug("Email classified as non-crypto-purchase")
+                return self._not_classified_result()
+            return self._finalize_purchases(speculative)
+
+        if not self._classify_scrubbed(scrubbed_content, self.settings.llm_max_retries):
+            logger.debug("Email classified as non-crypto-purchase")
+            return self._not_classified_result()
 
         # If classified as purchase, extract the details
-        extracted_purchases = self.extract_purchase_info(email_content)
+        extracted_purchases = self._extract_with_llm(email_content, scrubbed_content=scrubbed_content)
+        return self._finalize_purchases(extracted_purchases)
+
+    def _preprocess(self, email_content: str) -> _Preprocessed:
+        """Run the LLM-free steps of :meth:`process_emails` for one email.
+
+        Returns whether the email passed the keyword pre-filters, the regex
+        extraction results (if a template matched) and otherwise the
+        PII-scrubbed content to send to the LLM.
+        """
+        self.metrics.increment("classification_total")
+        if not self._passes_classification_preprocessing(email_content):
+            return False, None, None
+
+        regex_results = self._extract_with_regex(email_content)
+        if regex_results is not None:
+            self.metrics.increment("classification_skipped_regex")
+            return True, regex_results, None
+
+        return True, None, self._scrub_pii_if_enabled(email_content)
+
+    def _preprocess_serial(self, emails: Sequence[str]) -> List[_Preprocessed]:
+        """Preprocess emails in order, running the regex extractors over all that pass the pre-filters at once."""
+        passed: List[int] = []
+        for idx, email_content in enumerate(emails):
+            self.metrics.increment("classification_total")
+            if self._passes_classification_preprocessing(email_content):
+                passed.append(idx)
+
+        preprocessed: List[_Preprocessed] = [(False, None, None)] * len(emails)
+        regex_batch = self._extract_with_regex_batch([emails[idx] for idx in passed])
+        for idx, regex_results in zip(passed, regex_batch):
+            if regex_results is not None:
+                self.metrics.increment("classification_skipped_regex")
+                preprocessed[idx] = (True, regex_results, None)
+            else:
+                preprocessed[idx] = (True, None, self._scrub_pii_if_enabled(emails[idx]))
+        return preprocessed
+
+    def _preprocess_many(self, emails: Sequence[str]) -> List[_Preprocessed]:
+        """Preprocess emails in order, across a process pool when ``preprocessing_workers`` > 1."""
+        workers = self.settings.preprocessing_workers
+        if workers <= 1 or len(emails) <= 1:
+            return self._preprocess_serial(emails)
+
+        if self._preprocess_pool is None:
+            self._preprocess_pool = ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_preprocess_worker, initargs=(self.settings,)
+            )
+
+        preprocessed: List[_Preprocessed] = []
+        chunksize = max(1, len(emails) // (workers * 4))
+        for outcome, worker_metrics in self._preprocess_pool.map(_preprocess_in_worker, emails, chunksize=chunksize):
+            self.metrics.merge(worker_metrics)
+            preprocessed.append(outcome)
+        return preprocessed
+
+    def close(self) -> None:
+        """Shut down the preprocessing process pool, if one was started."""
+        if self._preprocess_pool is not None:
+            self._preprocess_pool.shutdown()
+            self._preprocess_pool = None
+
+    def __enter__(self) -> "EmailPurchaseExtractor":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def process_emails(self, emails: Sequence[str]) -> List[Dict[str, Any]]:
+        """Process many emails at once, submitting LLM prompts in batches.
+
+        Behaves like calling :meth:`process_email` on each email, but every
+        classification (and then extraction) prompt that reaches the LLM is
+        sent through :meth:`LLMProvider.generate_json_batch` so the model server
+        can work on them concurrently. Results are returned in input order.
+        """
+        retries = self.settings.llm_max_retries
+        concurrency = max(1, self.settings.max_workers)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(emails)
+
+        # 1. Keyword pre-filtering, regex extractors and PII scrubbing, then one batched classification call
+        pending: List[int] = []
+        extracted: Dict[int, List[Dict[str, Any]]] = {}
+        scrubbed: Dict[int, str] = {}
+        for idx, (passed, regex_results, scrubbed_content) in enumerate(self._preprocess_many(emails)):
+            if not passed:
+                results[idx] = self._not_classified_result()
+            elif regex_results is not None:
+                extracted[idx] = regex_results
+            else:
+                pending.append(idx)
+                scrubbed[idx] = cast(str, scrubbed_content)
+
+        combined = self.settings.enable_combined_llm_call
+        speculative = self.settings.enable_speculative_extraction and not combined
+        # Several emails per classification prompt, when configured
+        multi_email = not (combined or speculative) and self.settings.classification_batch_size > 1
+
+        positives: List[int] = []
+        # Confident small-model decisions never reach the main LLM
+        if self.slm_client is not None and not (combined or speculative) and pending:
+            slm_prompts = [self._render_prompt("classification", scrubbed[idx]) for idx in pending]
+            logger.info("Submitting %d emails for small-model classification", len(slm_prompts))
+            start_time = time.time()
+            slm_outcomes = self.slm_client.generate_json_batch(
+                slm_prompts, model=self.settings.slm_model_name, retries=retries, max_concurrency=concurrency
+            )
+            slm_duration = (time.time() - start_time) / len(slm_prompts)
+            escalated: List[int] = []
+            for idx, outcome in zip(pending, slm_outcomes):
+                decision = self._slm_decision(outcome, slm_duration)
+                if decision is None:
+                    escalated.append(idx)
+                elif decision:
+                    positives.append(idx)
+                else:
+                    results[idx] = self._not_classified_result()
+            pending = escalated
+
+        prompts = [
+            (
+                self._render_prompt("classify_and_extract", scrubbed[idx], default_timezone="UTC")
+                if combined
+                else self._render_prompt("classification", scrubbed[idx])
+            )
+            for idx in pending
+            if not multi_email
+        ]
+        # Speculative extraction prompts ride along in the classification batch
+        if speculative:
+            prompts += [self._render_prompt("extraction", scrubbed[idx], default_timezone="UTC") for idx in pending]
+
+        payloads: Dict[int, Dict[str, Any]] = {}
+        speculated: Dict[int, Union[LLMResult, Exception]] = {}
+        duration = 0.0
+        if multi_email and pending:
+            # The small model has already seen these; fallbacks go to the main LLM only
+            decisions = self._classify_scrubbed_batch(
+                [scrubbed[idx] for idx in pending],
+                self.settings.classification_batch_size,
+                retries,
+                skip_slm=self.slm_client is not None,
+            )
+            for idx, is_purchase in zip(pending, decisions):
+                if is_purchase:
+                    positives.append(idx)
+                else:
+                    results[idx] = self._not_classified_result()
+        elif prompts:
+            logger.info("Submitting %d emails for batched classification", len(pending))
+            start_time = time.time()
+            outcomes = self.llm_client.generate_json_batch(prompts, retries=retries, max_concurrency=concurrency)
+            duration = (time.time() - start_time) / len(prompts)
+            if speculative:
+                speculated = dict(zip(pending, outcomes[len(pending) :]))
+            for idx, outcome in zip(pending, outcomes):
+                is_purchase = self._classification_outcome(
+                    outcome, "llm_classify_and_extract" if combined else "llm_classification", retries, duration
+                )
+                if not isinstance(outcome, Exception):
+                    payloads[idx] = outcome.data
+
+                if is_purchase:
+                    positives.append(idx)
+                else:
+                    results[idx] = self._not_classified_result()
+
+        # 2. One batched extraction call for the positives without a speculative result
+        needs_llm: List[int] = []
+        for idx in positives:
+            if combined:
+                extracted[idx] = self._combined_transactions(payloads[idx])
+            elif idx in speculated:
+                self.metrics.increment("extraction_llm_attempts")
+                extracted[idx] = self._extraction_outcome(speculated.pop(idx), retries, duration)
+            else:
+                needs_llm.append(idx)
+        for outcome in speculated.values():
+            self._discard_speculative_extraction(outcome, duration)
+
+        # Several emails per extraction prompt, when configured
+        if self.settings.extraction_batch_size > 1 and needs_llm:
+            batched = self._extract_scrubbed_batch(
+                [scrubbed[idx] for idx in needs_llm], self.settings.extraction_batch_size, retries, "UTC"
+            )
+            extracted.update(zip(needs_llm, batched))
+            needs_llm = []
+
+        prompts = [self._render_prompt("extraction", scrubbed[idx], default_timezone="UTC") for idx in needs_llm]
+        if prompts:
+            logger.info("Submitting %d emails for batched purchase extraction", len(prompts))
+            self.metrics.increment("extraction_llm_attempts", len(prompts))
+            start_time = time.time()
+            outcomes = self.llm_client.generate_json_batch(prompts, retries=retries, max_concurrency=concurrency)
+            duration = (time.time() - start_time) / len(prompts)
+            for idx, outcome in zip(needs_llm, outcomes):
+                extracted[idx] = self._extraction_outcome(outcome, retries, duration)
+
+        # 3. Validation and enrichment
+        for idx, purchases in extracted.items():
+            results[idx] = self._finalize_purchases(purchases)
+
+        # Every email is either rejected, regex-extracted or classified positive, so each slot is filled
+        assert all(result is not None for result in results)
+        return cast(List[Dict[str, Any]], results)
+
+    async def aprocess_emails(
+        self, emails: Sequence[str], max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Process emails concurrently from async code, returning results in input order.
+
+        Behaves like calling :meth:`process_email` on each email, but the LLM
+        calls are awaited through :meth:`LLMProvider.agenerate_json`, with at
+        most ``max_concurrency`` (default: ``settings.max_workers``) emails in
+        flight so the model server's parallelism (``OLLAMA_NUM_PARALLEL``) is
+        not oversubscribed.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.settings.max_workers))
+
+        async def _process(email_content: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._aprocess_email(email_content)
+
+        return list(await asyncio.gather(*(_process(email_content) for email_content in emails)))
+
+    async def _aprocess_email(self, email_content: str) -> Dict[str, Any]:
+        """Async counterpart of :meth:`process_email` for :meth:`aprocess_emails`."""
+        retries = self.settings.llm_max_retries
+        combined = self.settings.enable_combined_llm_call
+        # Keyword filters, regex extractors and scrubbing hold the GIL; keep them off the event loop
+        passed, regex_results, scrubbed_content = await asyncio.to_thread(self._preprocess, email_content)
+        if not passed:
+            logger.debug("Email classified as non-crypto-purchase")
+            return self._not_classified_result()
+        if regex_results is not None:
+            return await asyncio.to_thread(self._finalize_purchases, regex_results)
+        scrubbed = cast(str, scrubbed_content)
+
+        purchases: Optional[List[Dict[str, Any]]]
+        if combined:
+            purchases = None
+            prompt = self._render_prompt("classify_and_extract", scrubbed, default_timezone="UTC")
+            outcome, duration = await self._agenerate(self.llm_client, prompt, retries)
+            if self._classification_outcome(outcome, "llm_classify_and_extract", retries, duration):
+                purchases = self._combined_transactions(cast(LLMResult, outcome).data)
+        elif self.settings.enable_speculative_extraction:
+            (classification, duration), (extraction, _) = await asyncio.gather(
+                self._agenerate(self.llm_client, self._render_prompt("classification", scrubbed), retries),
+                self._agenerate(
+                    self.llm_client, self._render_prompt("extraction", scrubbed, default_timezone="UTC"), retries
+                ),
+            )
+            purchases = self._speculative_outcome(classification, extraction, retries, duration)
+        else:
+            purchases = await self._aclassify_then_extract(scrubbed, retries)
+
+        if purchases is None:
+            logger.debug("Email classified as non-crypto-purchase")
+            return self._not_classified_result()
+        return await asyncio.to_thread(self._finalize_purchases, purchases)
+
+    async def _aclassify_then_extract(self, scrubbed_content: str, retries: int) -> Optional[List[Dict[str, Any]]]:
+        """Classify (small model first, when configured) and then extract, awaiting each LLM call."""
+        prompt = self._render_prompt("classification", scrubbed_content)
+        decision: Optional[bool] = None
+        if self.slm_client is not None:
+            outcome, duration = await self._agenerate(
+                self.slm_client, prompt, retries, model=self.settings.slm_model_name
+            )
+            decision = self._slm_decision(outcome, duration)
+        if decision is None:
+            outcome, duration = await self._agenerate(self.llm_client, prompt, retries)
+            decision = self._classification_outcome(outcome, "llm_classification", retries, duration)
+        if not decision:
+            return None
+
+        self.metrics.increment("extraction_llm_attempts")
+        prompt = self._render_prompt("extraction", scrubbed_content, default_timezone="UTC")
+        outcome, duration = await self._agenerate(self.llm_client, prompt, retries)
+        return self._extraction_outcome(outcome, retries, duration)
+
+    @staticmethod
+    async def _agenerate(
+        client: LLMProvider, prompt: str, retries: int, model: Optional[str] = None
+    ) -> Tuple[Union[LLMResult, Exception], float]:
+        """Await one JSON generation, returning the result (or the raised exception) and its duration."""
+        start_time = time.time()
+        try:
+            outcome: Union[LLMResult, Exception] = await client.agenerate_json(prompt, model=model, retries=retries)
+        except Exception as exc:
+            outcome = exc
+        return outcome, time.time() - start_time
+
+    def _classification_outcome(
+        self, outcome: Union[LLMResult, Exception], latency_name: str, retries: int, duration: float
+    ) -> bool:
+        """Record a main-LLM classification result (or its failure) and return whether it is a purchase."""
+        if isinstance(outcome, Exception):
+            logger.error("Failed to categorize email after %d attempts: %s", retries, outcome)
+            self.metrics.increment("llm_calls_failed")
+            return False
+
+        self._record_llm_result(outcome, latency_name, duration)
+        return self._interpret_classification(outcome.data)
+
+    def _convert_to_base_currency(self, purchase_info: Dict[str, Any], record: PurchaseRecord) -> Optional[Decimal]:
+        """Convert a purchase to the base fiat currency, reusing the record's validated Decimal."""
+        if not (self.settings.enable_currency_conversion and record.total_spent and purchase_info.get("currency")):
+            return None
+
+        from_curr = purchase_info["currency"]
+        to_curr = self.settings.base_fiat_currency
+        rate = fx_service.get_rate(purchase_info.get("purchase_date", ""), from_curr, to_curr)
+        if not rate:
+            return None
+
+        base_amount = record.total_spent * rate
+        logger.info(f"Converted {record.total_spent} {from_curr} to {base_amount} {to_curr}")
+        return base_amount
+
+    def _finalize_purchases(self, extracted_purchases: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Enrich, validate and package extracted purchases into a processing result."""
+        processing_notes: List[str] = []
 
         if not extracted_purchases:
             logger.warning("Failed to extract purchase information despite positive classification")
@@ -564,32 +1486,25 @@ class EmailPurchaseExtractor:
                 "metrics": self.metrics,
             }
 
-        validated_purchases = []
+        enriched_purchases = []
         for purchase_info in extracted_purchases:
             try:
                 # 1. Populate asset_id if not already present
                 if not purchase_info.get("asset_id") and purchase_info.get("item_name"):
                     purchase_info["asset_id"] = asset_mapper.get_asset_id(purchase_info["item_name"])
 
-                # 2. Perform currency conversion if enabled
-                if (
-                    self.settings.enable_currency_conversion
-                    and purchase_info.get("total_spent")
-                    and purchase_info.get("currency")
-                ):
-                    from_curr = purchase_info["currency"]
-                    to_curr = self.settings.base_fiat_currency
-                    p_date = purchase_info.get("purchase_date", "")
-
-                    rate = fx_service.get_rate(p_date, from_curr, to_curr)
-                    if rate:
-                        # Use Decimal for calculation
-                        base_amount = Decimal(str(purchase_info["total_spent"])) * rate
-                        purchase_info["fiat_amount_base"] = base_amount
-                        logger.info(f"Converted {purchase_info['total_spent']} {from_curr} to {base_amount} {to_curr}")
-
-                # 3. Validate the extracted data (includes Pydantic validation)
-                is_valid, validation_issues = self._validate_purchase_data(purchase_info)
+                enriched_purchases.append(purchase_info)
+            except Exception as e:
+                logger.warning("Error processing extracted purchase: %s", e)
+                processing_notes.append(f"Error processing extracted purchase: {e}")
+
+        # 2. Validate every purchase with one pydantic pass
+        outcomes = self._validate_purchase_batch(enriched_purchases)
+
+        validated_purchases = []
+        for purchase_info, outcome in zip(enriched_purchases, outcomes):
+            try:
+                is_valid, validation_issues = self._validate_purchase_data(purchase_info, outcome)
                 if not is_valid:
                     logger.warning("Extracted purchase data failed validation")
                     reason = "; ".join(validation_issues)
@@ -598,8 +1513,11 @@ class EmailPurchaseExtractor:
                     )
                     continue
 
-                # 4. Create a PurchaseRecord for confidence calculation and type normalization
-                purchase_record = PurchaseRecord.model_validate(purchase_info)
+                # 3. Reuse the validated PurchaseRecord for conversion, confidence and type normalization
+                if isinstance(outcome, Exception):
+                    raise outcome
+                purchase_record = outcome
+                base_amount = self._convert_to_base_currency(purchase_info, purchase_record)
 
                 # Calculate and update the confidence score
                 purchase_info["confidence"] = calculate_confidence(purchase_record)
@@ -611,8 +1529,10 @@ class EmailPurchaseExtractor:
                     purchase_info["total_spent"] = float(purchase_record.total_spent)
                 if purchase_record.fee_amount is not None:
                     purchase_info["fee_amount"] = float(purchase_record.fee_amount)
-                if purchase_record.fiat_amount_base is not None:
-                    purchase_info["fiat_amount_base"] = float(purchase_record.fiat_amount_base)
+                if base_amount is None:
+                    base_amount = purchase_record.fiat_amount_base
+                if base_amount is not None:
+                    purchase_info["fiat_amount_base"] = float(base_amount)
 
                 purchase_info["transaction_type"] = purchase_record.transaction_type
                 validated_purchases.append(purchase_info)
@@ -637,3 +1557,22 @@ class EmailPurchaseExtractor:
             "processing_notes": processing_notes,
             "metrics": self.metrics,
         }
+
+
+# Per-process extractor used when process_emails preprocesses in a process pool
+_preprocess_extractor: Optional[EmailPurchaseExtractor] = None
+
+
+def _init_preprocess_worker(settings: HarvesterSettings) -> None:
+    """Initialize a preprocessing worker; it never calls an LLM, so it gets no clients."""
+    global _preprocess_extractor
+    _preprocess_extractor = EmailPurchaseExtractor(
+        settings=settings, llm_client=cast(LLMProvider, None), enable_slm=False
+    )
+
+
+def _preprocess_in_worker(email_content: str) -> Tuple[_Preprocessed, MetricsTracker]:
+    """Preprocess one email in a worker, returning its outcome and the metrics it recorded."""
+    extractor = cast(EmailPurchaseExtractor, _preprocess_extractor)
+    extractor.metrics = MetricsTracker()
+    return extractor._preprocess(email_content), extractor.metrics
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, cast
 
 from .base import BaseExtractor
 from .binance import BinanceExtractor
@@ -41,6 +44,50 @@ class ExtractorRegistry:
             BitfinexExtractor(),
         ]
 
+        # Sender-domain dispatch: one scan of the sender finds every extractor
+        # whose domain gate can pass, instead of calling each can_handle()
+        self._by_domain: Dict[str, List[BaseExtractor]] = {}
+        for extractor in self.extractors:
+            for domain in extractor.sender_domains:
+                self._by_domain.setdefault(domain, []).append(extractor)
+        # A lookahead so that overlapping domains are all found
+        self._domain_pattern = re.compile(
+            "(?=(" + "|".join(re.escape(domain) for domain in sorted(self._by_domain, key=len, reverse=True)) + "))"
+        )
+
+    def _candidates(self, sender: str) -> List[BaseExtractor]:
+        """Return the extractors that may handle mail from ``sender``, in registration order."""
+        if not self._by_domain:
+            return self.extractors
+        return self._select(set(self._domain_pattern.findall(sender.lower())))
+
+    def _candidates_batch(self, senders: Sequence[str]) -> List[List[BaseExtractor]]:
+        """Like :meth:`_candidates` for many senders, with one domain scan over all of them.
+
+        The lower-cased senders are joined with NULs, which no domain contains,
+        and each match is attributed to its sender by offset.
+        """
+        if not self._by_domain:
+            return [self.extractors] * len(senders)
+        lowered = [sender.lower() for sender in senders]
+        starts: List[int] = []
+        offset = 0
+        for sender in lowered:
+            starts.append(offset)
+            offset += len(sender) + 1
+        matched: List[Set[str]] = [set() for _ in lowered]
+        for match in self._domain_pattern.finditer("\0".join(lowered)):
+            matched[bisect_right(starts, match.start()) - 1].add(match.group(1))
+        return [self._select(domains) for domains in matched]
+
+    def _select(self, domains: Set[str]) -> List[BaseExtractor]:
+        """Return the extractors whose domain gate passes for a sender containing ``domains``."""
+        return [
+            extractor
+            for extractor in self.extractors
+            if not extractor.sender_domains or domains.intersection(extractor.sender_domains)
+        ]
+
     def extract(self, subject: str, sender: str, body: str) -> Optional[List[Dict[str, Any]]]:
         """Attempt to extract data using registered specialized extractors."""
         # Try new template-based parser registry first
@@ -49,7 +96,13 @@ class ExtractorRegistry:
             return results
 
         # Fallback to legacy extractors
-        for extractor in self.extractors:
+        return self._extract_with(self._candidates(sender), subject, sender, body)
+
+    def _extract_with(
+        self, candidates: List[BaseExtractor], subject: str, sender: str, body: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Run the legacy extractors in ``candidates`` until one returns results."""
+        for extractor in candidates:
             if extractor.can_handle(subject, sender, body):
                 try:
                     results = extractor.extract(subject, sender, body)
@@ -60,10 +113,44 @@ class ExtractorRegistry:
                     continue
         return None
 
+    def extract_batch(
+        self, emails: Sequence[Tuple[str, str, str]], workers: int = 1, chunksize: int = 64
+    ) -> List[Optional[List[Dict[str, Any]]]]:
+        """Run :meth:`extract` over many ``(subject, sender, body)`` rows, in input order.
+
+        Regex matching holds the GIL, so with ``workers`` > 1 the rows are
+        spread over a process pool in chunks of ``chunksize`` to amortize IPC.
+        """
+        if workers <= 1 or len(emails) <= 1:
+            results: List[Optional[List[Dict[str, Any]]]] = []
+            candidates = self._candidates_batch([sender for _, sender, _ in emails])
+            for (subject, sender, body), extractors in zip(emails, candidates):
+                found = parser_registry.extract(subject, sender, body)
+                results.append(found or self._extract_with(extractors, subject, sender, body))
+            return results
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_extract_worker, initargs=(self,)) as pool:
+            return list(pool.map(_extract_in_worker, emails, chunksize=max(1, chunksize)))
+
 
 # Global registry instance
 registry = ExtractorRegistry()
 
+# Per-process registry for extract_batch workers
+_worker_registry: Optional[ExtractorRegistry] = None
+
+
+def _init_extract_worker(worker_registry: ExtractorRegistry) -> None:
+    """Install the registry a worker process extracts with."""
+    global _worker_registry
+    _worker_registry = worker_registry
+
+
+def _extract_in_worker(row: Tuple[str, str, str]) -> Optional[List[Dict[str, Any]]]:
+    """Extract one ``(subject, sender, body)`` row in a worker process."""
+    return cast(ExtractorRegistry, _worker_registry).extract(*row)
+
+
 __all__ = [
     "BaseExtractor",
     "CoinbaseExtractor",
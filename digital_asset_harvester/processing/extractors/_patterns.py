@@ -0,0 +1,37 @@
+"""Regex patterns and lookup tables shared by several exchange extractors."""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+
+import regex as re
+
+# Currency for a leading price symbol, for emails that give no currency code.
+# Read-only views, since every extractor shares them.
+SYMBOL_MAP = MappingProxyType({"$": "USD", "€": "EUR", "£": "GBP", "¥": "JPY", "A$": "AUD"})
+# Australian exchanges quote "$" prices in Australian dollars
+SYMBOL_MAP_AUD_DEFAULT = MappingProxyType({**SYMBOL_MAP, "$": "AUD"})
+
+
+def buy_sentence_re(
+    verbs: str, *, asset: str = r"[A-Z]{3,5}", symbols: str = "$€£¥", filled_at: bool = False
+) -> re.Pattern:
+    """Compile an exchange's "<verb> <amount> <asset> for [<symbol>]<total> [<code>]" buy sentence.
+
+    Exchanges word these sentences differently, so each extractor builds its own
+    from its ``verbs`` alternation, ``asset`` character class and price
+    ``symbols``. Every pattern has the groups ``amt``, ``sym``, ``via``, ``csym``,
+    ``tot`` and ``ccode``. Only with ``filled_at`` does ``via`` also accept "has
+    been filled at", which makes ``tot`` a unit price rather than a total.
+
+    The quantifiers are possessive. Neighbouring tokens never share characters,
+    so giving some back could not produce a match, and a crafted body cannot
+    make the engine retry them.
+    """
+    via = "for|has been filled at" if filled_at else "for"
+    # ``asset`` is a quantified class such as "[A-Z]{3,5}"; the "+" after it makes it possessive
+    return re.compile(
+        rf"(?:{verbs})\s++(?P<amt>[\d,.]++)\s++(?P<sym>{asset}+)"
+        rf"\s++(?P<via>{via})\s++(?P<csym>[{symbols}])?+(?P<tot>[\d,.]++)\s*+(?P<ccode>[A-Z]{{3}})?",
+        re.IGNORECASE,
+    )
@@ -4,25 +4,125 @@ from __future__ import annotations
 
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from decimal import Decimal
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import regex
+
+_NO_COMMA = str.maketrans("", "", ",")
 
 
 class BaseExtractor(ABC):
     """Abstract base class for specialized extractors."""
 
-    @abstractmethod
+    # Lower-case substrings one of which ``can_handle`` requires in the sender.
+    # The registry uses them to skip extractors for other exchanges; leave
+    # empty to be consulted for every email.
+    sender_domains: Tuple[str, ...] = ()
+    # Lower-case subject phrases, one of which the default ``can_handle``
+    # requires; leave empty to accept any subject from the exchange.
+    subject_keywords: Tuple[str, ...] = ()
+    # Lower-case sender substrings (display names) that vouch for any subject.
+    sender_names: Tuple[str, ...] = ()
+
+    # (text, pattern, group, lowered, result) of the most recent _find_match call
+    _last_find: Optional[Tuple[str, Any, int, bool, Optional[str]]] = None
+
     def can_handle(self, subject: str, sender: str, body: str) -> bool:
-        """Check if this extractor can handle the given email."""
-        raise NotImplementedError
+        """Check if this extractor can handle the given email.
+
+        The default checks the class's ``sender_domains``, ``sender_names``
+        and ``subject_keywords``. Override it for anything more involved,
+        and in extractors that declare no ``sender_domains``.
+        """
+        sender_lower = sender.lower()
+        if not any(domain in sender_lower for domain in self.sender_domains):
+            return False
+        if not self.subject_keywords or any(name in sender_lower for name in self.sender_names):
+            return True
+
+        subject_lower = subject.lower()
+        return any(keyword in subject_lower for keyword in self.subject_keywords)
 
     @abstractmethod
     def extract(self, subject: str, sender: str, body: str) -> List[Dict[str, Any]]:
         """Extract purchase information from the email."""
         raise NotImplementedError
 
-    def _find_match(self, pattern: str | re.Pattern, text: str, group: int = 1) -> Optional[str]:
-        """Helper to find a single match in text."""
-        match = re.search(pattern, text, re.IGNORECASE)
+    @staticmethod
+    def _parse_decimal(value: str) -> Decimal:
+        """Parse a number such as ``"5,000.00"``, dropping thousands separators.
+
+        Raises ``decimal.InvalidOperation`` for text that is not a number.
+        """
+        return Decimal(value.translate(_NO_COMMA))
+
+    def _extract_buys(
+        self,
+        body: str,
+        *,
+        pattern: re.Pattern,
+        vendor: str,
+        default_currency: str,
+        symbol_map: Mapping[str, str],
+        txn_id_pattern: re.Pattern,
+    ) -> List[Dict[str, Any]]:
+        """Build a purchase for every match of the :func:`buy_sentence_re` ``pattern`` in ``body``.
+
+        Without a currency code the price symbol is looked up in ``symbol_map``,
+        falling back to ``default_currency``. ``txn_id_pattern`` is a lower-case
+        pattern for :meth:`_find_match` with ``lowered``.
+        """
+        purchases = []
+        for match in pattern.finditer(body):
+            currency = match.group("ccode")
+            if not currency:
+                currency = symbol_map.get(match.group("csym"), default_currency)
+
+            purchases.append(
+                {
+                    "amount": match.group("amt").replace(",", ""),
+                    "item_name": match.group("sym").upper(),
+                    "total_spent": match.group("tot").replace(",", ""),
+                    "currency": currency,
+                    "vendor": vendor,
+                    "transaction_id": self._find_match(txn_id_pattern, body, lowered=True),
+                    "extraction_method": "regex",
+                }
+            )
+        return purchases
+
+    def _find_match(
+        self, pattern: str | re.Pattern, text: str, group: int = 1, *, lowered: bool = False
+    ) -> Optional[str]:
+        """Helper to find a single match in text.
+
+        Precompiled patterns, from ``re`` or ``regex``, are used as-is with
+        their own flags; strings are compiled case-insensitively. Extractors
+        look up the same reference for every purchase in a body, so the last
+        lookup is reused while ``text`` is the very same string object.
+
+        With ``lowered``, ``pattern`` is a lower-case, case-sensitive pattern
+        searched in ``text.lower()``, which keeps the engine's fast literal
+        scan that ``re.IGNORECASE`` turns off; the capture keeps its case.
+        """
+        last = self._last_find
+        if last is not None and last[0] is text and last[1] is pattern and last[2] == group and last[3] is lowered:
+            return last[4]
+        if lowered:
+            result = self._search_group_lowered(pattern, text, group)
+        else:
+            result = self._search_group(pattern, text, group)
+        # The reference to ``text`` keeps it alive, so ``is`` never matches a different body
+        self._last_find = (text, pattern, group, lowered, result)
+        return result
+
+    @staticmethod
+    def _search_group(pattern: str | re.Pattern, text: str, group: int) -> Optional[str]:
+        if isinstance(pattern, str):
+            match = re.search(pattern, text, re.IGNORECASE)
+        else:
+            match = pattern.search(text)
         if match:
             try:
                 return match.group(group).strip()
@@ -30,6 +130,46 @@ class BaseExtractor(ABC):
                 return None
         return None
 
+    @staticmethod
+    def _search_group_lowered(pattern: str | re.Pattern, text: str, group: int) -> Optional[str]:
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Lower-casing changed some character's length, so offsets no longer line up
+            if isinstance(pattern, str):
+                return BaseExtractor._search_group(pattern, text, group)
+            engine = re if isinstance(pattern, re.Pattern) else regex
+            return BaseExtractor._search_group(engine.compile(pattern.pattern, engine.IGNORECASE), text, group)
+        match = re.search(pattern, lowered) if isinstance(pattern, str) else pattern.search(lowered)
+        if match:
+            try:
+                start, end = match.span(group)
+            except IndexError:
+                return None
+            if start < 0:
+                return None
+            return text[start:end].strip()
+        return None
+
+    @staticmethod
+    def _first_matches(pattern: re.Pattern, text: str, names: Tuple[str, ...]) -> Dict[str, re.Match]:
+        """Scan ``text`` once for a pattern of named alternatives, keeping each one's first match.
+
+        Results are keyed by the alternative's group name (``Match.lastgroup``),
+        and the scan stops once every name in ``names`` has been seen. Wrap each
+        alternative in a lookahead, ``(?=(?P<name>...))``, so that one match
+        cannot consume text another alternative starts in; each name then gets
+        the same match a separate ``search`` would have found.
+        """
+        found: Dict[str, re.Match] = {}
+        for match in pattern.finditer(text):
+            if match.lastgroup is not None:
+                found.setdefault(match.lastgroup, match)
+            if len(found) == len(names):
+                break
+        return found
+
     def _find_all_matches(self, pattern: str | re.Pattern, text: str) -> List[re.Match]:
         """Helper to find all matches in text."""
-        return list(re.finditer(pattern, text, re.IGNORECASE))
+        if isinstance(pattern, str):
+            return list(re.finditer(pattern, text, re.IGNORECASE))
+        return list(pattern.finditer(text))
@@ -12,6 +12,8 @@ from digital_asset_harvester.parsers.engine import TemplateEngine
 class BinanceExtractor(BaseExtractor):
     """Extractor for Binance trade confirmation emails."""
 
+    sender_domains = ("binance.com",)
+
     def __init__(self):
         self.engine = TemplateEngine(BINANCE_TEMPLATE)
 
@@ -8,28 +8,23 @@ from typing import Any, Dict, List
 
 from .base import BaseExtractor
 
+# Pattern: "Exchange Trade Execution - BUY 0.5 ETH @ 2500.0 USD on ETH/USD"
+# Often in the subject or body
+_TRADE_RE = re.compile(r"(BUY|SELL)\s+([\d,.]+)\s+([A-Z]{3,5})\s+@\s+([\d,.]+)\s+([A-Z]{3,5})", re.IGNORECASE)
+_ORDER_ID_RE = re.compile(r"order\s*id\s*:?\s*(\d+)")
+
 
 class BitfinexExtractor(BaseExtractor):
     """Extractor for Bitfinex trade execution emails."""
 
-    def can_handle(self, subject: str, sender: str, body: str) -> bool:
-        """Check if this is a Bitfinex email."""
-        sender_lower = sender.lower()
-        if "bitfinex.com" not in sender_lower:
-            return False
-
-        subject_lower = subject.lower()
-        return "trade execution" in subject_lower
+    sender_domains = ("bitfinex.com",)
+    subject_keywords = ("trade execution",)
 
     def extract(self, subject: str, sender: str, body: str) -> List[Dict[str, Any]]:
         """Extract data from Bitfinex email."""
         purchases = []
 
-        # Pattern: "Exchange Trade Execution - BUY 0.5 ETH @ 2500.0 USD on ETH/USD"
-        # Often in the subject or body
-        pattern = r"(BUY|SELL)\s+([\d,.]+)\s+([A-Z]{3,5})\s+@\s+([\d,.]+)\s+([A-Z]{3,5})"
-
-        match = re.search(pattern, body if body else subject, re.IGNORECASE)
+        match = _TRADE_RE.search(body if body else subject)
         if match:
             action = match.group(1).upper()
             amount = match.group(2).replace(",", "")
@@ -48,7 +43,7 @@ class BitfinexExtractor(BaseExtractor):
                     "currency": currency,
                     "vendor": "Bitfinex",
                     "transaction_type": tx_type,
-                    "transaction_id": self._find_match(r"Order\s*ID\s*:?\s*(\d+)", body),
+                    "transaction_id": self._find_match(_ORDER_ID_RE, body, lowered=True),
                     "extraction_method": "regex",
                     "confidence": 0.98,
                 }
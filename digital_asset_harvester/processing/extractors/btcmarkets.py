@@ -3,50 +3,37 @@
 from __future__ import annotations
 
 import re
+from decimal import InvalidOperation
 from typing import Any, Dict, List
 
+from ._patterns import SYMBOL_MAP_AUD_DEFAULT, buy_sentence_re
 from .base import BaseExtractor
 
+# "Your buy order for 0.05 BTC has been filled at $60,000.00 AUD" / "You bought 0.05 BTC for $3,000.00 AUD"
+_PURCHASE_RE = buy_sentence_re("order for|bought", filled_at=True)
+_ORDER_ID_RE = re.compile(r"order\s*id\s*:?\s*([a-z0-9\-]+)")
+
 
 class BTCMarketsExtractor(BaseExtractor):
     """Extractor for BTCMarkets trade confirmation emails."""
 
-    def can_handle(self, subject: str, sender: str, body: str) -> bool:
-        """Check if this is a BTCMarkets email."""
-        sender_lower = sender.lower()
-        if "btcmarkets.net" not in sender_lower:
-            return False
-
-        subject_lower = subject.lower()
-        patterns = [
-            r"buy order filled",
-            r"trade confirmation",
-            r"order processed",
-        ]
-        return any(re.search(p, subject_lower) for p in patterns) or "btc markets" in sender_lower
+    sender_domains = ("btcmarkets.net",)
+    subject_keywords = ("buy order filled", "trade confirmation", "order processed")
+    sender_names = ("btc markets",)
 
     def extract(self, subject: str, sender: str, body: str) -> List[Dict[str, Any]]:
         """Extract data from BTCMarkets email."""
         purchases = []
 
-        # Pattern: "Your buy order for 0.05 BTC has been filled at $60,000.00 AUD"
-        # Or: "Bought 0.05 BTC for 3,000 AUD"
-        pattern = r"(?:order for|bought)\s+([\d,.]+)\s+([A-Z]{3,5})\s+(?P<type>has been filled at|for)\s+([$€£¥])?([\d,.]+)\s*([A-Z]{3})?"
-
-        for match in re.finditer(pattern, body, re.IGNORECASE):
-            amount_str = match.group(1).replace(",", "")
-            crypto = match.group(2).upper()
-            value_str = match.group(5).replace(",", "")
-            currency = match.group(6) or "AUD"  # Default to AUD for BTCMarkets
-            match_type = match.group("type").lower()
-
-            if not match.group(6) and match.group(4):
-                symbol_map = {"$": "AUD", "€": "EUR", "£": "GBP", "¥": "JPY"}
-                currency = symbol_map.get(match.group(4), "AUD")
+        for match in _PURCHASE_RE.finditer(body):
+            crypto = match.group("sym").upper()
+            # Default to AUD for BTCMarkets
+            currency = match.group("ccode") or SYMBOL_MAP_AUD_DEFAULT.get(match.group("csym"), "AUD")
+            match_type = match.group("via").lower()
 
             try:
-                amount = float(amount_str)
-                value = float(value_str)
+                amount = self._parse_decimal(match.group("amt"))
+                value = self._parse_decimal(match.group("tot"))
 
                 if "at" in match_type:
                     # Value is price per unit
@@ -55,18 +42,19 @@ class BTCMarketsExtractor(BaseExtractor):
                     # Value is total spent
                     total_spent = value
 
+                # The product is exact in Decimal; records keep their float-style strings ("3000.0")
                 purchases.append(
                     {
-                        "amount": str(amount),
+                        "amount": str(float(amount)),
                         "item_name": crypto,
-                        "total_spent": str(total_spent),
+                        "total_spent": str(float(total_spent)),
                         "currency": currency,
                         "vendor": "BTCMarkets",
-                        "transaction_id": self._find_match(r"Order\s*ID\s*:?\s*([A-Z0-9\-]+)", body),
+                        "transaction_id": self._find_match(_ORDER_ID_RE, body, lowered=True),
                         "extraction_method": "regex",
                     }
                 )
-            except (ValueError, TypeError):
+            except InvalidOperation:
                 continue
 
         return purchases
@@ -12,6 +12,8 @@ from digital_asset_harvester.parsers.engine import TemplateEngine
 class CoinbaseExtractor(BaseExtractor):
     """Extractor for Coinbase purchase confirmation emails."""
 
+    sender_domains = ("coinbase.com",)
+
     def __init__(self):
         self.engine = TemplateEngine(COINBASE_TEMPLATE)
 
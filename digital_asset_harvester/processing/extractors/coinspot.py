@@ -5,35 +5,31 @@ from __future__ import annotations
 import re
 from typing import Any, Dict, List
 
+from ._patterns import SYMBOL_MAP, buy_sentence_re
 from .base import BaseExtractor
 
+# "You have successfully purchased 50 ADA for $25.00 AUD."
+_PURCHASE_RE = buy_sentence_re("purchased", asset="[A-Z0-9]+")
+_REFERENCE_RE = re.compile(r"reference:\s*([a-z0-9\-]+)")
+
 
 class CoinSpotExtractor(BaseExtractor):
     """Extractor for CoinSpot purchase confirmation emails."""
 
-    def can_handle(self, subject: str, sender: str, body: str) -> bool:
-        """Check if this is a CoinSpot email."""
-        # We consider any email from coinspot.com as potentially handleable.
-        # The extract() method will then attempt to find purchase details.
-        return "coinspot.com" in sender.lower()
+    sender_domains = ("coinspot.com",)
 
     def extract(self, subject: str, sender: str, body: str) -> List[Dict[str, Any]]:
         """Extract data from CoinSpot email."""
         purchases = []
 
-        # CoinSpot pattern: "You have successfully purchased 50 ADA for $25.00 AUD."
-        # Pattern: purchased ([\d,.]+) ([A-Z0-9]+) for ([$€£¥])?([\d,.]+) ([A-Z]{3})?
-        pattern = r"purchased\s+([\d,.]+)\s+([A-Z0-9]+)\s+for\s+([$€£¥])?([\d,.]+)\s*([A-Z]{3})?"
-
-        for match in re.finditer(pattern, body, re.IGNORECASE):
-            amount = match.group(1).replace(",", "")
-            crypto = match.group(2).upper()
-            total_spent = match.group(4).replace(",", "")
+        for match in _PURCHASE_RE.finditer(body):
+            amount = match.group("amt").replace(",", "")
+            crypto = match.group("sym").upper()
+            total_spent = match.group("tot").replace(",", "")
 
-            currency = match.group(5)
-            if not currency and match.group(3):
-                symbol_map = {"$": "USD", "€": "EUR", "£": "GBP", "¥": "JPY", "A$": "AUD"}
-                currency = symbol_map.get(match.group(3), "USD")
+            currency = match.group("ccode")
+            if not currency and match.group("csym"):
+                currency = SYMBOL_MAP.get(match.group("csym"), "USD")
             if not currency:
                 currency = "AUD"  # CoinSpot is Australian
 
@@ -45,7 +41,7 @@ class CoinSpotExtractor(BaseExtractor):
         self, amount: str, crypto: str, total_spent: str | None, currency: str, body: str
     ) -> Dict[str, Any]:
         # Extract Reference: CS-20240115-001
-        txn_id = self._find_match(r"Reference:\s*([A-Z0-9\-]+)", body)
+        txn_id = self._find_match(_REFERENCE_RE, body, lowered=True)
 
         return {
             "amount": amount,
@@ -5,58 +5,56 @@ from __future__ import annotations
 import re
 from typing import Any, Dict, List
 
+from ._patterns import SYMBOL_MAP
 from .base import BaseExtractor
 
+# "Your market order to buy 2.5 SOL has been filled at a price of $25.00 per SOL." / "Total cost: $62.50 USD."
+# One scan finds the bought amount, the total and the order number. Each alternative
+# sits in a lookahead so it consumes nothing and cannot swallow the start of another
+_COMBINED_RE = re.compile(
+    r"(?=(?P<buy>buy\s+(?P<amount>[\d,.]+)\s+(?P<crypto>[A-Z]{3,5})))"
+    r"|(?=(?P<total>Total cost:\s*(?P<symbol>[$€£¥])?(?P<spent>[\d,.]+)\s*(?P<code>[A-Z]{3})?))"
+    r"|(?=(?P<order>order\s+#?(?P<order_id>[A-Z0-9\-]+)))",
+    re.IGNORECASE,
+)
+_GROUPS = ("buy", "total", "order")
+
 
 class CryptocomExtractor(BaseExtractor):
     """Extractor for Crypto.com purchase confirmation emails."""
 
-    def can_handle(self, subject: str, sender: str, body: str) -> bool:
-        """Check if this is a Crypto.com email."""
-        sender_lower = sender.lower()
-        if "crypto.com" not in sender_lower:
-            return False
-
-        subject_lower = subject.lower()
-        patterns = [
-            r"order",
-            r"executed",
-            r"buy",
-            r"filled",
-        ]
-        return any(re.search(p, subject_lower) for p in patterns)
+    sender_domains = ("crypto.com",)
+    subject_keywords = ("order", "executed", "buy", "filled")
 
     def extract(self, subject: str, sender: str, body: str) -> List[Dict[str, Any]]:
         """Extract data from Crypto.com email."""
-        purchases = []
+        purchases: List[Dict[str, Any]] = []
 
-        # Crypto.com pattern: "Your market order to buy 2.5 SOL has been filled at a price of $25.00 per SOL."
-        # "Total cost: $62.50 USD."
-        amount_match = re.search(r"buy\s+([\d,.]+)\s+([A-Z]{3,5})", body, re.IGNORECASE)
-        total_match = re.search(r"Total cost:\s*([$€£¥])?([\d,.]+)\s*([A-Z]{3})?", body, re.IGNORECASE)
+        # The one scan also stands in for a "Total cost:" prefilter: without that line there is no purchase
+        found = self._first_matches(_COMBINED_RE, body, _GROUPS)
+        amount_match = found.get("buy")
+        total_match = found.get("total")
 
         if amount_match and total_match:
-            amount = amount_match.group(1).replace(",", "")
-            crypto = amount_match.group(2).upper()
-            total_spent = total_match.group(2).replace(",", "")
+            amount = amount_match.group("amount").replace(",", "")
+            crypto = amount_match.group("crypto").upper()
+            total_spent = total_match.group("spent").replace(",", "")
 
-            currency = total_match.group(3)
-            if not currency and total_match.group(1):
-                symbol_map = {"$": "USD", "€": "EUR", "£": "GBP", "¥": "JPY"}
-                currency = symbol_map.get(total_match.group(1), "USD")
+            currency = total_match.group("code")
+            if not currency and total_match.group("symbol"):
+                currency = SYMBOL_MAP.get(total_match.group("symbol"), "USD")
             if not currency:
                 currency = "USD"
 
-            purchases.append(self._create_purchase_dict(amount, crypto, total_spent, currency, body))
+            order_match = found.get("order")
+            txn_id = order_match.group("order_id").strip() if order_match else None
+            purchases.append(self._create_purchase_dict(amount, crypto, total_spent, currency, txn_id))
 
         return purchases
 
     def _create_purchase_dict(
-        self, amount: str, crypto: str, total_spent: str | None, currency: str, body: str
+        self, amount: str, crypto: str, total_spent: str | None, currency: str, txn_id: str | None
     ) -> Dict[str, Any]:
-        # Extract order ID
-        txn_id = self._find_match(r"order\s+#?([A-Z0-9\-]+)", body)
-
         return {
             "amount": amount,
             "item_name": crypto,
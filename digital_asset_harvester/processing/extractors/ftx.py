@@ -5,45 +5,42 @@ from __future__ import annotations
 import re
 from typing import Any, Dict, List
 
+from ._patterns import SYMBOL_MAP
 from .base import BaseExtractor
 
+# "Amount: 10 MATIC" ... "Total: $8.50 USD", both found in one scan. The lookaheads
+# let the lines overlap, e.g. a currency code that runs into the next line's label
+_COMBINED_RE = re.compile(
+    r"(?=(?P<amount_line>Amount:\s*(?P<amount>[\d,.]+)\s+(?P<crypto>[A-Z]{3,5})))"
+    r"|(?=(?P<total_line>Total:\s*(?P<symbol>[$€£¥])?(?P<spent>[\d,.]+)\s*(?P<code>[A-Z]{3})?))",
+    re.IGNORECASE,
+)
+_GROUPS = ("amount_line", "total_line")
+
 
 class FTXExtractor(BaseExtractor):
     """Extractor for FTX purchase confirmation emails."""
 
-    def can_handle(self, subject: str, sender: str, body: str) -> bool:
-        """Check if this is an FTX email."""
-        sender_lower = sender.lower()
-        if "ftx.com" not in sender_lower:
-            return False
-
-        subject_lower = subject.lower()
-        patterns = [
-            r"trade executed",
-            r"buy",
-        ]
-        return any(re.search(p, subject_lower) for p in patterns)
+    sender_domains = ("ftx.com",)
+    subject_keywords = ("trade executed", "buy")
 
     def extract(self, subject: str, sender: str, body: str) -> List[Dict[str, Any]]:
         """Extract data from FTX email."""
-        purchases = []
+        purchases: List[Dict[str, Any]] = []
 
-        # FTX pattern:
-        # Amount: 10 MATIC
-        # Price per unit: $0.85
-        # Total: $8.50 USD
-        amount_match = re.search(r"Amount:\s*([\d,.]+)\s+([A-Z]{3,5})", body, re.IGNORECASE)
-        total_match = re.search(r"Total:\s*([$€£¥])?([\d,.]+)\s*([A-Z]{3})?", body, re.IGNORECASE)
+        # The one scan also stands in for an "Amount:"/"Total:" prefilter: a body lacking either has no purchase
+        found = self._first_matches(_COMBINED_RE, body, _GROUPS)
+        amount_match = found.get("amount_line")
+        total_match = found.get("total_line")
 
         if amount_match and total_match:
-            amount = amount_match.group(1).replace(",", "")
-            crypto = amount_match.group(2).upper()
-            total_spent = total_match.group(2).replace(",", "")
+            amount = amount_match.group("amount").replace(",", "")
+            crypto = amount_match.group("crypto").upper()
+            total_spent = total_match.group("spent").replace(",", "")
 
-            currency = total_match.group(3)
-            if not currency and total_match.group(1):
-                symbol_map = {"$": "USD", "€": "EUR", "£": "GBP", "¥": "JPY"}
-                currency = symbol_map.get(total_match.group(1), "USD")
+            currency = total_match.group("code")
+            if not currency and total_match.group("symbol"):
+                currency = SYMBOL_MAP.get(total_match.group("symbol"), "USD")
             if not currency:
                 currency = "USD"
 
@@ -5,43 +5,35 @@ from __future__ import annotations
 import re
 from typing import Any, Dict, List
 
+from ._patterns import SYMBOL_MAP, buy_sentence_re
 from .base import BaseExtractor
 
+# "Your order to purchase 0.005 BTC for $150.00 has been completed."
+_PURCHASE_RE = buy_sentence_re("order to purchase")
+_TRANSACTION_ID_RE = re.compile(r"transaction id:\s*([a-z0-9\-]+)")
+
 
 class GeminiExtractor(BaseExtractor):
     """Extractor for Gemini purchase confirmation emails."""
 
-    def can_handle(self, subject: str, sender: str, body: str) -> bool:
-        """Check if this is a Gemini email."""
-        sender_lower = sender.lower()
-        if "gemini.com" not in sender_lower:
-            return False
-
-        subject_lower = subject.lower()
-        patterns = [
-            r"order confirmation",
-            r"purchase",
-            r"buy",
-        ]
-        return any(re.search(p, subject_lower) for p in patterns) or "gemini" in sender_lower
+    sender_domains = ("gemini.com",)
+    subject_keywords = ("order confirmation", "purchase", "buy")
+    sender_names = ("gemini",)
 
     def extract(self, subject: str, sender: str, body: str) -> List[Dict[str, Any]]:
         """Extract data from Gemini email."""
         purchases = []
 
-        # Gemini pattern: "Your order to purchase 0.005 BTC for $150.00 has been completed."
-        pattern = r"order to purchase\s+([\d,.]+)\s+([A-Z]{3,5})\s+for\s+([$€£¥])?([\d,.]+)"
-        match = re.search(pattern, body, re.IGNORECASE)
+        match = _PURCHASE_RE.search(body)
 
         if match:
-            amount = match.group(1).replace(",", "")
-            crypto = match.group(2).upper()
-            total_spent = match.group(4).replace(",", "")
+            amount = match.group("amt").replace(",", "")
+            crypto = match.group("sym").upper()
+            total_spent = match.group("tot").replace(",", "")
 
             currency = "USD"
-            if match.group(3):
-                symbol_map = {"$": "USD", "€": "EUR", "£": "GBP", "¥": "JPY"}
-                currency = symbol_map.get(match.group(3), "USD")
+            if match.group("csym"):
+                currency = SYMBOL_MAP.get(match.group("csym"), "USD")
 
             purchases.append(self._create_purchase_dict(amount, crypto, total_spent, currency, body))
 
@@ -50,8 +42,7 @@ class GeminiExtractor(BaseExtractor):
     def _create_purchase_dict(
         self, amount: str, crypto: str, total_spent: str | None, currency: str, body: str
     ) -> Dict[str, Any]:
-        # Extract transaction ID
-        txn_id = self._find_match(r"Transaction ID:\s*([A-Z0-9\-]+)", body)
+        txn_id = self._find_match(_TRANSACTION_ID_RE, body, lowered=True)
 
         return {
             "amount": amount,
@@ -3,27 +3,23 @@
 from __future__ import annotations
 
 import re
+from decimal import InvalidOperation
 from typing import Any, Dict, List
 
+from ._patterns import buy_sentence_re
 from .base import BaseExtractor
 
+# "You have successfully bought 0.1 BTC for $5,000.00 AUD"
+_PURCHASE_RE = buy_sentence_re("bought|purchased", symbols="$")
+_REFERENCE_RE = re.compile(r"\b(?:reference|ref|order id):?\s*([a-z0-9\-]+)")
+
 
 class IndependentReserveExtractor(BaseExtractor):
     """Extractor for Independent Reserve trade confirmation emails."""
 
-    def can_handle(self, subject: str, sender: str, body: str) -> bool:
-        """Check if this is an Independent Reserve email."""
-        sender_lower = sender.lower()
-        if "independentreserve.com" not in sender_lower:
-            return False
-
-        subject_lower = subject.lower()
-        patterns = [
-            r"trade confirmation",
-            r"order filled",
-            r"buy order",
-        ]
-        return any(re.search(p, subject_lower) for p in patterns) or "independent reserve" in sender_lower
+    sender_domains = ("independentreserve.com",)
+    subject_keywords = ("trade confirmation", "order filled", "buy order")
+    sender_names = ("independent reserve",)
 
     def extract(self, subject: str, sender: str, body: str) -> List[Dict[str, Any]]:
         """Extract data from Independent Reserve email."""
@@ -34,27 +30,25 @@ class IndependentReserveExtractor(BaseExtractor):
         # Or: "Amount: 0.1 BTC, Rate: 50,000 AUD, Total: 5,000 AUD"
 
         # 1. Direct sentence pattern
-        pattern1 = r"(?:bought|purchased)\s+([\d,.]+)\s+([A-Z]{3,5})\s+for\s+([$])?([\d,.]+)\s*([A-Z]{3})?"
-
-        for match in re.finditer(pattern1, body, re.IGNORECASE):
-            amount_str = match.group(1).replace(",", "")
-            crypto = match.group(2).upper()
-            total_str = match.group(4).replace(",", "")
-            currency = match.group(5) or "AUD"
+        for match in _PURCHASE_RE.finditer(body):
+            crypto = match.group("sym").upper()
+            currency = match.group("ccode") or "AUD"
 
             try:
+                amount = self._parse_decimal(match.group("amt"))
+                total_spent = self._parse_decimal(match.group("tot"))
                 purchases.append(
                     {
-                        "amount": str(float(amount_str)),
+                        "amount": str(float(amount)),
                         "item_name": crypto,
-                        "total_spent": str(float(total_str)),
+                        "total_spent": str(float(total_spent)),
                         "currency": currency,
                         "vendor": "Independent Reserve",
-                        "transaction_id": self._find_match(r"\b(?:Reference|Ref|Order ID):?\s*([A-Z0-9\-]+)", body),
+                        "transaction_id": self._find_match(_REFERENCE_RE, body, lowered=True),
                         "extraction_method": "regex",
                     }
                 )
-            except (ValueError, TypeError):
+            except InvalidOperation:
                 continue
 
         return purchases
@@ -12,6 +12,8 @@ from digital_asset_harvester.parsers.engine import TemplateEngine
 class KrakenExtractor(BaseExtractor):
     """Extractor for Kraken trade confirmation emails."""
 
+    sender_domains = ("kraken.com",)
+
     def __init__(self):
         self.engine = TemplateEngine(KRAKEN_TEMPLATE)
 
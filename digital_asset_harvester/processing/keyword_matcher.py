@@ -0,0 +1,129 @@
+"""Whole-word, case-insensitive keyword search for the email pre-filters."""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, Iterable
+
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+try:
+    import hyperscan
+
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+    hyperscan = None
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _is_boundary(text: str, pos: int) -> bool:
+    """Regex ``\\b`` semantics: word-ness differs on either side of ``pos``."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+def _trie_regex(keywords: Iterable[str]) -> str:
+    """Build a regex alternation with shared prefixes factored out.
+
+    ``{"coin", "coinbase", "crypto"}`` becomes ``c(?:oin(?:base)?|rypto)``,
+    so the regex engine follows only the branches the text actually
+    continues with instead of trying every keyword at each position.
+    """
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        terminal = "" in node
+        if len(branches) == 1 and not terminal:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if terminal else group
+
+    return emit(trie)
+
+
+class KeywordMatcher:
+    """Find any of a fixed set of keywords in text, matching ``\\b(kw1|kw2|...)\\b`` case-insensitively.
+
+    With ``pyahocorasick`` installed the keywords are compiled into a single
+    Aho-Corasick automaton, so a scan is one linear pass over the text however
+    many keywords there are. Otherwise the equivalent compiled regex is used,
+    with the keywords' shared prefixes factored into a trie.
+    ``use_hyperscan`` compiles the regex into a Hyperscan database instead,
+    when that package is installed.
+    """
+
+    def __init__(self, keywords: Iterable[str], use_hyperscan: bool = False) -> None:
+        self.keywords = frozenset(keyword.lower() for keyword in keywords if keyword)
+        self.pattern = re.compile(r"\b(" + _trie_regex(self.keywords) + r")\b", re.IGNORECASE)
+        # Keywords and scanned text are both lower-cased, so the scan needs no case folding
+        self._lower_pattern = re.compile(self.pattern.pattern)
+        self._database: Any = None
+        self._automaton = None
+        if use_hyperscan and HYPERSCAN_AVAILABLE and self.keywords:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[self.pattern.pattern.encode("utf-8")],
+                ids=[0],
+                flags=[
+                    hyperscan.HS_FLAG_CASELESS
+                    | hyperscan.HS_FLAG_UTF8
+                    | hyperscan.HS_FLAG_UCP
+                    | hyperscan.HS_FLAG_SINGLEMATCH
+                ],
+            )
+            self._database = database
+        elif AHOCORASICK_AVAILABLE and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, len(keyword))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def search(self, text: str) -> bool:
+        """Return whether any keyword occurs in ``text`` as a whole word."""
+        return self.search_lower(text.lower())
+
+    def search_lower(self, lowered: str) -> bool:
+        """Like :meth:`search`, for text the caller has already lower-cased."""
+        if self._database is not None:
+            return self._scan_database(lowered)
+        if self._automaton is None:
+            return self._lower_pattern.search(lowered) is not None
+
+        for end, length in self._automaton.iter(lowered):
+            start = end - length + 1
+            if _is_boundary(lowered, start) and _is_boundary(lowered, end + 1):
+                return True
+        return False
+
+    def _scan_database(self, text: str) -> bool:
+        found = []
+
+        def on_match(expression_id: int, start: int, end: int, flags: int, context: object) -> bool:
+            found.append(expression_id)
+            return True  # stop at the first hit
+
+        try:
+            self._database.scan(text.encode("utf-8", errors="ignore"), match_event_handler=on_match)
+        except hyperscan.ScanTerminated:
+            pass
+        return bool(found)
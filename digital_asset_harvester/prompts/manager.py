@@ -2,18 +2,53 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from string import Template
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+
+
+def _presplit(template: Template) -> Tuple[List[str], List[Tuple[str, str]]]:
+    """Split a template into literal runs and the ``(name, original text)`` of each placeholder between them."""
+    text = template.template
+    literals: List[str] = []
+    placeholders: List[Tuple[str, str]] = []
+    buffer: List[str] = []
+    pos = 0
+    for match in template.pattern.finditer(text):
+        buffer.append(text[pos : match.start()])
+        name = match.group("named") or match.group("braced")
+        if name is not None:
+            literals.append("".join(buffer))
+            buffer = []
+            placeholders.append((name, match.group()))
+        elif match.group("escaped") is not None:
+            buffer.append(template.delimiter)
+        else:
+            buffer.append(match.group())
+        pos = match.end()
+    buffer.append(text[pos:])
+    literals.append("".join(buffer))
+    return literals, placeholders
 
 
 @dataclass(frozen=True)
 class PromptTemplate:
     name: str
     template: Template
+    # Parsed once so render() joins the pieces instead of re-scanning the prompt text
+    _parts: Tuple[List[str], List[Tuple[str, str]]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_parts", _presplit(self.template))
 
     def render(self, **context: str) -> str:
-        return self.template.safe_substitute(**context)
+        """Substitute ``context`` like ``Template.safe_substitute``, leaving unknown placeholders as written."""
+        literals, placeholders = self._parts
+        parts = [literals[0]]
+        for (name, original), literal in zip(placeholders, literals[1:]):
+            parts.append(str(context[name]) if name in context else original)
+            parts.append(literal)
+        return "".join(parts)
 
 
 class PromptManager:
@@ -71,6 +106,51 @@ CONFIDENCE BENCHMARKS:
 """,
 )
 
+DEFAULT_PROMPTS.register(
+    "classification_batch",
+    """You are an expert at analyzing cryptocurrency purchase emails. For EACH of the numbered emails below, determine
+if it represents an ACTUAL cryptocurrency purchase transaction (not marketing, news, or other non-transactional
+content). Judge every email independently.
+
+EMAILS:
+${emails}
+
+ANALYSIS CRITERIA:
+- Look for ACTUAL purchase/buy transactions, order confirmations, trade executions, or staking rewards/distributions
+- Cryptocurrency exchanges: Coinbase, Binance, Kraken, Gemini, etc.
+- Purchase indicators: "bought", "purchased", "order filled", "transaction completed", "payment processed",
+  "staking reward", "earned", "distribution confirmation"
+- Specific amounts and cryptocurrency names (Bitcoin, Ethereum, BTC, ETH, etc.)
+- Transaction IDs, order numbers, or confirmation codes
+
+EXCLUDE these types of emails:
+- Marketing emails, newsletters, promotional content
+- Price alerts, market analysis, or news updates
+- Account notifications, security alerts, or general announcements
+- Educational content, blog posts, or webinars
+- Referral programs, contests, or airdrops
+- Failed transactions or declined orders
+
+Return a JSON object with one entry per email, using the number from its "--- EMAIL n ---" header as idx:
+{
+    "results": [
+        {
+            "idx": integer,
+            "is_crypto_purchase": boolean,
+            "confidence": float (0.0 to 1.0),
+            "reasoning": "Brief explanation of your decision"
+        }
+    ]
+}
+
+CONFIDENCE BENCHMARKS:
+- 1.0: Clearly an automated purchase confirmation or trade receipt.
+- 0.8-0.9: Likely a purchase but wording is slightly non-standard.
+- 0.5-0.7: Ambiguous email that might be transactional but lacks clear "buy/purchased" confirmation.
+- <0.5: Unlikely to be a purchase (marketing, newsletter, etc).
+""",
+)
+
 DEFAULT_PROMPTS.register(
     "extraction",
     """You are an expert at extracting cryptocurrency purchase details from transaction emails. Analyze the following email content and extract precise purchase information.
@@ -145,3 +225,134 @@ CONFIDENCE BENCHMARKS:
 If no valid purchase information can be extracted, return an empty array for the "transactions" field.
 """,
 )
+
+DEFAULT_PROMPTS.register(
+    "classify_and_extract",
+    """You are an expert at analyzing cryptocurrency transaction emails. First decide whether the following email
+content represents an ACTUAL cryptocurrency purchase transaction (not marketing, news, or other non-transactional
+content). If it does, extract precise purchase information in the same response.
+
+EMAIL CONTENT:
+${email_content}
+
+CLASSIFICATION CRITERIA:
+- Look for ACTUAL purchase/buy transactions, order confirmations, trade executions, or staking rewards/distributions
+- Cryptocurrency exchanges: Coinbase, Binance, Kraken, Gemini, etc.
+- Purchase indicators: "bought", "purchased", "order filled", "transaction completed", "payment processed",
+  "staking reward", "earned", "distribution confirmation"
+- Specific amounts and cryptocurrency names (Bitcoin, Ethereum, BTC, ETH, etc.)
+
+EXCLUDE these types of emails:
+- Marketing emails, newsletters, promotional content
+- Price alerts, market analysis, or news updates
+- Account notifications, security alerts, or general announcements
+- Referral programs, contests, or airdrops
+- Failed transactions or declined orders
+
+EXTRACTION INSTRUCTIONS (only when is_crypto_purchase is true):
+1. TOTAL_SPENT: The exact amount of fiat currency paid (look for "Total:", "Amount charged:", "You paid:", "Cost:")
+2. CURRENCY: The fiat currency code (USD, EUR, GBP, CAD, AUD, etc.)
+3. AMOUNT: The exact quantity of cryptocurrency received (crypto amounts, not fiat)
+4. ITEM_NAME: The cryptocurrency name or symbol exactly as written (BTC vs Bitcoin)
+5. VENDOR: The exchange/platform name (Coinbase, Binance, Kraken, etc.)
+6. PURCHASE_DATE: The transaction timestamp or order date, not the email send time
+7. FEE_AMOUNT / FEE_CURRENCY: Fees or commissions paid and their currency
+
+IMPORTANT RULES:
+- Extract ALL transactions found in the email into the "transactions" array.
+- Extract EXACT numerical values, don't round or estimate.
+- Use null for any field you cannot determine with confidence.
+- Extract transaction IDs, reference numbers, or order numbers into "transaction_id" if available.
+- If timezone missing, assume ${default_timezone}.
+- If is_crypto_purchase is false, return an empty array for "transactions".
+
+Return a JSON object with this exact structure:
+{
+    "is_crypto_purchase": boolean,
+    "confidence": float (0.0 to 1.0),
+    "reasoning": "Brief explanation of your decision",
+    "transactions": [
+        {
+            "transaction_type": "buy" | "deposit" | "withdrawal" | "staking_reward",
+            "total_spent": float or null,
+            "currency": string or null,
+            "amount": float or null,
+            "item_name": string or null,
+            "vendor": string or null,
+            "purchase_date": string or null,
+            "transaction_id": string or null,
+            "fee_amount": float or null,
+            "fee_currency": string or null,
+            "confidence": float (0.0 to 1.0),
+            "extraction_notes": "Any relevant notes about extraction quality or concerns"
+        }
+    ]
+}
+
+CONFIDENCE BENCHMARKS:
+- 1.0: Clearly an automated purchase confirmation with all core fields (date, asset, amount, vendor) present.
+- 0.8-0.9: Likely a purchase; minor fields (like currency or fees) inferred from context.
+- 0.5-0.7: Ambiguous email or core information requires significant interpretation.
+- <0.5: Unlikely to be a purchase (marketing, newsletter, etc).
+""",
+)
+
+DEFAULT_PROMPTS.register(
+    "extraction_batch",
+    """You are an expert at extracting cryptocurrency purchase details from transaction emails. Extract precise purchase
+information from EACH of the numbered emails below. Treat every email independently and never mix details between
+emails.
+
+EMAILS:
+${emails}
+
+EXTRACTION INSTRUCTIONS:
+1. TOTAL_SPENT: The exact amount of fiat currency paid (look for "Total:", "Amount charged:", "You paid:", "Cost:")
+2. CURRENCY: The fiat currency code (USD, EUR, GBP, CAD, AUD, etc.)
+3. AMOUNT: The exact quantity of cryptocurrency received (crypto amounts, not fiat)
+4. ITEM_NAME: The cryptocurrency name or symbol exactly as written (BTC vs Bitcoin)
+5. VENDOR: The exchange/platform name (Coinbase, Binance, Kraken, etc.)
+6. PURCHASE_DATE: The transaction timestamp or order date, not the email send time
+7. FEE_AMOUNT / FEE_CURRENCY: Fees or commissions paid and their currency
+
+IMPORTANT RULES:
+- Extract ALL transactions found in each email into that email's "transactions" array.
+- Extract EXACT numerical values, don't round or estimate.
+- Use null for any field you cannot determine with confidence.
+- Extract transaction IDs, reference numbers, or order numbers into "transaction_id" if available.
+- If timezone missing, assume ${default_timezone}.
+
+Return a JSON object with one entry per email, using the number from its "--- EMAIL n ---" header as idx:
+{
+    "results": [
+        {
+            "idx": integer,
+            "transactions": [
+                {
+                    "transaction_type": "buy" | "deposit" | "withdrawal" | "staking_reward",
+                    "total_spent": float or null,
+                    "currency": string or null,
+                    "amount": float or null,
+                    "item_name": string or null,
+                    "vendor": string or null,
+                    "purchase_date": string or null,
+                    "transaction_id": string or null,
+                    "fee_amount": float or null,
+                    "fee_currency": string or null,
+                    "confidence": float (0.0 to 1.0),
+                    "extraction_notes": "Any relevant notes about extraction quality or concerns"
+                }
+            ]
+        }
+    ]
+}
+
+CONFIDENCE BENCHMARKS:
+- 1.0: All core fields (date, asset, amount, vendor) are explicitly and unambiguously present.
+- 0.8-0.9: Core info is clear, but minor fields (like currency or fees) might be inferred from context.
+- 0.5-0.7: Some core information is ambiguous or requires significant interpretation.
+- <0.5: High uncertainty; key information like amount or asset is unclear.
+
+If an email has no valid purchase information, return an empty "transactions" array for its idx.
+""",
+)
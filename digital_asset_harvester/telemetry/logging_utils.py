@@ -4,11 +4,61 @@ from __future__ import annotations
 
 import json
 import logging
+import math
+import time
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
 
 ISO_TIMESTAMP = "%Y-%m-%dT%H:%M:%S.%fZ"
+# LogRecord attribute holding every extra_ field StructuredLoggerAdapter attached
+STRUCTURED_FIELDS = "_structured"
+
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS if ORJSON_AVAILABLE else 0
+
+# The last whole second formatted and its "YYYY-MM-DDTHH:MM:SS" text; log
+# records mostly arrive many to a second, so only the microseconds change
+_second_cache: Tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(created: float) -> str:
+    """Render ``created`` as ``ISO_TIMESTAMP`` in UTC, as ``datetime.utcfromtimestamp`` would round it."""
+    global _second_cache
+    fraction, whole = math.modf(created)
+    second = int(whole)
+    micros = round(fraction * 1e6)
+    if micros >= 1_000_000:
+        second, micros = second + 1, micros - 1_000_000
+    elif micros < 0:
+        second, micros = second - 1, micros + 1_000_000
+    cached_second, prefix = _second_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _second_cache = (second, prefix)
+    return f"{prefix}.{micros:06d}Z"
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    """Serialize a log payload compactly, with ``orjson`` when it is installed.
+
+    Values JSON has no type for (decimals, datetimes, ...) are logged as
+    their ``str()`` rather than failing the record.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            # Pass datetimes and dataclasses to ``default`` like the stdlib does, so output doesn't depend on orjson
+            return orjson.dumps(payload, default=str, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            # Oversized integers and non-string keys: let the stdlib decide
+            pass
+    return json.dumps(payload, separators=(",", ":"), default=str)
 
 
 class JsonFormatter(logging.Formatter):
@@ -16,7 +66,7 @@ class JsonFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:  # pragma: no cover - thin wrapper
         payload: Dict[str, Any] = {
-            "timestamp": datetime.utcfromtimestamp(record.created).strftime(ISO_TIMESTAMP),
+            "timestamp": _format_timestamp(record.created),
             "level": record.levelname,
             "name": record.name,
             "message": record.getMessage(),
@@ -24,9 +74,12 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
 
-        # Include any extra fields set on the record
-        payload.update({k: v for k, v in record.__dict__.items() if k.startswith("extra_")})
-        return json.dumps(payload)
+        # Include the extra fields: gathered by StructuredLoggerAdapter, or found on the record
+        structured = getattr(record, STRUCTURED_FIELDS, None)
+        if structured is None:
+            structured = {k: v for k, v in record.__dict__.items() if k.startswith("extra_")}
+        payload.update(structured)
+        return _dumps(payload)
 
 
 @dataclass
@@ -49,11 +102,24 @@ class StructuredLoggerFactory:
 class StructuredLoggerAdapter(logging.LoggerAdapter):
     """Logger adapter that merges structured data for every message."""
 
+    def __init__(self, logger: logging.Logger, extra: Optional[Dict[str, Any]] = None) -> None:
+        super().__init__(logger, extra or {})
+        # The adapter context only changes through bind(), which builds a new
+        # adapter, so the prefixed field names are worked out once here
+        self._prefixed_extra = {f"extra_{k}": v for k, v in self.extra.items()}
+
     def process(self, msg: str, kwargs: Dict[str, Any]) -> tuple[str, Dict[str, Any]]:
         extra = kwargs.setdefault("extra", {})
+        # Collect the call's extra_ fields and the adapter context into one
+        # record attribute, so JsonFormatter need not scan every attribute
+        fields = {k: v for k, v in extra.items() if k.startswith("extra_")}
         # Merge adapter context
-        extra_fields = {f"extra_{k}": v for k, v in self.extra.items()}
-        extra.update(extra_fields)
+        extra.update(self._prefixed_extra)
+        if fields:
+            fields.update(self._prefixed_extra)
+            extra[STRUCTURED_FIELDS] = fields
+        else:
+            extra[STRUCTURED_FIELDS] = self._prefixed_extra
         return msg, kwargs
 
     def bind(self, **fields: Any) -> "StructuredLoggerAdapter":
@@ -3,53 +3,89 @@
 from __future__ import annotations
 
 import time
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, Tuple
 
 
 @dataclass
 class MetricsTracker:
     """Simple in-memory counter and timing tracker."""
 
-    counters: Dict[str, int] = field(default_factory=dict)
-    latencies: Dict[str, List[float]] = field(default_factory=dict)
+    counters: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    # Running (count, mean, M2) per timer, updated with Welford's method so
+    # memory stays O(1) and the variance does not suffer from cancellation
+    latencies: Dict[str, Tuple[int, float, float]] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Bumped by every mutating method, so snapshot() can reuse its last result;
+    # changes made directly to the dicts above are not tracked
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _snapshot_cache: Tuple[int, Dict[str, Any]] = field(default=(-1, {}), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Counters passed in as a plain dict still need the zero default
+        if not isinstance(self.counters, defaultdict):
+            self.counters = defaultdict(int, self.counters)
 
     def increment(self, name: str, value: int = 1) -> None:
-        self.counters[name] = self.counters.get(name, 0) + value
+        self.counters[name] += value
+        self._version += 1
 
     def record_latency(self, name: str, duration: float) -> None:
-        if name not in self.latencies:
-            self.latencies[name] = []
-        self.latencies[name].append(duration)
+        count, mean, m2 = self.latencies.get(name, (0, 0.0, 0.0))
+        count += 1
+        delta = duration - mean
+        mean += delta / count
+        self.latencies[name] = (count, mean, m2 + delta * (duration - mean))
+        self._version += 1
 
     def set_metadata(self, key: str, value: Any) -> None:
         self.metadata[key] = value
+        self._version += 1
 
     def get(self, name: str) -> int:
         return self.counters.get(name, 0)
 
     def get_average_latency(self, name: str) -> float:
-        times = self.latencies.get(name, [])
-        if not times:
+        return self.latencies.get(name, (0, 0.0, 0.0))[1]
+
+    def get_latency_variance(self, name: str) -> float:
+        """Return the population variance of the durations recorded for ``name``."""
+        count, _, m2 = self.latencies.get(name, (0, 0.0, 0.0))
+        if not count:
             return 0.0
-        return sum(times) / len(times)
+        return m2 / count
 
     def merge(self, other: MetricsTracker) -> None:
         """Merge another MetricsTracker into this one."""
         for name, count in other.counters.items():
             self.increment(name, count)
-        for name, lats in other.latencies.items():
-            if name not in self.latencies:
-                self.latencies[name] = []
-            self.latencies[name].extend(lats)
+        for name, (count, mean, m2) in other.latencies.items():
+            if not count:
+                continue
+            # Chan et al.'s pairwise combination of two (count, mean, M2) summaries
+            mine_count, mine_mean, mine_m2 = self.latencies.get(name, (0, 0.0, 0.0))
+            total = mine_count + count
+            delta = mean - mine_mean
+            self.latencies[name] = (
+                total,
+                mine_mean + delta * count / total,
+                mine_m2 + m2 + delta * delta * mine_count * count / total,
+            )
         self.metadata.update(other.metadata)
+        self._version += 1
 
     def snapshot(self) -> Dict[str, Any]:
-        """Return a combined snapshot of all metrics."""
-        summary = dict(self.counters)
-        for name in self.latencies:
-            summary[f"{name}_avg_latency"] = self.get_average_latency(name)
-            summary[f"{name}_count"] = len(self.latencies[name])
-        summary.update(self.metadata)
-        return summary
+        """Return a combined snapshot of all metrics.
+
+        The summary is rebuilt only after a change; callers get their own copy.
+        """
+        version, summary = self._snapshot_cache
+        if version != self._version:
+            summary = dict(self.counters)
+            for name, (count, _, _) in self.latencies.items():
+                summary[f"{name}_avg_latency"] = self.get_average_latency(name)
+                summary[f"{name}_count"] = count
+            summary.update(self.metadata)
+            self._snapshot_cache = (self._version, summary)
+        return dict(summary)
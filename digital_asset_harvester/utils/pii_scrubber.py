@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional, Set
+from typing import AbstractSet, Optional
 
 import regex as re
 
@@ -13,7 +13,7 @@ logger = logging.getLogger(__name__)
 class PIIScrubber:
     """Detects and masks PII in text using regular expressions."""
 
-    def __init__(self, skip_terms: Optional[Set[str]] = None):
+    def __init__(self, skip_terms: Optional[AbstractSet[str]] = None):
         """
         Initialize the scrubber.
 
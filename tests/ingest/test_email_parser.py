@@ -1,6 +1,7 @@
 """Tests for the email_parser module."""
 
 import email
+import re
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
@@ -37,6 +38,14 @@ class TestStripHtmlTags:
         html = "Fish &amp; Chips &nbsp; &lt; &gt; &quot;"
         assert strip_html_tags(html) == 'Fish & Chips   < > "'
 
+    def test_strip_html_uses_precompiled_patterns(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("pattern compiled per call")
+
+        monkeypatch.setattr(re, "sub", fail)
+        monkeypatch.setattr(re, "compile", fail)
+        assert strip_html_tags("<p>Hello</p><script>x</script>") == "Hello"
+
 
 class TestDecodeHeaderValue:
     """Tests for decode_header_value function."""
@@ -62,6 +71,22 @@ class TestDecodeHeaderValue:
         result = decode_header_value("Bitcoin Purchase ₿")
         assert "Bitcoin Purchase" in result
 
+    def test_decode_encoded_header_is_cached(self):
+        """Test that repeated RFC 2047 headers are decoded once."""
+        from digital_asset_harvester.ingest.email_parser import _decode_header_str
+
+        _decode_header_str.cache_clear()
+        value = "=?utf-8?q?Bitcoin_Purchase_=E2=82=BF?="
+        assert decode_header_value(value) == "Bitcoin Purchase ₿"
+        assert decode_header_value(value) == "Bitcoin Purchase ₿"
+        assert _decode_header_str.cache_info().hits == 1
+
+    def test_decode_header_object(self):
+        """Test decoding an email.header.Header instance."""
+        from email.header import Header
+
+        assert decode_header_value(Header("Bitcoin Purchase ₿", "utf-8")) == "Bitcoin Purchase ₿"
+
 
 class TestExtractBody:
     """Tests for extract_body function."""
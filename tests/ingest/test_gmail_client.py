@@ -64,3 +64,11 @@ def test_search_emails_multipart(mock_get_credentials, mock_gmail_service):
 
     assert len(emails) == 1
     assert emails[0]["subject"] == "Multipart Email"
+
+
+def test_gmail_client_lazy_package_export():
+    import digital_asset_harvester.ingest as ingest
+
+    assert ingest.GmailClient is GmailClient
+    with pytest.raises(AttributeError):
+        ingest.NotAClient
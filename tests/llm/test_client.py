@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from digital_asset_harvester.config import HarvesterSettings
 from digital_asset_harvester.llm.ollama_client import LLMError, LLMResponseFormatError, OllamaLLMClient
 
 
@@ -45,3 +46,12 @@ def test_generate_json_non_recoverable_error(mock_client_constructor):
         client.generate_json("test prompt")
 
     assert mock_client.generate.call_count == 1
+
+
+@patch("digital_asset_harvester.llm.ollama_client.Client")
+def test_client_keepalive_pool_covers_max_workers(mock_client_constructor):
+    OllamaLLMClient(settings=HarvesterSettings(max_workers=32))
+
+    limits = mock_client_constructor.call_args.kwargs["limits"]
+    assert limits.max_keepalive_connections == 32
+    assert limits.max_connections == 100
@@ -0,0 +1,71 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from digital_asset_harvester.llm import provider
+from digital_asset_harvester.llm.cache_client import CachingLLMClient
+from digital_asset_harvester.llm.ollama_client import LLMError
+from digital_asset_harvester.llm.provider import LLMProvider, LLMResult
+
+
+class EchoProvider(LLMProvider):
+    def __init__(self):
+        self.prompts = []
+
+    def generate_json(self, prompt, *, model=None, temperature=None, retries=None):
+        self.prompts.append(prompt)
+        if prompt == "fail":
+            raise LLMError("boom")
+        return LLMResult(data={"prompt": prompt}, raw_text=prompt)
+
+
+def test_generate_json_batch_preserves_order_and_captures_errors():
+    provider = EchoProvider()
+
+    results = provider.generate_json_batch(["a", "fail", "c"], max_concurrency=3)
+
+    assert [r.data["prompt"] for r in (results[0], results[2])] == ["a", "c"]
+    assert isinstance(results[1], LLMError)
+    assert sorted(provider.prompts) == ["a", "c", "fail"]
+
+
+def test_caching_client_batch_only_forwards_misses():
+    inner = EchoProvider()
+    cache = MagicMock()
+    cache.get.side_effect = lambda prompt, **_: {"data": {"cached": prompt}} if prompt == "hit" else None
+    client = CachingLLMClient(inner, cache)
+
+    results = client.generate_json_batch(["hit", "miss"])
+
+    assert inner.prompts == ["miss"]
+    assert results[0].metadata == {"cached": True}
+    assert results[1].data == {"prompt": "miss"}
+    assert results[1].metadata["cached"] is False
+    cache.set.assert_called_once()
+
+
+def test_agenerate_json_runs_sync_call():
+    import asyncio
+
+    provider = EchoProvider()
+
+    result = asyncio.run(provider.agenerate_json("a"))
+
+    assert result.data == {"prompt": "a"}
+    assert provider.prompts == ["a"]
+
+
+@pytest.mark.parametrize("text", ['{"amount": 1.5, "items": [1, 2]}', '{"big": 123456789012345678901234567890}', "NaN"])
+def test_loads_json_matches_stdlib(text):
+    assert json.dumps(provider.loads_json(text)) == json.dumps(json.loads(text))
+
+
+def test_loads_json_raises_stdlib_errors(monkeypatch):
+    with pytest.raises(json.JSONDecodeError):
+        provider.loads_json('{"a": 1')
+    with pytest.raises(TypeError):
+        provider.loads_json(None)
+
+    monkeypatch.setattr(provider, "ORJSON_AVAILABLE", False)
+    assert provider.loads_json('{"a": 1}') == {"a": 1}
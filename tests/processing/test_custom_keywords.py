@@ -4,6 +4,7 @@ import tempfile
 import pytest
 
 from digital_asset_harvester.config import HarvesterSettings
+from digital_asset_harvester.processing.constants import CRYPTO_EXCHANGES
 from digital_asset_harvester.processing.email_purchase_extractor import EmailPurchaseExtractor
 
 
@@ -58,6 +59,10 @@ def test_custom_keyword_prevents_filtering():
 
         # Verify it's considered purchase related (since we add custom keywords to purchase_keywords)
         assert custom_extractor._is_likely_purchase_related(email_content) is True
+
+        # The shared default keyword sets are left untouched
+        assert isinstance(CRYPTO_EXCHANGES, frozenset)
+        assert "magicword" not in CRYPTO_EXCHANGES
     finally:
         if os.path.exists(tmp_path):
             os.remove(tmp_path)
@@ -1,11 +1,15 @@
+from datetime import datetime
 from decimal import Decimal
 from unittest.mock import MagicMock, mock_open
 
 import pytest
+from pydantic import ValidationError
 
 from digital_asset_harvester.config import HarvesterSettings
 from digital_asset_harvester.llm.ollama_client import LLMError
+from digital_asset_harvester.processing import email_purchase_extractor
 from digital_asset_harvester.processing.email_purchase_extractor import EmailPurchaseExtractor, PurchaseInfo
+from digital_asset_harvester.validation import PurchaseRecord
 
 
 @pytest.fixture
@@ -57,8 +61,8 @@ def test_load_custom_keywords(mocker):
     settings = HarvesterSettings(custom_keywords_file="keywords.txt")
     extractor = EmailPurchaseExtractor(settings=settings)
 
-    assert "custom_kw1" in extractor._exchanges_pattern.pattern
-    assert "custom_kw2" in extractor._terms_pattern.pattern
+    assert "custom_kw1" in extractor._exchanges_pattern.keywords
+    assert "custom_kw2" in extractor._terms_pattern.keywords
 
 
 def test_extract_email_metadata_fallback(extractor):
@@ -84,6 +88,37 @@ def test_is_likely_crypto_related(extractor):
     assert extractor._is_likely_crypto_related("From: someone\nSubject: Hello") is False
 
 
+def test_is_likely_crypto_related_sender_domain(extractor, mocker):
+    contains = mocker.spy(extractor, "_contains_keywords")
+    content = "From: Receipts <no-reply@info.kraken.com>\nSubject: Hello"
+    assert extractor._extract_email_metadata(content)["sender_domain"] == "info.kraken.com"
+    assert extractor._is_likely_crypto_related(content) is True
+    contains.assert_not_called()
+
+
+def test_preprocessing_scans_each_field_once_per_matcher(extractor, mocker):
+    content = "From: Coinbase\nSubject: Your purchase\n\nYou bought 0.1 BTC"
+    contains = mocker.spy(extractor, "_contains_keywords")
+
+    assert extractor._should_skip_llm_analysis(content) is False
+    assert extractor._is_likely_purchase_related(content) is True
+
+    scans = [(c.args, c.kwargs["pattern"]) for c in contains.call_args_list]
+    assert len(scans) == len(set((args, id(pattern)) for args, pattern in scans))
+
+
+def test_preprocessing_hashes_each_email_once(extractor, mocker):
+    import hashlib
+
+    mocker.patch.object(email_purchase_extractor, "XXHASH_AVAILABLE", False)
+    blake2b = mocker.patch.object(email_purchase_extractor.hashlib, "blake2b", wraps=hashlib.blake2b)
+    content = "From: Coinbase\nSubject: Your purchase\n\nYou bought 0.1 BTC"
+
+    assert extractor._passes_classification_preprocessing(content) is True
+    extractor._extract_with_regex(content)
+    assert blake2b.call_count == 1
+
+
 def test_is_likely_purchase_related(extractor):
     # Matches purchase keyword
     assert extractor._is_likely_purchase_related("Subject: Your purchase") is True
@@ -225,6 +260,46 @@ def test_is_crypto_purchase_email_low_confidence(extractor):
     assert extractor.is_crypto_purchase_email("Subject: maybe purchase") is False
 
 
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("2024-01-15T10:30:00Z", "2024-01-15 10:30:00 UTC"),
+        ("2024-01-15 12:30:00+02:00", "2024-01-15 10:30:00 UTC"),
+        ("2024-01-15", "2024-01-15 00:00:00 UTC"),
+        ("Jan 15, 2024 10:30 AM", "2024-01-15 10:30:00 UTC"),
+    ],
+)
+def test_process_extracted_dates_formats(extractor, mocker, raw, expected):
+    email_purchase_extractor._parse_purchase_date.cache_clear()
+    dateutil_parse = mocker.spy(email_purchase_extractor.parser, "parse")
+    processed = extractor._process_extracted_dates([{"purchase_date": raw}])
+    assert processed[0]["purchase_date"] == expected
+    # ISO-8601 dates never reach dateutil
+    assert dateutil_parse.called is (raw[0] == "J")
+
+
+def test_process_extracted_dates_keeps_canonical_dates(extractor, mocker):
+    parse = mocker.spy(email_purchase_extractor, "_parse_purchase_date")
+    processed = extractor._process_extracted_dates(
+        [{"purchase_date": "2024-01-15 10:30:00 UTC"}, {"purchase_date": "2024-13-15 10:30:00 UTC"}]
+    )
+    assert processed[0]["purchase_date"] == "2024-01-15 10:30:00 UTC"
+    # Out-of-range fields still go through the full parse and its fallback
+    assert parse.call_count == 1
+
+
+def test_parse_purchase_date_caches_free_form_dates(mocker):
+    email_purchase_extractor._parse_purchase_date.cache_clear()
+    dateutil_parse = mocker.spy(email_purchase_extractor.parser, "parse")
+    mocker.patch.object(email_purchase_extractor, "CISO8601_AVAILABLE", False)
+
+    first = email_purchase_extractor._parse_purchase_date("Feb 3, 2024 09:15 AM")
+    second = email_purchase_extractor._parse_purchase_date("Feb 3, 2024 09:15 AM")
+
+    assert first == second == datetime(2024, 2, 3, 9, 15)
+    assert dateutil_parse.call_count == 1
+
+
 def test_process_extracted_dates_invalid(extractor):
     transactions = [{"purchase_date": "invalid-date", "item_name": "BTC"}]
     processed = extractor._process_extracted_dates(transactions)
@@ -242,6 +317,10 @@ def test_scrub_pii_if_enabled(extractor):
 
 def test_process_email_pydantic_error(extractor, mocker):
     # This should trigger the generic Exception catch in process_email
+    with pytest.raises(ValidationError) as rejected:
+        PurchaseRecord.model_validate({})
+    adapter = mocker.patch("digital_asset_harvester.processing.email_purchase_extractor._PURCHASES_ADAPTER")
+    adapter.validate_python.side_effect = rejected.value
     mocker.patch(
         "digital_asset_harvester.validation.PurchaseRecord.model_validate", side_effect=Exception("pydantic error")
     )
@@ -279,3 +358,463 @@ def test_process_email_extraction_failed(extractor):
     result = extractor.process_email(email_content)
 
     assert result["has_purchase"] is False
+
+
+def test_process_emails_batches_llm_calls(extractor, mocker):
+    extract_batch = mocker.patch(
+        "digital_asset_harvester.processing.extractors.registry.extract_batch",
+        side_effect=lambda rows: [None] * len(rows),
+    )
+    classification = MagicMock(data={"is_crypto_purchase": True, "confidence": 0.9}, metadata={})
+    extraction = extractor.llm_client.generate_json.return_value
+    extractor.llm_client.generate_json_batch.side_effect = [
+        [classification, LLMError("llm down")],
+        [extraction],
+    ]
+
+    emails = [
+        "From: Coinbase\nSubject: Your purchase",
+        "Subject: Pizza order",
+        "From: Kraken\nSubject: Your purchase",
+    ]
+    results = extractor.process_emails(emails)
+
+    assert [r["has_purchase"] for r in results] == [True, False, False]
+    assert results[0]["purchases"][0]["item_name"] == "BTC"
+    assert extractor.llm_client.generate_json_batch.call_count == 2
+    extractor.llm_client.generate_json.assert_not_called()
+    # The regex extractors run once over every email that passed the pre-filters
+    assert extract_batch.call_count == 1
+    assert [sender for _, sender, _ in extract_batch.call_args.args[0]] == ["Coinbase", "Kraken"]
+
+
+def test_process_email_combined_llm_call(mock_llm_client, mocker):
+    mocker.patch("digital_asset_harvester.processing.extractors.registry.extract", return_value=None)
+    settings = HarvesterSettings(enable_combined_llm_call=True, llm_max_retries=1, min_confidence_threshold=0.2)
+    extractor = EmailPurchaseExtractor(settings=settings, llm_client=mock_llm_client)
+
+    result = extractor.process_email("From: Coinbase\nSubject: Your purchase")
+
+    assert result["has_purchase"] is True
+    assert result["purchases"][0]["item_name"] == "BTC"
+    mock_llm_client.generate_json.assert_called_once()
+    assert "is_crypto_purchase" in mock_llm_client.generate_json.call_args.args[0]
+
+
+def test_process_email_combined_llm_call_negative(mock_llm_client):
+    mock_llm_client.generate_json.return_value.data = {"is_crypto_purchase": False, "transactions": []}
+    settings = HarvesterSettings(enable_combined_llm_call=True, llm_max_retries=1)
+    extractor = EmailPurchaseExtractor(settings=settings, llm_client=mock_llm_client)
+
+    result = extractor.process_email("From: Coinbase\nSubject: Your purchase")
+
+    assert result["has_purchase"] is False
+    mock_llm_client.generate_json.assert_called_once()
+
+
+def test_process_email_scrubs_pii_once(extractor, mocker):
+    mocker.patch("digital_asset_harvester.processing.extractors.registry.extract", return_value=None)
+    scrub = mocker.spy(extractor.pii_scrubber, "scrub")
+
+    result = extractor.process_email("From: Coinbase\nSubject: Your purchase\n\nContact me at test@example.com")
+
+    assert result["has_purchase"] is True
+    assert scrub.call_count == 1
+    prompts = [c.args[0] for c in extractor.llm_client.generate_json.call_args_list]
+    assert len(prompts) == 2
+    assert all("[EMAIL]" in prompt for prompt in prompts)
+
+
+def test_finalize_purchases_validates_batch_once(extractor, mocker):
+    extractor.settings = HarvesterSettings(strict_validation=True, enable_currency_conversion=False)
+    model_validate = mocker.spy(PurchaseRecord, "model_validate")
+    good = {
+        "total_spent": 100.0,
+        "currency": "USD",
+        "amount": 0.001,
+        "item_name": "BTC",
+        "vendor": "Coinbase",
+        "purchase_date": "2024-01-01 12:00:00 UTC",
+        "transaction_type": "buy",
+    }
+
+    result = extractor._finalize_purchases([dict(good), dict(good, item_name="ETH")])
+    assert len(result["purchases"]) == 2
+    assert model_validate.call_count == 0
+
+    result = extractor._finalize_purchases([dict(good), dict(good, amount="not a number")])
+    assert [p["item_name"] for p in result["purchases"]] == ["BTC"]
+    assert any("failed validation" in note for note in result["processing_notes"])
+
+
+def test_process_extracted_transactions_required_fields_by_type(extractor):
+    extractor.settings = HarvesterSettings(strict_validation=True, min_confidence_threshold=0.0)
+    deposit = {"transaction_type": "crypto_deposit", "amount": 1.0, "item_name": "BTC", "vendor": "Kraken"}
+    untyped = {"transaction_type": None, "amount": 1.0, "item_name": "BTC", "vendor": "Kraken"}
+
+    result = extractor._process_extracted_transactions([deposit, untyped])
+    assert result == [deposit]
+
+
+def test_finalize_purchases_converts_validated_decimal(extractor, mocker):
+    mock_fx = mocker.patch("digital_asset_harvester.processing.email_purchase_extractor.fx_service")
+    mock_fx.get_rate.return_value = Decimal("1.35")
+    extractor.settings = HarvesterSettings(
+        strict_validation=True, enable_currency_conversion=True, base_fiat_currency="CAD"
+    )
+    purchase = {
+        "total_spent": "0.10",
+        "currency": "USD",
+        "amount": 0.001,
+        "item_name": "BTC",
+        "vendor": "Coinbase",
+        "purchase_date": "2024-01-01 12:00:00 UTC",
+    }
+
+    result = extractor._finalize_purchases([purchase, dict(purchase, amount="bad")])
+    assert result["purchases"][0]["fiat_amount_base"] == 0.135
+    mock_fx.get_rate.assert_called_once_with("2024-01-01 12:00:00 UTC", "USD", "CAD")
+
+
+def test_process_email_regex_skips_classification(extractor, mocker):
+    mocker.patch("digital_asset_harvester.processing.email_purchase_extractor.fx_service").get_rate.return_value = None
+    email_content = (
+        "From: Coinbase <no-reply@coinbase.com>\n"
+        "Subject: Your Coinbase purchase of 0.001 BTC\n\n"
+        "You successfully purchased 0.001 BTC for $100.00 USD."
+    )
+
+    result = extractor.process_email(email_content)
+    assert result["has_purchase"] is True
+    assert result["purchases"][0]["extraction_method"] == "regex"
+    extractor.llm_client.generate_json.assert_not_called()
+    assert extractor.metrics.counters["classification_skipped_regex"] == 1
+
+
+def test_contains_keywords_scans_fields_in_order(extractor):
+    pattern = MagicMock()
+    pattern.search_lower.side_effect = [False, True]
+
+    assert extractor._contains_keywords("subject", "", "sender", "body", pattern=pattern) is True
+    assert [c.args[0] for c in pattern.search_lower.call_args_list] == ["subject", "sender"]
+
+
+def test_extract_email_metadata_caches_lowered_fields(extractor):
+    metadata = extractor._extract_email_metadata("Subject: Your BTC Purchase\nFrom: Coinbase\n\nBody Text")
+    assert metadata["subject_lower"] == "your btc purchase"
+    assert metadata["sender_lower"] == "coinbase"
+    assert metadata["body_lower"] == "body text"
+
+
+def test_process_emails_preprocessing_process_pool(mock_llm_client):
+    settings = HarvesterSettings(enable_preprocessing=True, enable_pii_scrubbing=True, preprocessing_workers=2)
+    mock_llm_client.generate_json_batch.return_value = []
+
+    emails = [
+        "From: Coinbase <no-reply@coinbase.com>\nSubject: Your Coinbase purchase of 0.001 BTC\n\n"
+        "You successfully purchased 0.001 BTC for $100.00 USD.",
+        "Subject: Pizza order",
+    ]
+    with EmailPurchaseExtractor(settings=settings, llm_client=mock_llm_client) as extractor:
+        results = extractor.process_emails(emails)
+        pool = extractor._preprocess_pool
+        # Later batches reuse the pool instead of starting new worker processes
+        extractor.process_emails(emails)
+        assert extractor._preprocess_pool is pool
+
+    assert extractor._preprocess_pool is None
+    assert [r["has_purchase"] for r in results] == [True, False]
+    assert extractor.metrics.get("classification_total") == 4
+    assert extractor.metrics.get("classification_skipped_regex") == 2
+    mock_llm_client.generate_json_batch.assert_not_called()
+
+
+def test_preprocess_worker_builds_no_small_model_client(mocker):
+    get_slm_client = mocker.patch.object(email_purchase_extractor, "get_slm_client")
+
+    email_purchase_extractor._init_preprocess_worker(HarvesterSettings(slm_model_name="tiny"))
+
+    get_slm_client.assert_not_called()
+    assert email_purchase_extractor._preprocess_extractor.slm_client is None
+
+
+def test_purchase_info_is_slotted():
+    info = PurchaseInfo(100.0, "USD", 0.001, "BTC", "Coinbase", "2024-01-01 12:00:00 UTC")
+    assert info.item_name == "BTC"
+    assert not hasattr(info, "__dict__")
+
+
+def test_purchase_info_is_frozen_and_picklable():
+    import dataclasses
+    import pickle
+
+    info = PurchaseInfo(100.0, "USD", 0.001, "BTC", "Coinbase", "2024-01-01 12:00:00 UTC")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        info.amount = 1.0  # type: ignore[misc]
+    assert pickle.loads(pickle.dumps(info)) == info
+
+
+def test_process_email_speculative_extraction(mock_llm_client):
+    settings = HarvesterSettings(enable_preprocessing=False, enable_speculative_extraction=True)
+    extractor = EmailPurchaseExtractor(settings=settings, llm_client=mock_llm_client)
+    classification = MagicMock(data={"is_crypto_purchase": True, "confidence": 0.9}, metadata={})
+    negative = MagicMock(data={"is_crypto_purchase": False, "confidence": 0.9}, metadata={})
+    extraction = mock_llm_client.generate_json.return_value
+    mock_llm_client.generate_json_batch.side_effect = [[classification, extraction], [negative, extraction]]
+
+    result = extractor.process_email("From: Coinbase\nSubject: Your purchase")
+    assert result["purchases"][0]["item_name"] == "BTC"
+    assert mock_llm_client.generate_json_batch.call_args.kwargs["max_concurrency"] == 2
+
+    assert extractor.process_email("From: Coinbase\nSubject: Your sale")["has_purchase"] is False
+    assert extractor.metrics.get("extraction_speculative_discarded") == 1
+    mock_llm_client.generate_json.assert_not_called()
+
+
+def test_process_emails_speculative_extraction(extractor, mocker):
+    mocker.patch(
+        "digital_asset_harvester.processing.extractors.registry.extract_batch",
+        side_effect=lambda rows: [None] * len(rows),
+    )
+    extractor.settings = HarvesterSettings(enable_preprocessing=False, enable_speculative_extraction=True)
+    positive = MagicMock(data={"is_crypto_purchase": True, "confidence": 0.9}, metadata={})
+    negative = MagicMock(data={"is_crypto_purchase": False, "confidence": 0.9}, metadata={})
+    extraction = extractor.llm_client.generate_json.return_value
+    extractor.llm_client.generate_json_batch.return_value = [positive, negative, extraction, extraction]
+
+    results = extractor.process_emails(["Subject: Your purchase", "Subject: Your sale"])
+
+    assert [r["has_purchase"] for r in results] == [True, False]
+    assert extractor.llm_client.generate_json_batch.call_count == 1
+    assert len(extractor.llm_client.generate_json_batch.call_args.args[0]) == 4
+    assert extractor.metrics.get("extraction_speculative_discarded") == 1
+
+
+def test_first_nonblank_line():
+    from digital_asset_harvester.processing.email_purchase_extractor import _first_nonblank_line
+
+    assert _first_nonblank_line("\n  \nSubject: Hi\nFrom: x") == "Subject: Hi"
+    assert _first_nonblank_line("Body only") == "Body only"
+    assert _first_nonblank_line("\n \n") == ""
+
+
+def test_classify_batch_single_prompt_with_fallback(mock_llm_client):
+    settings = HarvesterSettings(enable_preprocessing=True, enable_pii_scrubbing=False)
+    extractor = EmailPurchaseExtractor(settings=settings, llm_client=mock_llm_client)
+    batched = MagicMock(
+        data={
+            "results": [
+                {"idx": 0, "is_crypto_purchase": True, "confidence": 0.9},
+                {"idx": 1, "is_crypto_purchase": "maybe"},
+            ]
+        },
+        metadata={},
+    )
+    single = MagicMock(data={"is_crypto_purchase": False, "confidence": 0.9}, metadata={})
+    mock_llm_client.generate_json.side_effect = [batched, single]
+
+    emails = [
+        "From: Coinbase\nSubject: Your purchase of BTC",
+        "Subject: Pizza order",
+        "From: Kraken\nSubject: Your purchase of ETH",
+    ]
+    assert extractor.classify_batch(emails) == [True, False, False]
+
+    prompt = mock_llm_client.generate_json.call_args_list[0].args[0]
+    assert "--- EMAIL 0 ---" in prompt and "--- EMAIL 1 ---" in prompt
+    assert "Pizza order" not in prompt
+    assert mock_llm_client.generate_json.call_count == 2
+    assert extractor.metrics.get("classification_batch_retries") == 1
+
+
+def test_process_emails_multi_email_classification(extractor, mocker):
+    mocker.patch(
+        "digital_asset_harvester.processing.extractors.registry.extract_batch",
+        side_effect=lambda rows: [None] * len(rows),
+    )
+    extractor.settings = HarvesterSettings(enable_preprocessing=False, classification_batch_size=8)
+    extraction = extractor.llm_client.generate_json.return_value
+    extractor.llm_client.generate_json.return_value = MagicMock(
+        data={
+            "results": [
+                {"idx": 0, "is_crypto_purchase": True, "confidence": 0.9},
+                {"idx": 1, "is_crypto_purchase": False},
+            ]
+        },
+        metadata={},
+    )
+    extractor.llm_client.generate_json_batch.return_value = [extraction]
+
+    results = extractor.process_emails(["Subject: Your purchase", "Subject: Your sale"])
+
+    assert [r["has_purchase"] for r in results] == [True, False]
+    assert extractor.llm_client.generate_json.call_count == 1
+    assert len(extractor.llm_client.generate_json_batch.call_args.args[0]) == 1
+
+
+def test_extract_batch_single_prompt_with_fallback(mock_llm_client, mocker):
+    mocker.patch("digital_asset_harvester.processing.extractors.registry.extract", return_value=None)
+    extractor = EmailPurchaseExtractor(settings=HarvesterSettings(), llm_client=mock_llm_client)
+    transaction = dict(mock_llm_client.generate_json.return_value.data["transactions"][0])
+    batched = MagicMock(
+        data={"results": [{"idx": 0, "transactions": [transaction]}, {"idx": 1, "transactions": "garbled"}]},
+        metadata={},
+    )
+    single = MagicMock(data={"transactions": []}, metadata={})
+    mock_llm_client.generate_json.side_effect = [batched, single]
+
+    results = extractor.extract_batch(["Subject: Bought BTC", "Subject: Bought ETH"])
+
+    assert [len(purchases) for purchases in results] == [1, 0]
+    assert results[0][0]["item_name"] == "BTC"
+    prompt = mock_llm_client.generate_json.call_args_list[0].args[0]
+    assert "--- EMAIL 0 ---" in prompt and "--- EMAIL 1 ---" in prompt
+    assert mock_llm_client.generate_json.call_count == 2
+    assert extractor.metrics.get("extraction_batch_retries") == 1
+
+
+def test_process_emails_multi_email_extraction(extractor, mocker):
+    mocker.patch(
+        "digital_asset_harvester.processing.extractors.registry.extract_batch",
+        side_effect=lambda rows: [None] * len(rows),
+    )
+    extractor.settings = HarvesterSettings(enable_preprocessing=False, extraction_batch_size=8)
+    transaction = dict(extractor.llm_client.generate_json.return_value.data["transactions"][0])
+    classification = MagicMock(data={"is_crypto_purchase": True, "confidence": 0.9}, metadata={})
+    extractor.llm_client.generate_json_batch.return_value = [classification, classification]
+    extractor.llm_client.generate_json.return_value = MagicMock(
+        data={"results": [{"idx": 0, "transactions": [transaction]}, {"idx": 1, "transactions": [transaction]}]},
+        metadata={},
+    )
+
+    results = extractor.process_emails(["Subject: Your purchase", "Subject: Another purchase"])
+
+    assert [r["has_purchase"] for r in results] == [True, True]
+    assert extractor.llm_client.generate_json.call_count == 1
+    assert extractor.llm_client.generate_json_batch.call_count == 1
+
+
+def test_classification_small_model_tier(mock_llm_client):
+    settings = HarvesterSettings(enable_preprocessing=False, slm_model_name="tiny", slm_confident_threshold=0.85)
+    slm_client = MagicMock()
+    extractor = EmailPurchaseExtractor(settings=settings, llm_client=mock_llm_client, slm_client=slm_client)
+
+    slm_client.generate_json.return_value = MagicMock(data={"is_crypto_purchase": False, "confidence": 0.95})
+    assert extractor.is_crypto_purchase_email("Subject: Newsletter") is False
+    assert slm_client.generate_json.call_args.kwargs["model"] == "tiny"
+    mock_llm_client.generate_json.assert_not_called()
+
+    slm_client.generate_json.return_value = MagicMock(data={"is_crypto_purchase": True, "confidence": 0.6})
+    assert extractor.is_crypto_purchase_email("Subject: Maybe a purchase") is True
+    mock_llm_client.generate_json.assert_called_once()
+    assert extractor.metrics.get("slm_decisions") == 1
+    assert extractor.metrics.get("slm_escalations") == 1
+
+
+def test_process_emails_small_model_tier(extractor, mocker):
+    mocker.patch(
+        "digital_asset_harvester.processing.extractors.registry.extract_batch",
+        side_effect=lambda rows: [None] * len(rows),
+    )
+    extractor.settings = HarvesterSettings(enable_preprocessing=False, slm_model_name="tiny")
+    extractor.slm_client = MagicMock()
+    extractor.slm_client.generate_json_batch.return_value = [
+        MagicMock(data={"is_crypto_purchase": False, "confidence": 0.99}),
+        MagicMock(data={"is_crypto_purchase": True, "confidence": 0.4}),
+    ]
+    classification = MagicMock(data={"is_crypto_purchase": True, "confidence": 0.9}, metadata={})
+    extraction = extractor.llm_client.generate_json.return_value
+    extractor.llm_client.generate_json_batch.side_effect = [[classification], [extraction]]
+
+    results = extractor.process_emails(["Subject: Newsletter", "Subject: Your purchase"])
+
+    assert [r["has_purchase"] for r in results] == [False, True]
+    assert len(extractor.llm_client.generate_json_batch.call_args_list[0].args[0]) == 1
+
+
+def test_process_emails_small_model_escalations_skip_small_model_on_fallback(extractor, mocker):
+    mocker.patch(
+        "digital_asset_harvester.processing.extractors.registry.extract_batch",
+        side_effect=lambda rows: [None] * len(rows),
+    )
+    extractor.settings = HarvesterSettings(
+        enable_preprocessing=False, slm_model_name="tiny", classification_batch_size=8
+    )
+    extractor.slm_client = MagicMock()
+    extractor.slm_client.generate_json_batch.return_value = [
+        MagicMock(data={"is_crypto_purchase": False, "confidence": 0.99}),
+        MagicMock(data={"is_crypto_purchase": True, "confidence": 0.4}),
+        MagicMock(data={"is_crypto_purchase": True, "confidence": 0.3}),
+    ]
+    extraction = extractor.llm_client.generate_json.return_value
+    # The batched answer leaves out the second escalated email, which is re-classified on its own
+    extractor.llm_client.generate_json.side_effect = [
+        MagicMock(data={"results": [{"idx": 0, "is_crypto_purchase": True, "confidence": 0.9}]}, metadata={}),
+        MagicMock(data={"is_crypto_purchase": False, "confidence": 0.9}, metadata={}),
+    ]
+    extractor.llm_client.generate_json_batch.return_value = [extraction]
+
+    results = extractor.process_emails(["Subject: Newsletter", "Subject: Your purchase", "Subject: Your sale"])
+
+    assert [r["has_purchase"] for r in results] == [False, True, False]
+    assert extractor.slm_client.generate_json_batch.call_count == 1
+    extractor.slm_client.generate_json.assert_not_called()
+    assert extractor.llm_client.generate_json.call_count == 2
+    assert extractor.metrics.get("slm_escalations") == 2
+    assert extractor.metrics.get("classification_batch_retries") == 1
+
+
+def test_metadata_cache_is_bounded_by_setting(mock_llm_client):
+    settings = HarvesterSettings(metadata_cache_size=2)
+    extractor = EmailPurchaseExtractor(settings=settings, llm_client=mock_llm_client)
+
+    for i in range(3):
+        extractor._extract_email_metadata(f"Subject: Email {i}\nFrom: a@b.com\n\nBody")
+
+    assert len(extractor._metadata_cache) == 2
+    assert extractor._get_content_hash("Subject: Email 0\nFrom: a@b.com\n\nBody") not in extractor._metadata_cache
+
+
+def test_metadata_cache_is_thread_safe(mock_llm_client):
+    from concurrent.futures import ThreadPoolExecutor
+
+    settings = HarvesterSettings(metadata_cache_size=4)
+    extractor = EmailPurchaseExtractor(settings=settings, llm_client=mock_llm_client)
+    emails = [f"Subject: Email {i % 16}\nFrom: a@b.com\n\nBody" for i in range(2000)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        subjects = list(executor.map(lambda e: extractor._extract_email_metadata(e)["subject"], emails))
+
+    assert subjects == [f"Email {i % 16}" for i in range(2000)]
+    assert len(extractor._metadata_cache) <= 4
+
+
+@pytest.mark.parametrize(
+    "transaction_type, expected",
+    [("buy", False), ("Deposit", True), ("crypto_withdrawal", True), ("STAKING_REWARD", True), ("", False)],
+)
+def test_is_non_purchase_type(transaction_type, expected):
+    assert email_purchase_extractor._is_non_purchase_type(transaction_type) is expected
+
+
+def test_aprocess_emails_awaits_agenerate_json(extractor, mocker):
+    import asyncio
+
+    mocker.patch("digital_asset_harvester.processing.extractors.registry.extract", return_value=None)
+    extractor.settings = HarvesterSettings(enable_preprocessing=False)
+    purchase = extractor.llm_client.generate_json.return_value
+    negative = MagicMock(data={"is_crypto_purchase": False, "confidence": 0.9}, metadata={})
+    extractor.llm_client.agenerate_json = mocker.AsyncMock(
+        side_effect=lambda prompt, **kwargs: negative if "Lottery" in prompt else purchase
+    )
+
+    results = asyncio.run(
+        extractor.aprocess_emails(
+            ["Subject: a purchase", "Subject: Lottery results", "Subject: b purchase"], max_concurrency=2
+        )
+    )
+
+    assert [r["has_purchase"] for r in results] == [True, False, True]
+    # Classification for all three, extraction for the two positives
+    assert extractor.llm_client.agenerate_json.await_count == 5
+    extractor.llm_client.generate_json.assert_not_called()
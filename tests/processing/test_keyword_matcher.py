@@ -0,0 +1,88 @@
+import re
+
+import pytest
+
+from digital_asset_harvester.processing import keyword_matcher
+from digital_asset_harvester.processing.keyword_matcher import KeywordMatcher
+
+SAMPLES = [
+    "You bought 0.5 BTC on Coinbase",
+    "coinbases are not a word we know",
+    "Welcome to our newsletter!",
+    "crypto.com purchase receipt",
+    "",
+    "NO MATCH HERE",
+    "_bitcoin_ is glued to underscores",
+    "bitcoin",
+]
+
+
+@pytest.fixture
+def matcher():
+    return KeywordMatcher(["Coinbase", "bitcoin", "BTC", "crypto.com", "newsletter"])
+
+
+def test_keywords_are_normalized(matcher):
+    assert "coinbase" in matcher.keywords
+    assert "Coinbase" not in matcher.keywords
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("You bought 0.5 BTC on Coinbase", True),
+        ("coinbases are not a word we know", False),
+        ("Visit CRYPTO.COM today", True),
+        ("_bitcoin_ is glued to underscores", False),
+        ("bitcoin", True),
+        ("nothing relevant", False),
+    ],
+)
+def test_search_matches_whole_words_case_insensitively(matcher, text, expected):
+    assert matcher.search(text) is expected
+
+
+def test_search_lower_expects_lowered_text(matcher):
+    assert matcher.search_lower("you bought 0.5 btc") is True
+    assert matcher.search_lower("no keywords here") is False
+
+
+def test_search_lower_scans_without_case_folding(matcher):
+    assert not matcher._lower_pattern.flags & re.IGNORECASE
+    assert matcher._lower_pattern.pattern == matcher.pattern.pattern
+
+
+def test_search_without_automaton_uses_regex(matcher, monkeypatch):
+    monkeypatch.setattr(matcher, "_automaton", None)
+    for text in SAMPLES:
+        assert matcher.search(text) is (matcher.pattern.search(text) is not None)
+
+
+@pytest.mark.skipif(not keyword_matcher.AHOCORASICK_AVAILABLE, reason="pyahocorasick not installed")
+def test_automaton_agrees_with_regex(matcher):
+    assert matcher._automaton is not None
+    for text in SAMPLES:
+        assert matcher.search(text) is (matcher.pattern.search(text) is not None)
+
+
+def test_use_hyperscan_falls_back_without_package(monkeypatch):
+    monkeypatch.setattr(keyword_matcher, "HYPERSCAN_AVAILABLE", False)
+    matcher = KeywordMatcher(["bitcoin"], use_hyperscan=True)
+    assert matcher._database is None
+    assert matcher.search("Bought BITCOIN today") is True
+
+
+@pytest.mark.skipif(not keyword_matcher.HYPERSCAN_AVAILABLE, reason="hyperscan not installed")
+def test_hyperscan_agrees_with_regex():
+    matcher = KeywordMatcher(["Coinbase", "bitcoin", "BTC", "crypto.com", "newsletter"], use_hyperscan=True)
+    assert matcher._database is not None
+    for text in SAMPLES:
+        assert matcher.search(text) is (matcher.pattern.search(text) is not None)
+
+
+def test_regex_factors_shared_prefixes():
+    matcher = KeywordMatcher(["coin", "coinbase", "crypto"])
+    assert matcher.pattern.pattern == r"\b(c(?:oin(?:base)?|rypto))\b"
+    assert matcher.pattern.search("Welcome to Coinbase") is not None
+    assert matcher.pattern.search("one coin") is not None
+    assert matcher.pattern.search("coinbases") is None
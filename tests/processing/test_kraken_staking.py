@@ -68,3 +68,14 @@ def test_kraken_flexible_staking_patterns():
     assert results[0]["amount"] == "0.05"
     assert results[0]["item_name"] == "DOT"
     assert results[0]["transaction_type"] == "staking_reward"
+
+
+def test_kraken_staking_phrasings_share_one_pattern():
+    extractor = KrakenExtractor()
+    staking = [p for p in extractor.engine.template.global_patterns if p.transaction_type == "staking_reward"]
+    assert len(staking) == 1
+
+    body = "We've credited your account with 10.5 ADA.\n* 0.5 SOL\n- 2 DOTS-extra\nA staking reward of 0.05 DOT"
+    results = extractor.extract("Staking reward received", "Kraken <noreply@kraken.com>", body)
+
+    assert [(r["amount"], r["item_name"]) for r in results] == [("10.5", "ADA"), ("0.5", "SOL"), ("0.05", "DOT")]
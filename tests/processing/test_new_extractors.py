@@ -1,5 +1,10 @@
 """Unit tests for specialized regex extractors."""
 
+import importlib
+from decimal import Decimal, InvalidOperation
+
+import pytest
+
 from digital_asset_harvester.processing.extractors.bitfinex import BitfinexExtractor
 from digital_asset_harvester.processing.extractors.bitstamp import BitstampExtractor
 from digital_asset_harvester.processing.extractors.btcmarkets import BTCMarketsExtractor
@@ -66,6 +71,25 @@ def test_ftx_extractor():
     assert results[0]["vendor"] == "FTX"
 
 
+@pytest.mark.parametrize(
+    "extractor_class, body, expected",
+    [
+        (
+            CryptocomExtractor,
+            "Your order buy 2.5 SOL has been filled. Total cost: $62.50 USD.",
+            ("2.5", "SOL", "62.50"),
+        ),
+        (CryptocomExtractor, "Total cost: $62.50\nBuy 2.5 SOL at $25.00 per SOL.", ("2.5", "SOL", "62.50")),
+        (FTXExtractor, "Total: $8.50\nAmount: 10 MATIC", ("10", "MATIC", "8.50")),
+    ],
+)
+def test_combined_scan_alternatives_may_overlap(extractor_class, body, expected):
+    """One alternative's match must not hide another that starts inside it."""
+    results = extractor_class().extract("", "", body)
+
+    assert [(r["amount"], r["item_name"], r["total_spent"]) for r in results] == [expected]
+
+
 def test_newton_extractor():
     """Test Newton extractor."""
     extractor = NewtonExtractor()
@@ -190,3 +214,29 @@ def test_bitfinex_extractor_sell():
     assert float(results[0]["total_spent"]) == 5000.0
     assert results[0]["currency"] == "USD"
     assert results[0]["transaction_type"] == "withdrawal"
+
+
+def test_parse_decimal_drops_thousands_separators():
+    """Amounts are parsed exactly, without float rounding."""
+    assert BTCMarketsExtractor._parse_decimal("60,000.10") == Decimal("60000.10")
+    assert BTCMarketsExtractor._parse_decimal("0.1") * 3 == Decimal("0.3")
+    with pytest.raises(InvalidOperation):
+        BTCMarketsExtractor._parse_decimal("1.2.3")
+
+
+@pytest.mark.parametrize(
+    "module, extractor_class, attribute",
+    [
+        ("cryptocom", CryptocomExtractor, "_COMBINED_RE"),
+        ("ftx", FTXExtractor, "_COMBINED_RE"),
+        ("bitstamp", BitstampExtractor, "_TRADE_RE"),
+    ],
+)
+def test_extract_scans_body_once_without_marker_text(mocker, module, extractor_class, attribute):
+    """Bodies lacking the confirmation wording are rejected by a single scan of the extractor's pattern."""
+    extractor_module = importlib.import_module(f"digital_asset_harvester.processing.extractors.{module}")
+    pattern = mocker.patch.object(extractor_module, attribute, wraps=getattr(extractor_module, attribute))
+
+    assert extractor_class().extract("Newsletter", "noreply@example.com", "Read our latest updates") == []
+    pattern.search.assert_not_called()
+    pattern.finditer.assert_called_once()
@@ -87,6 +87,28 @@ def test_process_emails_collects_metrics(mocker):
     )
 
 
+def test_process_emails_llm_batching(mocker):
+    # GIVEN
+    from digital_asset_harvester.config import HarvesterSettings
+
+    mock_extractor = MagicMock()
+    mock_extractor.settings = HarvesterSettings(enable_llm_batching=True, batch_size=2, enable_llm_cache=False)
+    mock_extractor.process_emails.side_effect = lambda contents: [
+        {"has_purchase": False, "purchases": [], "processing_notes": []} for _ in contents
+    ]
+    emails = [{"subject": f"Email {i}", "sender": "a@example.com", "body": f"body {i}"} for i in range(3)]
+    factory = StructuredLoggerFactory(json_output=False)
+
+    # WHEN
+    purchases, metrics = process_emails(emails, mock_extractor, factory, show_progress=False, history_path=None)
+
+    # THEN
+    assert purchases == []
+    assert metrics.get("non_purchase_emails") == 3
+    assert [len(c.args[0]) for c in mock_extractor.process_emails.call_args_list] == [2, 1]
+    mock_extractor.process_email.assert_not_called()
+
+
 def test_run_mbox_calls_dependencies(mocker):
     # GIVEN
     m_mbox_extractor = mocker.patch("digital_asset_harvester.cli.MboxDataExtractor")
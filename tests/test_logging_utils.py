@@ -1,14 +1,24 @@
+import io
+import json
 import logging
+from datetime import datetime, timezone
+from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
-from digital_asset_harvester.telemetry.logging_utils import StructuredLoggerAdapter, StructuredLoggerFactory
+from digital_asset_harvester.telemetry.logging_utils import (
+    ISO_TIMESTAMP,
+    JsonFormatter,
+    StructuredLoggerAdapter,
+    StructuredLoggerFactory,
+    log_event,
+)
 
 
 def test_structured_logger_adapter_processes_with_extra():
     mock_logger = MagicMock()
     adapter = StructuredLoggerAdapter(mock_logger, {"test": "test"})
     msg, kwargs = adapter.process("test message", {"extra": {"test2": "test2"}})
-    assert kwargs["extra"] == {"extra_test": "test", "test2": "test2"}
+    assert kwargs["extra"] == {"extra_test": "test", "test2": "test2", "_structured": {"extra_test": "test"}}
 
 
 def test_structured_logger_factory_builds_adapter():
@@ -43,3 +53,61 @@ def test_structured_logger_factory_builds_json_adapter_with_formatter(mock_get_l
     factory.build("test_logger")
 
     assert mock_logger.addHandler.called
+
+
+def test_json_formatter_renders_cached_timestamp():
+    formatter = JsonFormatter()
+    record = logging.LogRecord("harvester", logging.INFO, __file__, 1, "hello", None, None)
+    record.extra_email_id = "abc"
+
+    for created, expected in (
+        (1700000000.25, "2023-11-14T22:13:20.250000Z"),
+        (1700000000.9999996, "2023-11-14T22:13:21.000000Z"),
+    ):
+        record.created = created
+        payload = json.loads(formatter.format(record))
+        assert payload["timestamp"] == expected == datetime.fromtimestamp(created, timezone.utc).strftime(ISO_TIMESTAMP)
+        assert payload["message"] == "hello"
+        assert payload["extra_email_id"] == "abc"
+
+
+def test_structured_logger_adapter_prefixes_context_once():
+    adapter = StructuredLoggerAdapter(MagicMock(), {"run": "r1"}).bind(email="e1")
+
+    assert adapter._prefixed_extra == {"extra_run": "r1", "extra_email": "e1"}
+    _, first = adapter.process("one", {})
+    _, second = adapter.process("two", {"extra": {"extra_step": 2}})
+    assert first["extra"] == {"extra_run": "r1", "extra_email": "e1", "_structured": adapter._prefixed_extra}
+    assert second["extra"]["extra_step"] == 2
+    assert second["extra"]["_structured"] == {"extra_step": 2, "extra_run": "r1", "extra_email": "e1"}
+    assert first["extra"] is not adapter._prefixed_extra
+
+
+def test_json_payloads_match_with_and_without_orjson(monkeypatch):
+    from digital_asset_harvester.telemetry import logging_utils
+
+    payload = {"message": "hi", "extra_amount": Decimal("0.10"), "extra_at": datetime(2024, 1, 2, 3, 4, 5)}
+    rendered = logging_utils._dumps(payload)
+    monkeypatch.setattr(logging_utils, "ORJSON_AVAILABLE", False)
+
+    assert rendered == logging_utils._dumps(payload)
+    assert rendered == '{"message":"hi","extra_amount":"0.10","extra_at":"2024-01-02 03:04:05"}'
+
+
+def test_json_formatter_reads_fields_gathered_by_adapter():
+    logger = logging.getLogger("test_structured_fields")
+    logger.propagate = False
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JsonFormatter())
+    logger.addHandler(handler)
+    try:
+        log_event(StructuredLoggerAdapter(logger, {"run": "r1"}), "email_processed", count=2)
+        logger.info("plain", extra={"extra_source": "direct"})
+    finally:
+        logger.removeHandler(handler)
+
+    first, second = (json.loads(line) for line in stream.getvalue().splitlines())
+    assert first["extra_run"] == "r1" and first["extra_count"] == 2
+    assert second["extra_source"] == "direct"
+    assert "_structured" not in first
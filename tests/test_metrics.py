@@ -13,3 +13,62 @@ def test_metrics_tracker_counts():
     assert tracker.get("purchases_detected") == 1
     snapshot = tracker.snapshot()
     assert snapshot == {"emails_processed": 3, "purchases_detected": 1}
+
+
+def test_metrics_tracker_latency_running_stats():
+    tracker = MetricsTracker()
+    for duration in (1.0, 2.0, 3.0):
+        tracker.record_latency("llm_extraction", duration)
+
+    other = MetricsTracker()
+    other.record_latency("llm_extraction", 6.0)
+    other.record_latency("llm_classification", 0.5)
+    tracker.merge(other)
+
+    assert tracker.latencies["llm_extraction"] == (4, 3.0, 14.0)
+    assert tracker.get_average_latency("llm_extraction") == 3.0
+    assert tracker.get_latency_variance("llm_extraction") == 3.5
+    assert tracker.get_average_latency("missing") == 0.0
+    snapshot = tracker.snapshot()
+    assert snapshot["llm_extraction_count"] == 4
+    assert snapshot["llm_classification_avg_latency"] == 0.5
+
+
+def test_metrics_tracker_latency_variance_is_stable_for_large_offsets():
+    tracker = MetricsTracker()
+    other = MetricsTracker()
+    for duration in (1e9 + 1.0, 1e9 + 2.0):
+        tracker.record_latency("llm_extraction", duration)
+    for duration in (1e9 + 3.0, 1e9 + 4.0):
+        other.record_latency("llm_extraction", duration)
+    tracker.merge(other)
+
+    assert tracker.get_average_latency("llm_extraction") == 1e9 + 2.5
+    assert tracker.get_latency_variance("llm_extraction") == 1.25
+
+
+def test_metrics_tracker_counters_default_to_zero():
+    tracker = MetricsTracker(counters={"emails_processed": 2})
+    tracker.increment("emails_processed")
+    tracker.increment("llm_calls", 3)
+
+    assert tracker.get("emails_processed") == 3
+    assert tracker.get("missing") == 0
+    assert "missing" not in tracker.counters
+    assert tracker.snapshot() == {"emails_processed": 3, "llm_calls": 3}
+
+
+def test_metrics_tracker_snapshot_rebuilt_only_after_changes(mocker):
+    tracker = MetricsTracker()
+    tracker.increment("emails_processed")
+    tracker.record_latency("llm_extraction", 2.0)
+    average = mocker.spy(tracker, "get_average_latency")
+
+    first = tracker.snapshot()
+    first["emails_processed"] = 99
+    assert tracker.snapshot() == {"emails_processed": 1, "llm_extraction_avg_latency": 2.0, "llm_extraction_count": 1}
+    assert average.call_count == 1
+
+    tracker.set_metadata("mode", "batch")
+    assert tracker.snapshot()["mode"] == "batch"
+    assert average.call_count == 2
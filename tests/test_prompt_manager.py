@@ -1,3 +1,5 @@
+from string import Template
+
 import pytest
 
 from digital_asset_harvester.prompts.manager import PromptManager
@@ -7,3 +9,20 @@ def test_prompt_manager_raises_key_error():
     manager = PromptManager()
     with pytest.raises(KeyError):
         manager.get("nonexistent")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Email: ${email_content} Timezone: ${default_timezone}",
+        "$email_content costs $$5 in ${missing} and $ alone",
+        "${email_content}${email_content}",
+        "",
+    ],
+)
+def test_prompt_template_render_matches_safe_substitute(text):
+    manager = PromptManager()
+    manager.register("prompt", text)
+    context = {"email_content": "Total ${default_timezone}", "default_timezone": "UTC"}
+
+    assert manager.render("prompt", **context) == Template(text).safe_substitute(**context)
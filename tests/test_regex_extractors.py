@@ -1,5 +1,7 @@
 """Tests for specialized regex extractors."""
 
+import re
+
 import pytest
 
 from digital_asset_harvester.processing.extractors.binance import BinanceExtractor
@@ -169,3 +171,234 @@ def test_newton_multi_extractor():
     assert results[0]["amount"] == "10.5"
     assert results[0]["item_name"] == "ADA"
     assert results[0]["transaction_type"] == "staking_reward"
+
+
+def test_binance_engine_precompiles_patterns():
+    extractor = BinanceExtractor()
+    engine = extractor.engine
+
+    patterns = list(engine.template.global_patterns)
+    if engine.template.sections:
+        patterns.extend(engine.template.sections.transaction_patterns)
+    assert set(engine.pattern_regexes) == {p.regex for p in patterns}
+
+
+def test_find_match_accepts_compiled_pattern():
+    extractor = KrakenExtractor()
+    pattern = re.compile(r"Order\s*ID\s*:?\s*(\d+)", re.IGNORECASE)
+
+    assert extractor._find_match(pattern, "order id: 42") == "42"
+    assert [m.group(1) for m in extractor._find_all_matches(pattern, "Order ID 1, Order ID 2")] == ["1", "2"]
+
+
+def test_find_match_reuses_lookup_for_same_body(mocker):
+    extractor = BinanceExtractor()
+    pattern = re.compile(r"Order\s*ID:?\s*(\d+)", re.IGNORECASE)
+    search = mocker.spy(extractor, "_search_group")
+    body = "Bought 1 BTC, bought 2 ETH. Order ID: 42"
+
+    assert extractor._find_match(pattern, body) == "42"
+    assert extractor._find_match(pattern, body) == "42"
+    assert search.call_count == 1
+
+    assert extractor._find_match(pattern, "Order ID: 7") == "7"
+    assert extractor._find_match(pattern, body, group=0) == "Order ID: 42"
+    assert search.call_count == 3
+
+
+def test_find_match_lowered_keeps_original_case():
+    extractor = KrakenExtractor()
+    pattern = re.compile(r"reference:\s*([a-z0-9\-]+)")
+
+    assert extractor._find_match(pattern, "REFERENCE: AbC-123", lowered=True) == "AbC-123"
+    # "İ" lower-cases to two characters, so offsets shift and the case-insensitive fallback is used
+    assert extractor._find_match(pattern, "İstanbul Reference: XyZ-9", lowered=True) == "XyZ-9"
+    assert extractor._find_match(pattern, "no reference here", lowered=True) is None
+
+
+def test_find_match_memo_distinguishes_lowered_lookups():
+    extractor = KrakenExtractor()
+    pattern = re.compile(r"ref:\s*(\w+)")
+    body = "REF: Upper ref: lower"
+
+    assert extractor._find_match(pattern, body, lowered=True) == "Upper"
+    assert extractor._find_match(pattern, body) == "lower"
+    assert extractor._find_match(pattern, body, lowered=True) == "Upper"
+
+
+def test_find_match_accepts_regex_module_patterns():
+    import regex
+
+    extractor = KrakenExtractor()
+    pattern = regex.compile(r"order\s*id\s*:?\s*([a-z0-9]+)")
+
+    assert extractor._find_match(pattern, "Order ID: AbC1", lowered=True) == "AbC1"
+    assert extractor._find_match(pattern, "İ Order ID: XyZ2", lowered=True) == "XyZ2"
+    assert [m.group(1) for m in extractor._find_all_matches(pattern, "order id 1, order id 2")] == ["1", "2"]
+
+
+def test_template_first_match_skips_later_matches():
+    engine = BinanceExtractor().engine
+    pattern = engine.template.sections.transaction_patterns[0]
+    text = "Amount: 0.1 BTC\nAmount: 0.2 ETH"
+
+    assert engine._first_match(pattern, text) == engine._apply_pattern(pattern, text)[0]
+    assert engine._first_match(pattern, "no amounts here") is None
+
+
+def test_registry_dispatches_by_sender_domain():
+    from digital_asset_harvester.processing.extractors import ExtractorRegistry
+
+    registry = ExtractorRegistry()
+
+    candidates = registry._candidates("CoinSpot <support@coinspot.com.au>")
+    assert [type(e).__name__ for e in candidates] == ["CoinSpotExtractor"]
+    assert registry._candidates("Friend <friend@example.com>") == []
+
+
+def test_registry_candidates_batch_matches_per_sender_dispatch():
+    from digital_asset_harvester.processing.extractors import ExtractorRegistry
+
+    registry = ExtractorRegistry()
+    senders = [
+        "CoinSpot <support@coinspot.com.au>",
+        "Friend <friend@example.com>",
+        "",
+        "NEWTON <SUPPORT@NEWTON.CO>",
+        "Kraken <noreply@kraken.com>",
+    ]
+
+    assert registry._candidates_batch(senders) == [registry._candidates(sender) for sender in senders]
+    assert registry._candidates_batch([]) == []
+
+
+def test_extractors_reject_senders_outside_their_domains():
+    from digital_asset_harvester.processing.extractors import ExtractorRegistry
+
+    for extractor in ExtractorRegistry().extractors:
+        assert extractor.sender_domains
+        assert extractor.can_handle("Trade Confirmation", "Friend <friend@example.com>", "") is False
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_registry_extract_batch_preserves_order(workers):
+    from digital_asset_harvester.processing.extractors import ExtractorRegistry
+
+    rows = [
+        ("Trade Confirmation", "Newton <support@newton.co>", "You bought 0.5 BTC for $30,000.00 CAD"),
+        ("Hello", "Friend <friend@example.com>", "Nothing to see here"),
+    ]
+    registry = ExtractorRegistry()
+
+    results = registry.extract_batch(rows, workers=workers, chunksize=1)
+
+    assert results == [registry.extract(*row) for row in rows]
+    assert results[0] and results[1] is None
+
+
+def test_template_subject_literals_use_substring_checks():
+    engine = KrakenExtractor().engine
+
+    assert "trade confirmation" in engine.subject_keywords
+    assert [r.pattern for r in engine.subject_regexes] == ["staking rewards? are here"]
+    assert engine.can_handle("Your Kraken TRADE CONFIRMATION", "noreply@kraken.com") is True
+    assert engine.can_handle("Staking Reward are here", "noreply@kraken.com") is True
+    assert engine.can_handle("Weekly digest", "noreply@kraken.com") is False
+
+
+def test_template_can_handle_skips_subject_for_other_senders(mocker):
+    engine = KrakenExtractor().engine
+    subject_regex = mocker.Mock()
+    mocker.patch.object(engine, "subject_regexes", [subject_regex])
+
+    assert engine.can_handle("Staking rewards are here", "friend@example.com") is False
+    subject_regex.search.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "module, sentence, expected",
+    [
+        (
+            "coinspot",
+            "You have successfully purchased 50 ADA for $25.00 AUD.",
+            ("50", "ADA", "for", "$", "25.00", "AUD"),
+        ),
+        ("gemini", "Your order to purchase 0.005 BTC for $150.00", ("0.005", "BTC", "for", "$", "150.00", None)),
+        (
+            "btcmarkets",
+            "Your buy order for 0.05 BTC has been filled at $60,000.00 AUD",
+            ("0.05", "BTC", "has been filled at", "$", "60,000.00", "AUD"),
+        ),
+        ("newton", "You bought 0.1 BTC for 5,000.00 CAD", ("0.1", "BTC", "for", None, "5,000.00", "CAD")),
+    ],
+)
+def test_buy_sentence_patterns(module, sentence, expected):
+    import importlib
+
+    pattern = importlib.import_module(f"digital_asset_harvester.processing.extractors.{module}")._PURCHASE_RE
+    match = pattern.search(sentence)
+    assert match.group("amt", "sym", "via", "csym", "tot", "ccode") == expected
+
+
+def test_buy_sentence_pattern_rejects_long_near_misses_quickly():
+    from digital_asset_harvester.processing.extractors._patterns import buy_sentence_re
+
+    body = ("bought " + "1," * 20000 + " BTC fo ") * 5
+    assert buy_sentence_re("bought").search(body) is None
+
+
+@pytest.mark.parametrize(
+    "extractor_name",
+    ["CoinSpotExtractor", "GeminiExtractor", "IndependentReserveExtractor", "NewtonExtractor", "SwyftxExtractor"],
+)
+def test_filled_at_price_is_not_read_as_total(extractor_name):
+    """Only BTCMarkets reads "has been filled at" and multiplies the unit price out."""
+    from digital_asset_harvester.processing import extractors
+
+    body = "Your buy order for 0.05 BTC has been filled at $60,000.00 AUD"
+    assert getattr(extractors, extractor_name)().extract("Trade Confirmation", "", body) == []
+
+
+def test_btcmarkets_filled_at_price_is_multiplied_out():
+    from digital_asset_harvester.processing.extractors import BTCMarketsExtractor
+
+    body = "Your buy order for 0.05 BTC has been filled at $60,000.00 AUD"
+    [purchase] = BTCMarketsExtractor().extract("Buy Order Filled", "", body)
+    assert purchase["total_spent"] == "3000.0"
+
+
+def test_base_can_handle_uses_class_config():
+    from digital_asset_harvester.processing.extractors.base import BaseExtractor
+
+    class ExampleExtractor(BaseExtractor):
+        sender_domains = ("example.com",)
+        subject_keywords = ("trade confirmation",)
+        sender_names = ("example exchange",)
+
+        def extract(self, subject, sender, body):
+            return []
+
+    extractor = ExampleExtractor()
+    assert extractor.can_handle("Your Trade Confirmation", "noreply@example.com", "") is True
+    assert extractor.can_handle("Newsletter", "noreply@example.com", "") is False
+    assert extractor.can_handle("Newsletter", "Example Exchange <noreply@example.com>", "") is True
+    assert extractor.can_handle("Trade Confirmation", "noreply@other.com", "") is False
+
+
+def test_first_matches_keeps_first_of_each_alternative():
+    from digital_asset_harvester.processing.extractors.base import BaseExtractor
+
+    pattern = re.compile(r"(?P<a>a(?P<n>\d))|(?P<b>b\d)")
+    found = BaseExtractor._first_matches(pattern, "a1 a2 b3 a4", ("a", "b"))
+
+    assert {name: match.group(0) for name, match in found.items()} == {"a": "a1", "b": "b3"}
+    assert found["a"].group("n") == "1"
+
+
+def test_shared_symbol_maps_are_read_only():
+    from digital_asset_harvester.processing.extractors._patterns import SYMBOL_MAP, SYMBOL_MAP_AUD_DEFAULT
+
+    assert SYMBOL_MAP["$"] == "USD"
+    assert SYMBOL_MAP_AUD_DEFAULT["$"] == "AUD"
+    with pytest.raises(TypeError):
+        SYMBOL_MAP["$"] = "CAD"